@@ -1,497 +1,448 @@
+import ast as py_ast
+import functools
+import operator
+import sys
 from intbase import InterpreterBase, ErrorType
 from brewparse import parse_program
 
+# opcodes for the flat bytecode that main() is compiled into (every instruction is an opcode plus one argument)
+# the bytecode is then turned into a Python function by _codegen_py so CPython runs it directly
+OP_PUSH_CONST = 0   # push the argument (an int or string literal) onto the value stack
+OP_LOAD_VAR = 1     # push the value stored in vars[argument]
+OP_STORE_VAR = 2    # pop a value and store it in vars[argument]
+OP_BINOP_INT = 4    # pop two values and push argument(op1, op2) where argument is the operator function (the compiler proved both values are ints)
+OP_PRINT = 5        # pop argument values and print them (pushes None since print returns nothing)
+OP_INPUTI = 6       # pop a prompt if argument is 1, then push the integer the user typed in
+OP_POP = 7          # discard the top of the value stack (value of a function call used as a statement)
+OP_ERROR = 8        # report the (error type, message) found while compiling
+
+# AST node with the fields the compiler reads as direct attributes (node.op1 instead of node.dict['op1'])
+# slot is filled in by the compiler on vardef/=/var nodes: the vars index the name resolved to
+class Node:
+    __slots__ = ('elem_type', 'name', 'val', 'op1', 'op2', 'args', 'expression', 'statements', 'slot')
+
+    def __init__(self, elem_type):
+        self.elem_type = elem_type
+        # fields this kind of node does not have stay None
+        for field in self.__slots__[1:]:
+            setattr(self, field, None)
+
+
+# copy a parsed Element (and everything under it) into Node objects
+# uses a work list of (element, node it is copied into) instead of recursion so deep expressions can't overflow the Python stack
+# elem_type and name strings are interned so comparing/hashing them against the literals in the handler tables is a pointer check
+def _flatten_ast(element):
+    root = Node(sys.intern(element.elem_type))
+    work = [(element, root)]
+    while work:
+        element, node = work.pop()
+        for key, value in element.dict.items():
+            # keys the interpreter never reads are dropped
+            if key not in Node.__slots__:
+                continue
+            if type(value) is list:
+                children = [Node(sys.intern(item.elem_type)) for item in value]
+                work.extend(zip(value, children))
+                value = children
+            elif hasattr(value, 'elem_type'):
+                child = Node(sys.intern(value.elem_type))
+                work.append((value, child))
+                value = child
+            elif key == 'name':
+                value = sys.intern(value)
+            setattr(node, key, value)
+    return root
+
+
+# fold arithmetic whose operands are both int literals into a single int node (ex: (5 + 3) - 2 becomes 6)
+def _fold(root):
+    # list every node with parents before their children (using a work list, not recursion)
+    order = []
+    work = [root]
+    while work:
+        node = work.pop()
+        order.append(node)
+        for child in (node.op1, node.op2, node.expression):
+            if child is not None:
+                work.append(child)
+        for children in (node.args, node.statements):
+            if children is not None:
+                work.extend(children)
+    # walking the list backwards folds the children first so folding works bottom up
+    for node in reversed(order):
+        # string operands are left alone so the type error still happens at runtime
+        if node.elem_type in Compiler._BINOPS and node.op1.elem_type == 'int' and node.op2.elem_type == 'int':
+            # the node turns into an int literal in place so its parent sees it without relinking
+            node.val = Compiler._BINOPS[node.elem_type](node.op1.val, node.op2.val)
+            node.elem_type = 'int'
+            node.op1 = None
+            node.op2 = None
+    return root
+
+
+# Compiler that lowers the AST of a function into a flat list of opcodes
+class Compiler:
+
+    def __init__(self):
+        # the bytecode is kept as two parallel flat lists (opcode i goes with argument i) so the loop reads plain ints instead of unpacking tuples
+        self.ops = []
+        self.args = []
+        # maps each variable name to a small integer slot index in vars (e.g., { "foo" → 0 })
+        self.name_to_slot = dict()
+        # the type ('int', 'string' or 'nil') of the value currently held by each slot
+        # main() has no branches so the last assignment compiled is the one that ran, which means every type is known before running
+        self.slot_types = dict()
+
+    # lower every statement inside the function into opcodes
+    def compile_func(self, func_node):
+        for statement in func_node.statements:
+            self.compile_statement(statement)
+        return self.ops, self.args
+
+    # append one instruction to the bytecode
+    def emit(self, op, arg=None):
+        self.ops.append(op)
+        self.args.append(arg)
+
+    # lower the different kind of statements (one dict lookup on elem_type picks the handler)
+    def compile_statement(self, statement_node):
+        handler = self._STMT_HANDLERS.get(statement_node.elem_type)
+        if handler is not None:
+            handler(self, statement_node)
+
+    # is_func_call as a statement (the value of the call is not used so we pop it)
+    def compile_call_statement(self, statement_node):
+        self.compile_func_call(statement_node)
+        self.emit(OP_POP)
+
+    # give the variable a slot in vars if possible (can't redefine it)
+    def compile_definition(self, statement_node):
+        if statement_node.name in self.name_to_slot:
+            self.emit(OP_ERROR, (
+                ErrorType.NAME_ERROR,
+                f"variable {statement_node.name} defined more than once",
+            ))
+        else:
+            # the next free slot belongs to this variable (its value starts as None)
+            statement_node.slot = len(self.name_to_slot)
+            self.name_to_slot[statement_node.name] = statement_node.slot
+            self.slot_types[statement_node.slot] = 'nil'
+
+    def compile_assignment(self, statement_node):
+        # get the name of the variable (ex: 'x') and resolve it to its slot with a single lookup
+        variable_name = statement_node.name
+        statement_node.slot = self.name_to_slot.get(variable_name)
+        # You must verify that the variable being assigned (e.g., x in x = 5;) has been defined in the "var" statement
+        # main() has no branches so the statements are compiled in the same order they run
+        if statement_node.slot is None:
+            self.emit(OP_ERROR, (
+                ErrorType.NAME_ERROR,
+                f"Variable {variable_name} has not been defined",
+            ))
+        else:
+            # the expression leaves its value on top of the stack
+            expression_type = self.compile_expression(statement_node.expression)
+            self.emit(OP_STORE_VAR, statement_node.slot)
+            self.slot_types[statement_node.slot] = expression_type
+
+    # determine which function is in the func node (print() found in statement nodes and inputi() found in expression nodes)
+    # returns the type of the value the call pushes
+    def compile_func_call(self, func_node):
+        # the builtin is picked with one dict lookup on the name instead of comparing against each name
+        handler = self._BUILTINS.get(func_node.name)
+        if handler is None:
+            self.emit(OP_ERROR, (
+                ErrorType.NAME_ERROR,
+                f"Function {func_node.name} has not been defined",
+            ))
+            return None
+        return handler(self, func_node)
+
+    def _compile_inputi(self, func_node):
+        # If an inputi() expression has more than one parameter passed to it, then you must generate an error of type ErrorType.NAME_ERROR
+        if len(func_node.args) > 1:
+            self.emit(OP_ERROR, (
+                ErrorType.NAME_ERROR,
+                f"No inputi() function found that takes > 1 parameter",
+            ))
+            return None
+        # the prompt (if any) is pushed before the input instruction
+        for argument in func_node.args:
+            self.compile_expression(argument)
+        self.emit(OP_INPUTI, len(func_node.args))
+        # inputi() always gives back an int
+        return 'int'
+
+    def _compile_print(self, func_node):
+        # push every argument then print them all at once
+        for argument in func_node.args:
+            self.compile_expression(argument)
+        self.emit(OP_PRINT, len(func_node.args))
+        # print() gives back None
+        return 'nil'
+
+    # lower an expression node so that its value ends up on top of the stack
+    # returns the type of that value ('int', 'string' or 'nil'), or None if lowering it already emitted an error
+    # the operand tree is walked in postorder with a work stack (not recursion) so a long chain like 1+2+...+n can't overflow the Python stack
+    def compile_expression(self, expression):
+        # (node, True) means both operands of node have already been lowered
+        work = [(expression, False)]
+        # the known type of each value the lowered code leaves on the stack
+        types = []
+        while work:
+            node, operands_done = work.pop()
+            if operands_done:
+                operand2_type = types.pop()
+                operand1_type = types.pop()
+                types.append(self._compile_binop(node, operand1_type, operand2_type))
+            elif node.elem_type in self._BINOPS:
+                # PUSH op1; PUSH op2; BINOP (op1 is popped off the work stack first)
+                work.append((node, True))
+                work.append((node.op2, False))
+                work.append((node.op1, False))
+            else:
+                handler = self._EXPR_HANDLERS.get(node.elem_type)
+                if handler is not None:
+                    types.append(handler(self, node))
+                # anything else evaluates to None
+                else:
+                    self.emit(OP_PUSH_CONST)
+                    types.append('nil')
+        return types.pop()
+
+    # case where we have an int or a string (ex: x = 5, x = "foo")
+    def _compile_const(self, expression):
+        self.emit(OP_PUSH_CONST, expression.val)
+        return expression.elem_type
+
+    # case where we have a variable (x = y)
+    def _compile_var(self, expression):
+        expression.slot = self.name_to_slot.get(expression.name)
+        # If an expression refers to a variable that has not yet been defined, then you must generate an error of type ErrorType.NAME_ERROR
+        if expression.slot is None:
+            self.emit(OP_ERROR, (
+                ErrorType.NAME_ERROR,
+                f"Variable {expression.name} has not been defined",
+            ))
+        else:
+            self.emit(OP_LOAD_VAR, expression.slot)
+            return self.slot_types[expression.slot]
+
+    # case where we add or subtract (the operands are already on the stack)
+    def _compile_binop(self, expression, operand1_type, operand2_type):
+        # both operands are known to be ints so no type check is needed when it runs
+        if operand1_type == 'int' and operand2_type == 'int':
+            self.emit(OP_BINOP_INT, self._BINOPS[expression.elem_type])
+        # otherwise the type error is already known here (the operands still get evaluated first, like before)
+        else:
+            self.emit(OP_ERROR, (
+                ErrorType.TYPE_ERROR,
+                "Incompatible types for arithmetic operation",
+            ))
+        return 'int'
+
+    # arithmetic elem_type -> the Python operator that implements it
+    _BINOPS = {
+        '+': operator.add,
+        '-': operator.sub,
+    }
+
+    # builtin function name -> handler used by compile_func_call
+    _BUILTINS = {
+        'print': _compile_print,
+        'inputi': _compile_inputi,
+    }
+
+    # elem_type -> handler tables used by compile_statement / compile_expression
+    _STMT_HANDLERS = {
+        'vardef': compile_definition,
+        '=': compile_assignment,
+        'fcall': compile_call_statement,
+    }
+    _EXPR_HANDLERS = {
+        'int': _compile_const,
+        'string': _compile_const,
+        # case where we have an inputi() in an expression (only the case for proj 1)
+        'fcall': compile_func_call,
+        'var': _compile_var,
+    }
+
+
+# the Python ast operator for each of the operator functions in Compiler._BINOPS
+_PY_BINOPS = {
+    operator.add: py_ast.Add,
+    operator.sub: py_ast.Sub,
+}
+
+# a value expression nested deeper than this is stored in a temporary first (CPython's compiler recurses on nested expressions)
+_MAX_EXPR_DEPTH = 100
+
+
+# turn the bytecode of main() into the Python function
+#   def main(_print, _inputi, _get_input, _error): v0 = None; ...
+# where every variable slot is a local (v0, v1, ...) and every pushed value becomes part of a Python expression
+# (the value stack only exists while generating the code, never at runtime)
+def _codegen_py(ops, args, num_slots):
+    body = [
+        py_ast.Assign(targets=[py_ast.Name(id=f"v{slot}", ctx=py_ast.Store())], value=py_ast.Constant(None))
+        for slot in range(num_slots)
+    ]
+    # symbolic value stack: (python expression, nesting depth) for each value the bytecode would have pushed
+    stack = []
+    num_temps = 0
+
+    # give every value still on the stack a temporary local, in the order it was pushed, so they run in the same order as the bytecode
+    def spill():
+        nonlocal num_temps
+        for i, (expression, depth) in enumerate(stack):
+            if depth > 0:
+                temp = f"t{num_temps}"
+                num_temps += 1
+                body.append(py_ast.Assign(targets=[py_ast.Name(id=temp, ctx=py_ast.Store())], value=expression))
+                stack[i] = (py_ast.Name(id=temp, ctx=py_ast.Load()), 0)
+
+    def call(name, call_args):
+        return py_ast.Call(func=py_ast.Name(id=name, ctx=py_ast.Load()), args=call_args, keywords=[])
+
+    for op, arg in zip(ops, args):
+        if op == OP_PUSH_CONST:
+            stack.append((py_ast.Constant(arg), 0))
+        elif op == OP_LOAD_VAR:
+            stack.append((py_ast.Name(id=f"v{arg}", ctx=py_ast.Load()), 0))
+        elif op == OP_STORE_VAR:
+            expression, _ = stack.pop()
+            body.append(py_ast.Assign(targets=[py_ast.Name(id=f"v{arg}", ctx=py_ast.Store())], value=expression))
+        elif op == OP_BINOP_INT:
+            operand2, depth2 = stack.pop()
+            operand1, depth1 = stack.pop()
+            # both operands are ints so this is just a + b / a - b
+            expression = py_ast.BinOp(left=operand1, op=_PY_BINOPS[arg](), right=operand2)
+            stack.append((expression, max(depth1, depth2) + 1))
+            if stack[-1][1] > _MAX_EXPR_DEPTH:
+                spill()
+        elif op == OP_PRINT:
+            # the last arg values on the stack are the print arguments (in order)
+            print_args = [expression for expression, _ in stack[len(stack) - arg:]]
+            del stack[len(stack) - arg:]
+            stack.append((call("_print", [py_ast.Tuple(elts=print_args, ctx=py_ast.Load())]), 1))
+        elif op == OP_INPUTI:
+            if arg == 1:
+                stack.append((call("_inputi", [stack.pop()[0], py_ast.Constant(True)]), 1))
+            # without a prompt there is nothing to print first, so the code reads the line through get_input() itself
+            else:
+                stack.append((call("int", [call("_get_input", [])]), 1))
+        elif op == OP_POP:
+            body.append(py_ast.Expr(value=stack.pop()[0]))
+        elif op == OP_ERROR:
+            # values pushed before the error (ex: an inputi() call) still have to run first
+            for expression, _ in stack:
+                body.append(py_ast.Expr(value=expression))
+            error_type, message = arg
+            body.append(py_ast.Expr(value=call("_error", [
+                py_ast.Attribute(value=py_ast.Name(id="ErrorType", ctx=py_ast.Load()), attr=error_type.name, ctx=py_ast.Load()),
+                py_ast.Constant(message),
+            ])))
+            # error() raises so nothing after it can run
+            break
+
+    main_def = py_ast.FunctionDef(
+        name="main",
+        args=py_ast.arguments(
+            posonlyargs=[],
+            args=[py_ast.arg(arg=name) for name in ("_print", "_inputi", "_get_input", "_error")],
+            kwonlyargs=[],
+            kw_defaults=[],
+            defaults=[],
+        ),
+        body=body or [py_ast.Pass()],
+        decorator_list=[],
+    )
+    module = py_ast.fix_missing_locations(py_ast.Module(body=[main_def], type_ignores=[]))
+    # names the generated code reads as globals
+    namespace = {"ErrorType": ErrorType}
+    exec(compile(module, "<brewin>", "exec"), namespace)
+    return namespace["main"]
+
+
+# build a dict of the functions in the AST keyed by name (e.g., { "main" → func node })
+def get_func_table(ast):
+    func_table = dict()
+    for function in ast.dict['functions']:
+        # if a name shows up twice the first definition wins (same one a linear scan would find)
+        func_table.setdefault(function.dict['name'], function)
+    return func_table
+
+
+def get_main_func_node(ast):
+    # find "main" with a single lookup (None when there is no main)
+    return get_func_table(ast).get('main')
+
+
+# parse a program and compile its main() function, remembering the result per program source
+# (test harnesses run the same program over and over so the AST is only traversed once)
+@functools.lru_cache(maxsize=32)
+def _parse_and_compile(program):
+    # parse program into AST
+    ast = parse_program(program)
+    # The interpreter processes the Abstract Syntax Tree and locates the node that holds details about the main() function.
+    main_func_node = get_main_func_node(ast)
+    if main_func_node is None:
+        return None, None
+    # the compiler reads the fields of main's nodes as plain attributes
+    main_func_node = _flatten_ast(main_func_node)
+    # literal arithmetic is computed once here instead of every time the program runs
+    main_func_node = _fold(main_func_node)
+    # compile main once into a flat list of opcodes and then into a Python function
+    compiler = Compiler()
+    ops, args = compiler.compile_func(main_func_node)
+    return main_func_node, _codegen_py(ops, args, len(compiler.name_to_slot))
+
+
 # Interpreter class derived from interpreter base class
 class Interpreter(InterpreterBase):
-    
+
     def __init__(self, console_output=True, inp=None, trace_output=False):
         # call InterpreterBase's constructor
         super().__init__(console_output, inp)
-        # dict to track things like variables, e.g., a map that maps variable names to their current value (e.g., { "foo" → 11 })
-        self.variable_tracker = dict()
-        
+        # bind the InterpreterBase methods once (super().x builds a new bound method on every call)
+        self._error = self.error
+        self._output = self.output
+        self._get_input = self.get_input
+        # Python function generated from the main() function (see _codegen_py)
+        self.main_func = None
+
     # The Interpreter is passed in a program as a list of strings that needs to be interpreted
     def run(self, program):
-        # parse program into AST
-        ast = parse_program(program)
-        # The interpreter processes the Abstract Syntax Tree and locates the node that holds details about the main() function.
-        main_func_node = self.get_main_func_node(ast)
+        # parsing and compiling only happen the first time we see this program source
+        main_func_node, self.main_func = _parse_and_compile(program)
         # no main found
         if (main_func_node == None):
-            super().error(
+            self._error(
                 ErrorType.NAME_ERROR,
                 "No main() function was found",
             )
-        # call run func
-        self.run_func(main_func_node)
-        
-        # print statement to keep track of dictionary
-        #print("Dictionary", self.variable_tracker)
-    
-    def get_main_func_node(self, ast):
-        # loop through functions in AST and find "main" 
-        for function in ast.dict['functions']:
-            # main found
-            if function.dict['name'] == 'main':
-                return function
-        # no main found
-        return None
-        
-    # Execute each statement inside the main function      
-    def run_func(self, func_node):
-        for statement in func_node.dict['statements']:
-            self.run_statement(statement)
-    
-    # process different kind of statements     
-    def run_statement(self, statement_node):
-        # is_definition
-        if statement_node.elem_type == 'vardef':
-            self.do_definition(statement_node)
-        # is_assignment
-        elif statement_node.elem_type == '=':
-            self.do_assignment(statement_node)
-        # is_func_call (note only print can be found in the statement node not print)
-        elif statement_node.elem_type == 'fcall':
-            self.do_func_call(statement_node)
-            
-    # Add variable name to variable_tracker if possible (can't redefine it)
-    def do_definition(self, statement_node):
-        if statement_node.dict['name'] in self.variable_tracker:
-            super().error(
-                ErrorType.NAME_ERROR,
-                f"variable {statement_node.dict['name']} defined more than once",
-            )
-        else:
-            # add the variable name as a key to the dictionary of variables (None as default Value)
-            self.variable_tracker[statement_node.dict['name']] = None
-            
-    def do_assignment(self, statement_node):
-        # get the name of the variable (ex: 'x')
-        variable_name = statement_node.dict['name']
-        # You must verify that the variable being assigned (e.g., x in x = 5;) has been defined in the "var" statement
-        if variable_name not in self.variable_tracker: 
-            super().error(
-                ErrorType.NAME_ERROR,
-                f"Variable {variable_name} has not been defined",
-            )
-        else:
-            # get expression node
-            expression = statement_node.dict['expression']
-            # call do_evaulate_expression which handles the expression (ex: x = 5 + 6, )
-            resulting_value = self.do_evaluate_expression(expression)
-            # assign the resulting_value to the corresponding variable in dict
-            self.variable_tracker[variable_name] = resulting_value
-            
-    # determine which function is in the func node (print() found in statement nodes and inouti() found in expression nodes)
-    def do_func_call(self, func_node):
-        # only found in expression nodes
-        # evaluate_input_call will help us get the user input
-        if func_node.dict['name'] == 'inputi':    
-            user_input = self.do_evaluate_input_call(func_node)
-            return user_input
-        elif func_node.dict['name'] == 'print':
-            self.do_evaluate_print_call(func_node)
-        else:
-            super().error(
-                ErrorType.NAME_ERROR,
-                f"Function {func_node.dict['name']} has not been defined",
-            )
-            
+        # the generated code calls back into the interpreter for print(), inputi() (and get_input() for an inputi() without a prompt) and errors
+        self.main_func(self.do_evaluate_print_call, self.do_evaluate_input_call, self._get_input, self._error)
+
     # evaluate the print call (actually output what print wants to print)
-    def do_evaluate_print_call(self, print_node):
-        string_to_output = ""
-        # loop through arguments of print statement
-        for argument in print_node.dict['args']:
-            string_to_output += str(self.do_evaluate_expression(argument))
+    def do_evaluate_print_call(self, arguments):
+        # most prints have a single argument so there is nothing to join
+        if len(arguments) == 1:
+            self._output(str(arguments[0]))
+            return
+        # join the (already evaluated) arguments of print statement in one pass instead of growing a string with +=
+        string_to_output = ''.join(map(str, arguments))
         # output using the output() method in our InterpreterBase base class (output() method automatically appends a newline character after each line it prints, so you do not need to output a newline yourself.)
-        super().output(string_to_output)
-        
-    # get the user input 
-    def do_evaluate_input_call(self, input_node):
-        # If an inputi() expression has more than one parameter passed to it, then you must generate an error of type ErrorType.NAME_ERROR by calling InterpreterBase.error()
-        if len(input_node.dict['args']) > 1:
-            super().error(
-                ErrorType.NAME_ERROR,
-                f"No inputi() function found that takes > 1 parameter",
-                )
-            
+        self._output(string_to_output)
+
+    # get the user input
+    def do_evaluate_input_call(self, input_prompt, has_prompt):
         # If an inputi() function call has a prompt parameter, you must first output it to the screen using our InterpreterBase output() method before obtaining input from the user
         # assume that the inputi() function is invoked with a single argument, the argument will always have the type of string
-        if len(input_node.dict['args']) == 1:
-            input_prompt = self.do_evaluate_expression(input_node.dict['args'][0])
-            super().output(input_prompt)
-            
+        if has_prompt:
+            self._output(input_prompt)
+
         # the inputi() function has no prompt
         # get input from the user and get_input() method returns a string regardless of what the user types in, so you'll need to convert the result to an integer yourself.
-        user_input = int(super().get_input())
+        user_input = int(self._get_input())
         return user_input
-        
-    
-    # handle expression node
-    def do_evaluate_expression(self, expression):
-        # case where we assign a variable to an int (ex: x = 5)
-        if expression.elem_type == 'int':
-            return expression.dict['val']
-        # case where we assign a variable to a string (ex: x = "foo")
-        elif expression.elem_type == 'string':
-            return expression.dict['val']
-        # case where we have an inputi() in an expression (only the case for proj 1)
-        elif expression.elem_type == 'fcall':
-            # do func call will determine that it should be an inputi()
-            return self.do_func_call(expression)
-        
-        # case where we have a variable (x = y)
-        elif expression.elem_type == 'var':
-            # If an expression refers to a variable that has not yet been defined, then you must generate an error of type ErrorType.NAME_ERROR by calling InterpreterBase.error(),
-            if expression.dict['name'] not in self.variable_tracker:
-                super().error(
-                    ErrorType.NAME_ERROR,
-                    f"Variable {expression.dict['name']} has not been defined",
-                )
-            # using the var_name (key), find the var in the dictionary
-            # get will return the value of the key
-            else:
-                return self.variable_tracker.get(expression.dict['name'])
-
-        # case where we add 
-        elif expression.elem_type == '+':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-            # if both the operands are of type int
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int):
-                return operand1_value + operand2_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-        
-        # case where we subtract
-        elif expression.elem_type == '-':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-            # if both the operands are of type int
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int):
-                return operand1_value - operand2_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-            
-                    
-#Main for testing purposes      
-def main():
-    program_source = """func main(){
-                        var x;
-                        x = 5 + 6;
-                        print("The sum is: ", x);
-                    }"""
-                    
-    test_input_no_arg_program = """func main() {
-                                    var b; 
-                                    b = inputi();
-                                    print(b);
-                                }"""
-    
-    test_input_arg_program = """func main() {
-                                    var b; 
-                                    b = inputi("Enter a number: ");
-                                    print(b);
-                                }"""
-                            
-    test_spec_example = """func main() {
-                            /* this is a comment */
-                            var first;
-                            var second;
-                            first = inputi("Enter a first #: ");
-                            second = inputi("Enter a second #: ");
-                            var sum;
-                            sum = (first + second);
-                            print("The sum is ", sum, "!");
-                        }"""
-                        
-    test_var = """ func main(){
-                        var first;
-                        var second;
-                        first = 5; 
-                        second = first + 1 - 3;
-                        var third;
-                        third = (x + (5 - 3)) - y;
-                        print("The sum is ", third, "!");
-                }"""
-                
-    random_test = """
-                func main(){
-                    var y;
-                    y = 2;
-                    var x;
-                    x = 3;
-                    print(y," is 1 plus ", x);
-                }
-                """
-                
-    test_spec1 = """
-                func main() {
-                    var a;
-                    a = 5 + 10;
-                    print(a);
-                    print("that's all!");
-                }"""
-                
-    test_spec2 = """
-                func main() {
-                    var foo;
-                    foo = inputi("Enter a value: ");
-                    print(foo);
-                }
-                """
-                
-    test_spec3 = """func main() {
-                    var bar;
-                    bar = 5;
-                    print("The answer is: ", (10 + bar) - 6, "!");
-                }"""
-                
-    test = """func main(){
-                var x;
-                x = "";
-                print(x);
-            }"""
-            
-    test1 = """
-            func main() {
-            print("Hello, world!");
-            }
-            """
-            
-    test2 = """ func main() {
-            var x;
-            var y;
-            x = 7;
-            y = 3;
-            print("Sum: ", x + y);
-            print("Difference: ", x - y);          
-            }"""
-            
-    test3 = """
-            func main() {
-                print(x); 
-            }
-            """
-                         
-    test4 = """ func main() {
-                    var result;
-                    result = (5 + 3) - (2 + 1);
-                    print("Result: ", result);
-                }"""  
-    
-    test5 = """
-                func main() {
-                var age;
-                age = inputi("Enter your age: ");
-                print("Your age is: ", age);
-            }
-            """
-            
-    test6 = """
-                func main() {
-                    var x;
-                    var x;
-                }
-            """
-    
-    test7 = """
-            func main() {
-            var x;
-            x = "hello" + 5;
-        }
-            """
-    
-    test8 = """
-                func main() {
-                unknown_function();  
-            }
-            """
-    
-    test9 = """
-            func main() {
-            var x;
-            print(x);  
-        }"""
-        
-    # guranteed to have a at least one statement
-    test10 = """
-            func main() {
-                
-            }
-            """
-            
-    test11 = """
-            func main() {
-            var x;
-            x = ((5 + (6 - 3)) - ((2 - 3) - (1 - 7)));
-            print("Result: ", x);
-            }
-    """
-    
-    test12 = """
-            func main() {
-                var first;
-                var second;
-                first = inputi("Enter first number: ");
-                second = inputi("Enter second number: ");
-                print("Sum: ", first + second);
-                }
-            """
-            
-    test13 = """
-            func main() {
-                var x;
-                x = y + 5; 
-            }
-            """
-            
-    test14 = """
-            func main() {
-                var x;
-                x = inputi("Enter a large number: ");
-                print("You entered: ", x);
-            }
-            """
-            
-    test15 = """
-            func main() {
-                print("Line 1");
-                print("Line 2");
-                print("Line 3");
-                print("Line 4");
-                print("Line 5");
-            }
-            """
-            
-    ######################### Project 2 Tests ##################################
-    
-    # should print 120
-    test1_p2 = """ 
-                func main() { 
-                    print(fact(5));
-                }
-                func fact(n) {
-                    if (n <= 1) { return 1; } return n * fact(n-1);
-                }
-                """
-                
-    # should print 3
-    #              2
-    #              1
-    test2_p2 = """
-                func main() {
-                    var i;
-                    for (i = 3; i > 0; i = i - 1) {
-                    print(i); 
-                    }
-                }
-                """
-                
-    test_func_call_with_args = """
-                        func bletch(a,b,c) {
-                            print("The answer is: ", a+b*c);
-                        }
-
-                        func main() {
-                            bletch(1,2,3);
-                        }
-                        """
-                        
-    test_return = """
-                func foo(x) {
-                    if (x < 0) {
-                        print(x);
-                        return -x;
-                        print("this will not print");
-                    }
-                print("this will not print either");
-                return 5*x;
-                }
-                func main() {
-                    print("the positive value is ", foo(-1));
-                }
-                """
-                
-    test_for = """
-            func main() {
-                var i;
-                for (i=0; i < 5; i=i+1) {
-                    print(i);
-                }
-            }     
-            """
-                
-            
-    test_static_scoping_1 = """
-        func main() {
-            var a;
-            a = 5;
-            if (true) {
-                print(a);
-                var a;
-                a = "foo";
-                print(a);
-            }
-            print(a);
-        }
-    """
-    
-    test_static_scoping_simple = """
-        func main() {
-            var a;
-            a = 5;
-            if (true) {
-                print(a);
-            }
-        }
-    """
-    
-    test_return = """
-                func foo(x) {
-                    if (x < 0) {
-                        print(x);
-                        return -x;
-                        print("this will not print");
-                    }
-                print("this will not print either");
-                return 5*x;
-                }
-                func main() {
-                    print("the positive value is ", foo(-1));
-                }
-                """
-               
-               
-    interpreter = Interpreter()
-    interpreter.run(test_p2)
-            
-if __name__ == "__main__":
-    main()
-        
-        
-        
-# def main():
-#     interpreter = Interpreter()
-    
-#     with open('./test.br', 'r') as f:
-#         program = f.read()
-        
-#     interpreter.run(program)
-    
-# if __name__ == '__main__':
-#     main()
\ No newline at end of file
@@ -1,16 +1,275 @@
+import operator
+import sys
 from intbase import InterpreterBase, ErrorType
 from brewparse import parse_program
 
+# raised by a return statement and caught by the function call it returns from (so statements don't have to pass a result back up)
+class ReturnSignal(Exception):
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+
+# a pure function that has run this many times is turned into a python function (see FunctionWriter)
+_HOT_CALL_COUNT = 100
+
+# a value expression nested deeper than this is stored in a temporary first (CPython's compiler recurses on nested expressions)
+_MAX_EXPR_DEPTH = 50
+
+# python operator for each arithmetic and comparison operator (the operands are checked to be ints, or strings for +, first)
+_PY_OPERATORS = {'*': '*', '/': '//', '+': '+', '-': '-', '<': '<', '<=': '<=', '>': '>', '>=': '>='}
+
+
+# writes the source of a python function that does the same thing as an already compiled (slot resolved) Brewin function
+# every variable slot becomes a python local (s0, s1, ...) and every operator becomes inline python with its type check,
+# so CPython runs the whole body without going through the closures and handler methods
+# only pure functions are written (no print/inputi/inputs, and every function they call exists)
+class FunctionWriter:
+
+    def __init__(self):
+        # lines of the python function being written
+        self.lines = []
+        self.indent = 1
+        self.num_temps = 0
+        # names the generated code reads from its globals (the function nodes it calls)
+        self.constants = dict()
+
+    def write_function(self, func_def):
+        # parameters are p0, p1, ... and get copied into their slots (two parameters with the same name share a slot)
+        parameters = ", ".join(f"p{index}" for index in range(len(func_def.args)))
+        # every slot starts as None like the blank frame of a call
+        for slot in range(func_def.num_slots):
+            self.emit(f"s{slot} = None")
+        for index, arg_var_node in enumerate(func_def.args):
+            self.emit(f"s{arg_var_node.slot} = p{index}")
+        self.write_block(func_def.body)
+        self.emit("return None")
+        return f"def brewin_function({parameters}):\n" + "\n".join(self.lines) + "\n"
+
+    def emit(self, line):
+        self.lines.append("    " * self.indent + line)
+
+    def new_temp(self):
+        self.num_temps += 1
+        return f"t{self.num_temps - 1}"
+
+    def emit_error(self, error_type, message):
+        self.emit(f"_error(ErrorType.{error_type.name}, {message!r})")
+
+    # the body of a function, if, else or for (a list of (handler, statement) pairs)
+    def write_block(self, body):
+        if not body:
+            self.emit("pass")
+        for _, statement in body:
+            self.write_statement(statement)
+
+    def write_statement(self, statement):
+        if statement.elem_type == 'vardef':
+            if statement.slot is None:
+                self.emit_error(ErrorType.NAME_ERROR, f"variable {statement.name} defined more than once")
+            else:
+                self.emit(f"s{statement.slot} = None")
+        elif statement.elem_type == '=':
+            self.write_assignment(statement)
+        # the value of a call used as a statement is thrown away (calls are always stored in a temporary so it already ran)
+        elif statement.elem_type == 'fcall':
+            self.write_expression(statement)
+        elif statement.elem_type == 'return':
+            if statement.expression is None:
+                self.emit("return None")
+            else:
+                self.emit(f"return {self.write_expression(statement.expression)}")
+        elif statement.elem_type == 'if':
+            condition = self.write_condition(statement.condition, "condition of the if statement does not evaluate to a boolean")
+            self.emit(f"if {condition}:")
+            self.indent += 1
+            self.write_block(statement.body)
+            self.indent -= 1
+            if statement.else_body is not None:
+                self.emit("else:")
+                self.indent += 1
+                self.write_block(statement.else_body)
+                self.indent -= 1
+        elif statement.elem_type == 'for':
+            self.write_assignment(statement.init)
+            self.emit("while True:")
+            self.indent += 1
+            condition = self.write_condition(statement.condition, "condition of the for loop does not evaluate to a boolean")
+            self.emit(f"if not {condition}:")
+            self.emit("    break")
+            self.write_block(statement.body)
+            self.write_assignment(statement.update)
+            self.indent -= 1
+
+    def write_assignment(self, statement):
+        if statement.slot is None:
+            self.emit_error(ErrorType.NAME_ERROR, f"Variable {statement.name} has not been defined")
+        else:
+            self.emit(f"s{statement.slot} = {self.write_expression(statement.expression)}")
+
+    # an if/for condition has to be a boolean (comparisons and logical operators always give one, or fail themselves)
+    def write_condition(self, expression, message):
+        condition = self.store(self.write_expression(expression))
+        if expression.elem_type in ('bool', '<', '<=', '>', '>=', '==', '!=', '!', '&&', '||'):
+            return condition
+        self.emit(f"if type({condition}) is not bool:")
+        self.emit(f"    _error(ErrorType.TYPE_ERROR, {message!r})")
+        return condition
+
+    # a value that is just a name or a literal can be used more than once and read later without changing what happens
+    def is_simple(self, value):
+        return value.isidentifier() or value.lstrip('-').isdigit() or value[0] in "'\""
+
+    # put a value in a temporary (unless it's already simple) and return the temporary's name
+    def store(self, value, at=None):
+        if self.is_simple(value):
+            return value
+        temp = self.new_temp()
+        line = "    " * self.indent + f"{temp} = {value}"
+        if at is None:
+            self.lines.append(line)
+        else:
+            self.lines.insert(at, line)
+        return temp
+
+    # write the values of several expressions in order
+    # lines written for a later value (ex: a call) have to run after the earlier values, so those are stored in temporaries before them
+    def write_values(self, expressions):
+        values = []
+        for expression in expressions:
+            start = len(self.lines)
+            value = self.write_expression(expression)
+            if len(self.lines) > start:
+                values = [self.store(earlier, at=start) for earlier in values]
+            values.append(value)
+        return values
+
+    # write the lines an expression needs and return python code for its value
+    def write_expression(self, expression):
+        elem_type = expression.elem_type
+        if elem_type in ('int', 'string', 'bool'):
+            return repr(expression.dict['val'])
+        if elem_type == 'var':
+            if expression.slot is None:
+                self.emit_error(ErrorType.NAME_ERROR, f"Variable {expression.dict['name']} has not been defined")
+                return "None"
+            return f"s{expression.slot}"
+        if elem_type == 'fcall':
+            arguments = "".join(f"{value}, " for value in self.write_values(expression.args))
+            name = f"_f{len(self.constants)}"
+            self.constants[name] = expression.resolved
+            return self.store(f"_run_func({name}, ({arguments}))")
+        if elem_type in ('neg', '!'):
+            operand1 = self.store(self.write_expression(expression.dict['op1']))
+            if elem_type == 'neg':
+                self.write_type_check(f"type({operand1}) is not int")
+                return f"(-{operand1})"
+            self.write_type_check(f"type({operand1}) is not bool")
+            return f"(not {operand1})"
+        if elem_type not in _PY_OPERATORS and elem_type not in ('==', '!=', '&&', '||'):
+            # anything else evaluates to None
+            return "None"
+        operand1, operand2 = self.write_values((expression.dict['op1'], expression.dict['op2']))
+        # both operands are known to be ints so there is nothing to check
+        if elem_type in _PY_OPERATORS and expression.dict['op1'].is_int and expression.dict['op2'].is_int:
+            value = f"({operand1} {_PY_OPERATORS[elem_type]} {operand2})"
+            return self.store(value) if value.count("(") > _MAX_EXPR_DEPTH else value
+        operand1 = self.store(operand1)
+        operand2 = self.store(operand2)
+        if elem_type == '==':
+            return f"(type({operand1}) is type({operand2}) and {operand1} == {operand2})"
+        if elem_type == '!=':
+            return f"(type({operand1}) is not type({operand2}) or {operand1} != {operand2})"
+        if elem_type in ('&&', '||'):
+            self.write_type_check(f"type({operand1}) is not bool or type({operand2}) is not bool")
+            return f"({operand1} {'and' if elem_type == '&&' else 'or'} {operand2})"
+        # an operand known to be an int doesn't need checking (and makes + an int addition)
+        operand1_is_int = expression.dict['op1'].is_int
+        operand2_is_int = expression.dict['op2'].is_int
+        if elem_type == '+' and not operand1_is_int and not operand2_is_int:
+            self.write_type_check(
+                f"not (type({operand1}) is int and type({operand2}) is int or type({operand1}) is str and type({operand2}) is str)"
+            )
+        else:
+            self.write_type_check(" or ".join(
+                f"type({operand}) is not int"
+                for operand, is_int in ((operand1, operand1_is_int), (operand2, operand2_is_int))
+                if not is_int
+            ))
+        return f"({operand1} {_PY_OPERATORS[elem_type]} {operand2})"
+
+    def write_type_check(self, failed):
+        self.emit(f"if {failed}:")
+        self.emit("    _error(ErrorType.TYPE_ERROR, 'Incompatible types for arithmetic operation')")
+
+
 # Interpreter class derived from interpreter base class
 class Interpreter(InterpreterBase):
     
     def __init__(self, console_output=True, inp=None, trace_output=False):
         # call InterpreterBase's constructor
         super().__init__(console_output, inp)
-        # call stack will keep track of functions using a last in first out approach, each dict keeps track of things like variables, e.g., a dict that maps variable names to their current value (e.g., { "foo" → 11 })
-        self.call_stack = [] 
+        # values of the variables of every function call that is running (one flat list, each call owns the slots from its frame base on)
+        # every variable was given a slot index when the function was compiled (e.g., { "foo" → 0 }) so a lookup is just an index
+        self._locals_stack = []
+        # where the variables of the function that is running right now start in _locals_stack
+        self._frame_base = 0
         # store function names in a dictionary
         self.func_name_to_ast = dict()
+        # results of calls to pure functions (no print/inputi/inputs anywhere in them or in what they call), keyed by (function, typed argument values)
+        self._memo = dict()
+        # bind the InterpreterBase methods once (super().x builds a new bound method on every call)
+        self._error = self.error
+        self._output = self.output
+        self._get_input = self.get_input
+        # elem_type -> method that runs that kind of statement
+        self._stmt_dispatch = {
+            'vardef': self.do_definition,
+            '=': self.do_assignment,
+            'fcall': self.do_call_statement,
+            'if': self.do_if_statement,
+            'for': self.do_for_loop,
+            'return': self.do_return_statement,
+        }
+        # elem_type -> method that compiles that kind of expression into a closure
+        self._expr_dispatch = {
+            'int': self._compile_const,
+            'string': self._compile_const,
+            'bool': self._compile_const,
+            'nil': self._compile_nil,
+            'fcall': self._compile_fcall,
+            'var': self._compile_var,
+            '*': self._compile_arith,
+            '/': self._compile_arith,
+            '+': self._compile_arith,
+            '-': self._compile_arith,
+            '==': self._compile_eq,
+            '!=': self._compile_ne,
+            '<': self._compile_arith,
+            '<=': self._compile_arith,
+            '>': self._compile_arith,
+            '>=': self._compile_arith,
+            'neg': self._compile_neg,
+            '!': self._compile_not,
+            '&&': self._compile_and,
+            '||': self._compile_or,
+        }
+        # arithmetic and comparison operators -> (python function that does the operation, whether two strings are allowed too)
+        self._arith_ops = {
+            '*': (operator.mul, False),
+            '/': (operator.floordiv, False),
+            '+': (operator.add, True),
+            '-': (operator.sub, False),
+            '<': (operator.lt, False),
+            '<=': (operator.le, False),
+            '>': (operator.gt, False),
+            '>=': (operator.ge, False),
+        }
+        # operations that are worked out when the program is compiled if their operands are literals
+        self._foldable = set(self._arith_ops) | {'==', '!=', 'neg', '!', '&&', '||'}
+        # python type of a folded value -> elem_type of the literal node that replaces the operation
+        self._literal_types = {int: 'int', str: 'string', bool: 'bool'}
         
     # The Interpreter is passed in a program as a list of strings that needs to be interpreted
     def run(self, program):
@@ -20,7 +279,7 @@ class Interpreter(InterpreterBase):
         self.set_up_function_tracker(ast)
         # look for the main function node in AST (will throw error if no main found)
         if ("main", 0) not in self.func_name_to_ast:
-            super().error(ErrorType.NAME_ERROR, "Function main not found")
+            self._error(ErrorType.NAME_ERROR, "Function main not found")
         # get the main func node
         main_func_node = self.func_name_to_ast[("main", 0)]
         # call run func on main function node (remember main func has no args so we say None)
@@ -36,1543 +295,621 @@ class Interpreter(InterpreterBase):
             number_of_params = len(func_def.dict['args'])
             # this line adds the function name and number of args as a key to func_name_to_ast dictionary (e.g. key (function name, # of params))
             self.func_name_to_ast[(name, number_of_params)] = func_def
+        # compile every function body once, before anything runs (after all the functions are known so calls can be resolved)
+        for func_def in ast.dict['functions']:
+            self.compile_function(func_def)
+        # a function that calls an impure function is impure too (repeat until nothing changes so this works through recursion)
+        changed = True
+        while changed:
+            changed = False
+            for func_def in ast.dict['functions']:
+                if func_def.is_pure and not all(callee.is_pure for callee in func_def.callees):
+                    func_def.is_pure = False
+                    changed = True
+        # memoized results from an earlier program don't apply to this one
+        self._memo = dict()
             
     # find a function in function tracker by name and len of args 
     def get_func_by_name_and_param_len(self, name, args):
         if (name, args) not in self.func_name_to_ast:
-            super().error(ErrorType.NAME_ERROR, f"Function {name} not found")
+            self._error(ErrorType.NAME_ERROR, f"Function {name} not found")
         return self.func_name_to_ast[(name, args)]
         
     # Execute each statement inside the main function (at this point we pass in the arg values)    
-    def run_func(self, func_node, args):
-        # remember at this point we have verified the function exists
-        
-        # new local scope for function (it keeps track of variable names with a list of dictionaries, note we add a new dictionary for every if or for loop)
-        # make a dict for the variables in the func
-        local_scope = dict()        
-        
-        for arg_var_name,arg_value in zip(func_node.dict['args'], args):
-            # Note we can pass in an expression as an arg value (ex: -1)
-            evaluated_arg_avalue = self.do_evaluate_expression(arg_value)
-            local_scope[arg_var_name.dict['name']] = evaluated_arg_avalue
-        
-        # get current func's inner level (aka the list of dictionaries)
-        
-        # call_stack is our global variable that keeps track of function scopes
-        # We push the functions local_scope onto the stack
-        self.call_stack.append([local_scope])
-        
-        # Execute each statement inside the function
-        for statement in func_node.dict['statements']:
-            # result is the return statment
-            result = self.run_statement(statement)
-            # note a function can return nil so its techincally returning something (ex: return nil; or return;)
-            if (result == "nil"):
-                return None
-            # we have a return statement in the function
-            if (result != None):
-                # note return has handled popping from stack so need for popping here
-                return result
-        
-        # we dont have something to return (so we just pop scope)
-        self.call_stack.pop()
-        # must return nil
-        return None
+    def run_func(self, func_node, arg_values):
+        # remember at this point we have verified the function exists and evaluated the arguments
+
+        # a pure function always gives the same result for the same arguments so we only run it once per argument list
+        if func_node.is_pure:
+            # the types are part of the key since true == 1 in Python
+            key = (func_node, tuple((type(arg_value), arg_value) for arg_value in arg_values))
+            memo = self._memo
+            if key not in memo:
+                # once the function has run enough times it is turned into a python function
+                if func_node.python_function is None:
+                    func_node.calls += 1
+                    if func_node.calls >= _HOT_CALL_COUNT:
+                        func_node.python_function = self.compile_to_python(func_node)
+                if func_node.python_function is not None:
+                    memo[key] = func_node.python_function(*arg_values)
+                else:
+                    memo[key] = self.run_func_values(func_node, arg_values)
+            return memo[key]
+        return self.run_func_values(func_node, arg_values)
+
+    # run the function with the argument values already evaluated
+    def run_func_values(self, func_node, arg_values):
+        # the function's variables go right after the caller's on the locals stack (every slot starts as None)
+        locals_stack = self._locals_stack
+        caller_base = self._frame_base
+        base = len(locals_stack)
+        locals_stack.extend(func_node.blank_frame)
+        for arg_var_node, arg_value in zip(func_node.args, arg_values):
+            locals_stack[base + arg_var_node.slot] = arg_value
+        self._frame_base = base
+
+        try:
+            # Execute each statement inside the function (each one already paired with the method that runs it)
+            for handler, statement in func_node.body:
+                handler(statement)
+            # no return statement so it must return nil
+            return None
+        # a return statement ran somewhere inside the function (maybe inside an if or a for loop)
+        except ReturnSignal as signal:
+            return signal.value
+        finally:
+            # however the function ends we drop its variables and go back to the caller's frame
+            del locals_stack[base:]
+            self._frame_base = caller_base
     
-    # process different kind of statements     
-    def run_statement(self, statement_node):
-        # is_definition
-        if statement_node.elem_type == 'vardef':
-            self.do_definition(statement_node)
-        # is_assignment
-        elif statement_node.elem_type == '=':
-            self.do_assignment(statement_node)
-        # is_func_call (note only print can be found in the statement node not print)
-        elif statement_node.elem_type == 'fcall':
-            self.do_func_call(statement_node)
-        # is if statement
-        elif statement_node.elem_type == 'if':
-            # there can be a return in the if statement
-            return self.do_if_statement(statement_node)
-        # is for loop
-        elif statement_node.elem_type == 'for':
-            # there can be a return in the for loop
-            return self.do_for_loop(statement_node)
-        # is a return statement
-        elif statement_node.elem_type == 'return':
-            return self.do_return_statement(statement_node)
+    # is_func_call as a statement (note the value of the call is thrown away)
+    def do_call_statement(self, statement_node):
+        self.do_func_call(statement_node)
     
     
     def do_return_statement(self, statement_node):
         # get the expression
-        expression = statement_node.dict['expression'] 
+        expression = statement_node.expression 
         
-        # first check if the return value is None (ex: return;)
-        if expression == None:
-            expression = "return with no value"
-            return expression
+        # first check if the return value is None (ex: return;) which returns nil
+        if expression is None:
+            raise ReturnSignal(None)
         
         # 'expression' which maps to an expression, variable or constant to return or None (if the return statement returns a default value of nil)
-        # do_evaluate expression will handle the cases above
-        evaluated_expression = self.do_evaluate_expression(expression)
-        
-        # this means we had a 'return nil;' SO we techincally return something
-        if evaluated_expression == None:
-            return None
-        
-        # pop the whole scope we are in when we encounter return
-        self.call_stack.pop()
-        
-        return evaluated_expression
+        # do_evaluate expression will handle the cases above (including 'return nil;')
+        # run_func catches this, returns the value and drops the function's variables
+        raise ReturnSignal(self.do_evaluate_expression(expression))
     
      
     def do_for_loop(self, statement_node):
         # handle the assignment
-        self.do_assignment(statement_node.dict['init'])
+        self.do_assignment(statement_node.init)
+        # everything the loop needs is looked up once here instead of on every iteration
+        # (variables defined in the for loop got their own slots when it was compiled so there is no scope dict to make or push per iteration,
+        # their var statements just set the slots back to None)
+        condition = statement_node.condition.compiled
+        body = statement_node.body
+        update = statement_node.update
+        do_assignment = self.do_assignment
             
         while True:
             # if the condition is true so we run the statements inside the for loop
-            # we are in the for loop so now can can add its scope to stack
-            local_scope = dict()
-            self.current_scope().append(local_scope)
             # check if the condition of the for loop does not evaluate to a boolean
-            is_condition = self.do_evaluate_expression(statement_node.dict['condition'])
-            if isinstance(is_condition, bool) == False:
-                            super().error(
+            is_condition = condition()
+            if type(is_condition) is not bool:
+                            self._error(
                         ErrorType.TYPE_ERROR,
                         "condition of the for loop does not evaluate to a boolean",
                     )
-            # we have finished exceuting the for loop so we can pop its scope from the stack
-            elif is_condition == False:
-                self.current_scope().pop()
+            # we have finished exceuting the for loop
+            elif is_condition is False:
                 return
             
             # conditon is true so we run statements inside for loop
-            for statement in statement_node.dict['statements']:
-                result = self.run_statement(statement)
-                if (result != None):
-                    return result
+            for handler, statement in body:
+                handler(statement)
                 
-            # pop the dictonary (local_scope) of the for loop iteration
-            self.current_scope().pop()
             # update the condition and check if its true
-            self.do_assignment(statement_node.dict['update'])
+            do_assignment(update)
         
         
     def do_if_statement(self, statement_node):
         # the expression/variable/value that is the condition of the if statement must evaluate to a boolean
-        is_it_bool = self.do_evaluate_expression(statement_node.dict['condition'])
-        if isinstance(is_it_bool, bool) == False:
-            super().error(
+        is_it_bool = self.do_evaluate_expression(statement_node.condition)
+        if type(is_it_bool) is not bool:
+            self._error(
                     ErrorType.TYPE_ERROR,
                     "condition of the if statement does not evaluate to a boolean",
                 )
             
         # condition maps to a boolean expression, variable or constant that must be True for the if statement to be executed
-        if (is_it_bool == True):
-            # we need a new scope for if statement
-            local_scope = dict() 
-            self.current_scope().append(local_scope)
-            # eun statemnts in if statement
-            for statement in statement_node.dict['statements']:
-                # result is the return statment (in case we have return in if statement)
-                result = self.run_statement(statement)
-                # if the return statement inside the if statment did return with no return value (ex: return;)
-                if result == "return with no value":
-                    self.call_stack.pop()
-                    return "nil"
-                
-                if (result != None):
-                # we have finished executing function so we can return (return handles the popping offf the stack)
-                    return result
-                
-            # delete the if statement scope from list of dictionaries
-            self.current_scope().pop()
+        if is_it_bool is True:
+            # eun statemnts in if statement (a return in here raises ReturnSignal straight to the function call)
+            for handler, statement in statement_node.body:
+                handler(statement)
         
         # condition in if statement is false  
         else:
             # There is no else clause
-            if statement_node.dict['else_statements'] is None:
-                # we continue running the rest of the statements otuside if clause (we dont need to pop in this case as the if clause was false so we never created a scope for the if clause)
+            if statement_node.else_body is None:
+                # we continue running the rest of the statements otuside if clause
                 return
             # we have an else clause
             else:
-                # we need a scope for brackets in else clause
-                local_scope = dict()
-                self.current_scope().append(local_scope)
                 # run statements in else clause
-                for statement in statement_node.dict['else_statements']:
-                    result = self.run_statement(statement)
-                    if (result != None):
-                        return result
-                # pop else scope
-                self.current_scope().pop()
+                for handler, statement in statement_node.else_body:
+                    handler(statement)
             
     # Add variable name to variable_tracker if possible (can't redefine it)
     def do_definition(self, statement_node):
-        # check that the varibale is not already defined in the current scope which is the current dictionary we are in
-        if statement_node.dict['name'] in self.current_scope()[-1]:
-            super().error(
+        # the compiler found that the variable is already defined in the current scope (so it got no slot)
+        if statement_node.slot is None:
+            self._error(
                 ErrorType.NAME_ERROR,
-                f"variable {statement_node.dict['name']} defined more than once",
+                f"variable {statement_node.name} defined more than once",
             )
         else:
-            # add the variable def to the last dictionary in list of dictionaries (name as key and None as default value)
-            self.current_scope()[-1][statement_node.dict['name']] = None
+            # the variable starts as None every time its definition runs (ex: each iteration of a for loop)
+            self._locals_stack[self._frame_base + statement_node.slot] = None
     
     # assign value to variable     
     def do_assignment(self, statement_node):
-        # get the name of the variable (ex: 'x')
-        variable_name = statement_node.dict['name']
-        
-        # verify that variable name is in scope
-        in_scope = False
-        dictionary_scope = None
-        for dict in reversed(self.current_scope()):
-            if variable_name in dict:
-                # we save the dictionary where this vvariable name is located
-                dictionary_scope = dict
-                in_scope = True
-                # as soon as we find the first dict that has this variable we break
-                break
-        
-        # variable name not in scope
-        if in_scope == False:
-            super().error(
+        # variable name not in scope (the compiler could not find a slot for it)
+        if statement_node.slot is None:
+            self._error(
                 ErrorType.NAME_ERROR,
-                f"Variable {variable_name} has not been defined",
+                f"Variable {statement_node.name} has not been defined",
             )
         # we have found the variable
         else:
-            # get expression node
-            expression = statement_node.dict['expression']
-            
             # call do_evaulate_expression which handles the expression (ex: x = 5 + 6;)
-            resulting_value = self.do_evaluate_expression(expression)
+            resulting_value = self.do_evaluate_expression(statement_node.expression)
         
-            # set the value to its corresponding vairble in dict
-            dictionary_scope[variable_name] = resulting_value
+            # set the value to its corresponding vairble slot
+            self._locals_stack[self._frame_base + statement_node.slot] = resulting_value
 
             
     # determine which function is in the func node (print() found in statement nodes and inputi() found in expression nodes or just a general functiuon)
     def do_func_call(self, func_node):
         # only found in expression nodes
         # evaluate_input_call will help us get the user input
-        if func_node.dict['name'] == 'inputi':    
+        if func_node.name == 'inputi':    
             user_input = self.do_evaluate_input_call(func_node)
             return user_input
         # same as inputi but for strings
-        elif func_node.dict['name'] == 'inputs':
+        elif func_node.name == 'inputs':
             user_input = self.do_evaluate_input_call(func_node)
             return user_input
-        elif func_node.dict['name'] == 'print':
+        elif func_node.name == 'print':
             self.do_evaluate_print_call(func_node)
         else:
-            # verify the func defnition exists
-            function = self.get_func_by_name_and_param_len(func_node.dict['name'], len(func_node.dict['args']))
+            # the function definition was looked up when the call was compiled (if it wasn't found, this reports the error)
+            function = func_node.resolved or self.get_func_by_name_and_param_len(func_node.name, len(func_node.args))
             
-            # remeber args you pass in to functions can be expressions (ex: foo(n-1); this is handle by run_func)
+            # remeber args you pass in to functions can be expressions (ex: foo(n-1)) so we evaluate them here with the caller's variables
+            arg_values = [self.do_evaluate_expression(argument) for argument in func_node.args]
             # pass in the function defintion and then pass in the arg values
-            return self.run_func(function, func_node.dict['args'])
+            return self.run_func(function, arg_values)
             
             
     # evaluate the print call (actually output what print wants to print)
     def do_evaluate_print_call(self, print_node):
-        string_to_output = ""
         # nothing to print so return nil (none)
-        if (print_node.dict['args']) == None:
+        if print_node.args is None:
             return None
-        # loop through arguments of print statement
-        for argument in print_node.dict['args']:
-            # check if the argument is a bool so we can make it lowercase
-            expression_value = self.do_evaluate_expression(argument)
-            if (isinstance(expression_value, bool)):
-                lowercase_bool = str(expression_value)
-                string_to_output += lowercase_bool.lower()
-            else:
-                string_to_output += str(expression_value)
+        # evaluate each argument and join them once (adding strings one by one copies the string so far every time)
         # output using the output() method in our InterpreterBase base class (output() method automatically appends a newline character after each line it prints, so you do not need to output a newline yourself.)
-        super().output(string_to_output)
+        render = self._render
+        do_evaluate_expression = self.do_evaluate_expression
+        self._output(''.join([render(do_evaluate_expression(argument)) for argument in print_node.args]))
+
+    # the text print shows for a value (booleans are lowercase in Brewin)
+    def _render(self, value):
+        if value is True:
+            return 'true'
+        if value is False:
+            return 'false'
+        return str(value)
         
     # get the user input 
     def do_evaluate_input_call(self, input_node):
         # If an inputi() expression has more than one parameter passed to it, then you must generate an error of type ErrorType.NAME_ERROR by calling InterpreterBase.error()
-        if len(input_node.dict['args']) > 1:
-            super().error(
+        if len(input_node.args) > 1:
+            self._error(
                 ErrorType.NAME_ERROR,
                 f"No inputi() function found that takes > 1 parameter",
                 )
             
         # If an inputi() function call has a prompt parameter, you must first output it to the screen using our InterpreterBase output() method before obtaining input from the user
         # assume that the inputi() function is invoked with a single argument, the argument will always have the type of string
-        if len(input_node.dict['args']) == 1:
-            input_prompt = self.do_evaluate_expression(input_node.dict['args'][0])
-            super().output(input_prompt)
+        if len(input_node.args) == 1:
+            input_prompt = self.do_evaluate_expression(input_node.args[0])
+            self._output(input_prompt)
  
         # the user wants to input a string
-        if input_node.dict['name'] == 'inputs':
-            user_string_input = super().get_input()
+        if input_node.name == 'inputs':
+            user_string_input = self._get_input()
             return user_string_input
             
         # the user wants to input an integer
-        user_input = int(super().get_input())
+        user_input = int(self._get_input())
         return user_input
         
     
-    # handle expression node
-    def do_evaluate_expression(self, expression):
-        # case where we assign a variable to an int (ex: x = 5)
-        if expression.elem_type == 'int':
-            return expression.dict['val']
-        # case where we assign a variable to a string (ex: x = "foo")
-        elif expression.elem_type == 'string':
-            return expression.dict['val']
-        # case where we assign a variable to a boolean
-        elif expression.elem_type == 'bool':
-            return expression.dict['val']
-        # case where we assign a variable to a nil value (nil values are like nullptr in C++ or None in Python)
-        elif expression.elem_type == 'nil':
-            return None
-        # case where we have an inputi() or inputs() in an expression (only the case for proj 1)
-        elif expression.elem_type == 'fcall':
-            # do func call will determine that it should be an input func or regular func
-            return self.do_func_call(expression)
-        
-        # case where we have a variable (x = y)
-        elif expression.elem_type == 'var':
-            # If an expression refers to a variable that has not yet been defined, then you must generate an error of type ErrorType.NAME_ERROR by calling InterpreterBase.error()
-            
-            # check if the varuabke was defined at all
-            for dict in reversed(self.current_scope()):
-                if expression.dict['name'] in dict:
-                    # return variable value
-                    return dict.get(expression.dict['name'])
-            
-            # We have looped through all dicts in array and var was not found
-            super().error(
-                ErrorType.NAME_ERROR,
-                f"Variable {expression.dict['name']} has not been defined",
-            )
-            
+    # compile a function ahead of time: give each of its variables a slot and compile every expression inside it
+    def compile_function(self, func_def):
+        # list of dictionaries that map the variable names visible at this point of the function to their slot (one dict per block, like the scopes at runtime)
+        self._scopes = [dict()]
+        self._num_slots = 0
+        # the function is pure until we find a print/inputi/inputs call in it, callees collects the functions it calls
+        self._compiling_func = func_def
+        func_def.is_pure = True
+        func_def.callees = set()
+        # how many times the (pure) function ran, and the python function it was turned into once it got hot
+        func_def.calls = 0
+        func_def.python_function = None
+        self._copy_fields(func_def)
+        # the parameters live in the same scope as the variables defined at the top of the function body
+        for arg_var_node in func_def.dict['args']:
+            self._copy_fields(arg_var_node)
+            name = arg_var_node.dict['name']
+            if name not in self._scopes[-1]:
+                self._scopes[-1][name] = self._new_slot()
+            arg_var_node.slot = self._scopes[-1][name]
+        func_def.body = self.compile_statements(func_def.dict['statements'])
+        # how many slots a call to this function needs on the locals stack
+        func_def.num_slots = self._num_slots
+        # the values a call's slots start with (built once so a call doesn't allocate a new list of Nones)
+        func_def.blank_frame = (None,) * self._num_slots
+
+    # copy the fields of a node out of node.dict into plain attributes (statement_node.condition instead of statement_node.dict['condition'])
+    # so running it reads attributes instead of hashing key strings, and intern names so comparing them is a pointer check
+    def _copy_fields(self, node):
+        for key, value in node.dict.items():
+            if key == 'name':
+                value = sys.intern(value)
+            setattr(node, key, value)
+
+    def _new_slot(self):
+        self._num_slots += 1
+        return self._num_slots - 1
+
+    # find the slot of the closest variable with this name (None if it was not defined yet)
+    def _lookup_slot(self, name):
+        for scope in reversed(self._scopes):
+            if name in scope:
+                return scope[name]
+        return None
 
-        elif expression.elem_type == '*':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-            
-            # special case to handle booleans which python interprets as ints
-            if isinstance(operand1_value, bool) or isinstance(operand2_value, bool):
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-            
-            # if both the operands are of type int
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int):
-                return operand1_value * operand2_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-                
-        elif expression.elem_type == '/':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-                        
-            # special case to handle booleans which python interprets as ints
-            if isinstance(operand1_value, bool) or isinstance(operand2_value, bool):
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-            
-            # if both the operands are of type int
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int):
-                return operand1_value // operand2_value
+    # the statements of an if, else or for body get their own scope
+    def compile_block(self, statements):
+        self._scopes.append(dict())
+        body = self.compile_statements(statements)
+        self._scopes.pop()
+        return body
+
+    # walk the statements in the order they run (a block has no jumps so a variable is visible after its var statement)
+    # returns the block as a list of (method that runs the statement, statement) so running it doesn't look up the elem_type every time
+    def compile_statements(self, statements):
+        body = []
+        for statement in statements:
+            # statements we don't know how to run are skipped
+            if statement.elem_type in self._stmt_dispatch:
+                body.append((self._stmt_dispatch[statement.elem_type], statement))
+            self._copy_fields(statement)
+            if statement.elem_type == 'vardef':
+                name = statement.dict['name']
+                # defining a variable twice in the same scope is an error when that statement runs (so it gets no slot)
+                if name in self._scopes[-1]:
+                    statement.slot = None
+                else:
+                    statement.slot = self._scopes[-1][name] = self._new_slot()
+            elif statement.elem_type == '=':
+                self.compile_assignment(statement)
+            # a function call used as a statement
+            elif statement.elem_type == 'fcall':
+                self.compile_call(statement)
+            elif statement.elem_type == 'return':
+                if statement.dict['expression'] is not None:
+                    self.compile_expression(statement.dict['expression'])
+            elif statement.elem_type == 'if':
+                self.compile_expression(statement.dict['condition'])
+                statement.body = self.compile_block(statement.dict['statements'])
+                statement.else_body = None
+                if statement.dict['else_statements'] is not None:
+                    statement.else_body = self.compile_block(statement.dict['else_statements'])
+            # the init, condition and update of a for loop only see the variables outside of it
+            elif statement.elem_type == 'for':
+                self.compile_assignment(statement.dict['init'])
+                self.compile_expression(statement.dict['condition'])
+                self.compile_assignment(statement.dict['update'])
+                statement.body = self.compile_block(statement.dict['statements'])
+        return body
+
+    # compile the arguments of a call and find the function it calls (None for builtins and functions that don't exist)
+    def compile_call(self, func_node):
+        self._copy_fields(func_node)
+        for argument in func_node.dict['args']:
+            self.compile_expression(argument)
+        if func_node.dict['name'] in ('inputi', 'inputs', 'print'):
+            func_node.resolved = None
+            # input and output can't be skipped
+            self._compiling_func.is_pure = False
+        else:
+            func_node.resolved = self.func_name_to_ast.get((func_node.dict['name'], len(func_node.dict['args'])))
+            if func_node.resolved is None:
+                # calling a function that doesn't exist is an error that has to happen every time
+                self._compiling_func.is_pure = False
             else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )     
+                self._compiling_func.callees.add(func_node.resolved)
+
+    def compile_assignment(self, statement):
+        self._copy_fields(statement)
+        statement.slot = self._lookup_slot(statement.dict['name'])
+        self.compile_expression(statement.dict['expression'])
+
+    # turn an expression node into a Python closure that evaluates it (the closure is saved on the node as node.compiled)
+    # this way the elem_type dispatch and the dict lookups for the node's fields happen once instead of every time the expression runs
+    def compile_expression(self, expression):
+        compiler = self._expr_dispatch.get(expression.elem_type)
+        if compiler is not None:
+            expression.compiled = compiler(expression)
+        # anything else evaluates to None
+        else:
+            expression.compiled = self._compile_nil(expression)
+        # an operation on literals (ex: 1 + 2, -5, !true) is worked out once here and the node becomes a literal (ex: int 3)
+        if expression.elem_type in self._foldable and all(
+            operand.elem_type in ('int', 'string', 'bool', 'nil')
+            for operand in (expression.dict['op1'], expression.dict.get('op2', expression.dict['op1']))
+        ):
+            folded = self._fold_constant(expression)
+            if folded is not None:
+                expression.elem_type = self._literal_types[type(folded[0])]
+                expression.dict = {'val': folded[0]}
+                expression.compiled = self._compile_const(expression)
+        # remember if the value is known to be an int whenever the expression doesn't fail (-, *, / and negation either give an int or raise an error)
+        expression.is_int = (
+            expression.elem_type in ('int', '-', '*', '/', 'neg')
+            or expression.elem_type == '+' and expression.dict['op1'].is_int and expression.dict['op2'].is_int
+        )
+        return expression.compiled
+
+    # the value of an operation whose operands are all literals, as a 1-tuple (None if running it is an error, so it is left to fail when it runs)
+    # this follows the same type rules as the compiled closures below
+    def _fold_constant(self, expression):
+        operation = expression.elem_type
+        operand1_value = expression.dict['op1'].dict.get('val')
+        operand1_type = type(operand1_value)
+        # unary operations
+        if operation == 'neg':
+            return (-operand1_value,) if operand1_type is int else None
+        if operation == '!':
+            return (not operand1_value,) if operand1_type is bool else None
+        operand2_value = expression.dict['op2'].dict.get('val')
+        operand2_type = type(operand2_value)
+        # values of different types are never equal (nil == nil is true)
+        if operation == '==':
+            return (operand1_type is operand2_type and operand1_value == operand2_value,)
+        if operation == '!=':
+            return (not (operand1_type is operand2_type and operand1_value == operand2_value),)
+        if operation == '&&' or operation == '||':
+            if operand1_type is bool and operand2_type is bool:
+                return (operand1_value and operand2_value,) if operation == '&&' else (operand1_value or operand2_value,)
+            return None
+        # strings can only be concatenated
+        if operation == '+' and operand1_type is str and operand2_type is str:
+            return (operand1_value + operand2_value,)
+        # the rest need two ints (dividing by zero is left to fail when it runs)
+        if operand1_type is not int or operand2_type is not int or operation == '/' and operand2_value == 0:
+            return None
+        return (self._arith_ops[operation][0](operand1_value, operand2_value),)
 
-        # case where we add 
-        elif expression.elem_type == '+':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-            
-            # special case to handle booleans which python interprets as ints
-            if isinstance(operand1_value, bool) or isinstance(operand2_value, bool):
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-            
-            # if both the operands are of type int or string (concatenate them)
-            elif isinstance(operand1_value, int) and isinstance(operand2_value, int) or isinstance(operand1_value, str) and isinstance(operand2_value, str):
-                return operand1_value + operand2_value       
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-        
-        # case where we subtract
-        elif expression.elem_type == '-':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-                        
-            # special case to handle booleans which python interprets as ints
-            if isinstance(operand1_value, bool) or isinstance(operand2_value, bool):
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-                
-            # if both the operands are of type int
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int):
-                return operand1_value - operand2_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-                 
-        elif expression.elem_type == '==':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-            
-            # if both the operands are nil (None) return true
-            if (operand1_value == None and operand2_value == None):
-                return True
-            
-            # check that operands are the same type
-            if type(operand1_value) != type(operand2_value):
-                return False
-            
-            # if both the operands are of type int or type string or type bool
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int) or isinstance(operand1_value, str) and isinstance(operand2_value, str) or isinstance(operand1_value, bool) and isinstance(operand2_value, bool):
-                return operand1_value == operand2_value
-            else:
-                # values of diff types safety check
-                return False
-        
-        elif expression.elem_type == '!=':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-            
-            # if both the operands are nil (None)
-            if (operand1_value == None and operand2_value == None):
-                return False
-            
-            # check that operands are the same type (needed for true != 1 or else 1 will be interpreted as true)
-            if type(operand1_value) != type(operand2_value):
-                return True
-            
-            # if both the operands are of type int or type string or type bool
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int) or isinstance(operand1_value, str) and isinstance(operand2_value, str) or isinstance(operand1_value, bool) and isinstance(operand2_value, bool):
-                # compare operands
-                return operand1_value != operand2_value
-            else:
-                # # values of diff types safety check
-                # we return true since != says they are not equal
-                return True
-                
-        elif expression.elem_type == '<':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-            
-            # special case to handle booleans which python interprets as ints
-            if isinstance(operand1_value, bool) or isinstance(operand2_value, bool):
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-            
-            # if both the operands are of type int
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int):
-                # compare operands
-                return operand1_value < operand2_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-                
-        elif expression.elem_type == '<=':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-                        
-            # special case to handle booleans which python interprets as ints
-            if isinstance(operand1_value, bool) or isinstance(operand2_value, bool):
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-            
-            # if both the operands are of type int
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int):
-                # compare operands
-                return operand1_value <= operand2_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-                
-        elif expression.elem_type == '>':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-                 
-            # special case to handle booleans which python interprets as ints
-            if isinstance(operand1_value, bool) or isinstance(operand2_value, bool):
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
+    # turn a hot pure function into a python function (its source is written by FunctionWriter)
+    def compile_to_python(self, func_def):
+        writer = FunctionWriter()
+        source = writer.write_function(func_def)
+        namespace = dict(writer.constants, _error=self._error, ErrorType=ErrorType, _run_func=self.run_func)
+        exec(compile(source, f"<brewin {func_def.name}>", "exec"), namespace)
+        return namespace['brewin_function']
+
+    # handle expression node (run the closure it was compiled into)
+    def do_evaluate_expression(self, expression):
+        return expression.compiled()
+
+    # both operands of a binary operation are known to be ints when it is compiled
+    def _both_int(self, expression):
+        return expression.dict['op1'].is_int and expression.dict['op2'].is_int
+
+    # specialized closure for an operation on two operands known to be ints (no type checks needed)
+    def _compile_int_op(self, operand1, operand2, operator_function):
+        def evaluate():
+            return operator_function(operand1(), operand2())
+        return evaluate
+
+    # compile both operands of a binary operation (op1 is evaluated first)
+    def _compile_operands(self, expression):
+        d = expression.dict
+        return self.compile_expression(d['op1']), self.compile_expression(d['op2'])
+
+    # case where we assign a variable to an int, string or boolean (ex: x = 5, x = "foo", x = true)
+    def _compile_const(self, expression):
+        value = expression.dict['val']
+        def evaluate():
+            return value
+        return evaluate
+
+    # case where we assign a variable to a nil value (nil values are like nullptr in C++ or None in Python)
+    def _compile_nil(self, expression):
+        def evaluate():
+            return None
+        return evaluate
+
+    # case where we have an inputi() or inputs() in an expression (only the case for proj 1)
+    def _compile_fcall(self, expression):
+        self.compile_call(expression)
+        do_func_call = self.do_func_call
+        def evaluate():
+            # do func call will determine that it should be an input func or regular func
+            return do_func_call(expression)
+        return evaluate
+
+    # case where we have a variable (x = y)
+    def _compile_var(self, expression):
+        name = expression.dict['name']
+        slot = expression.slot = self._lookup_slot(name)
+        # If an expression refers to a variable that has not yet been defined, then you must generate an error of type ErrorType.NAME_ERROR by calling InterpreterBase.error()
+        if slot is None:
+            error = self._error
+            def evaluate():
+                error(
+                    ErrorType.NAME_ERROR,
+                    f"Variable {name} has not been defined",
                 )
-            
-            # if both the operands are of type int
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int):
-                # compare operands
-                return operand1_value > operand2_value
-            else:
-                super().error(
+            return evaluate
+        locals_stack = self._locals_stack
+        def evaluate():
+            # return variable value
+            return locals_stack[self._frame_base + slot]
+        return evaluate
+
+    # arithmetic and comparison operators (the python function that does the operation comes from self._arith_ops)
+    def _compile_arith(self, expression):
+        operand1, operand2 = self._compile_operands(expression)
+        operator_function, allow_str = self._arith_ops[expression.elem_type]
+        # both operands are known to be ints so the checks below can't fail
+        if self._both_int(expression):
+            return self._compile_int_op(operand1, operand2, operator_function)
+        error = self._error
+        # + also concatenates two strings
+        if allow_str:
+            def evaluate():
+                # get the operand values
+                operand1_value = operand1()
+                operand2_value = operand2()
+                # exact type checks (type(x) is int is a pointer compare, and a bool never passes as an int)
+                operand1_type = type(operand1_value)
+                operand2_type = type(operand2_value)
+                # if both the operands are of type int or string
+                if operand1_type is int and operand2_type is int or operand1_type is str and operand2_type is str:
+                    return operator_function(operand1_value, operand2_value)
+                error(
                     ErrorType.TYPE_ERROR,
                     "Incompatible types for arithmetic operation",
                 )
-                
-        elif expression.elem_type == '>=':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
+            return evaluate
+        def evaluate():
             # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-                        
-            # special case to handle booleans which python interprets as ints
-            if isinstance(operand1_value, bool) or isinstance(operand2_value, bool):
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-            
-            # if both the operands are of type int
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int):
-                # compare operands
-                return operand1_value >= operand2_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )                
-        
-        # unary operation: negation - (ex: -5)
-        elif expression.elem_type == 'neg':
-            # get the operand
-            operand1 = expression.dict['op1']
+            operand1_value = operand1()
+            operand2_value = operand2()
+            # if both the operands are of type int (booleans fail this check even though python interprets them as ints)
+            if type(operand1_value) is int and type(operand2_value) is int:
+                return operator_function(operand1_value, operand2_value)
+            error(
+                ErrorType.TYPE_ERROR,
+                "Incompatible types for arithmetic operation",
+            )
+        return evaluate
+
+    # values of different types are never equal (nil == nil is true since both are None)
+    def _compile_eq(self, expression):
+        operand1, operand2 = self._compile_operands(expression)
+        def evaluate():
+            operand1_value = operand1()
+            operand2_value = operand2()
+            # check that operands are the same type (needed for true == 1 or else 1 will be interpreted as true)
+            return type(operand1_value) is type(operand2_value) and operand1_value == operand2_value
+        return evaluate
+
+    def _compile_ne(self, expression):
+        operand1, operand2 = self._compile_operands(expression)
+        def evaluate():
+            operand1_value = operand1()
+            operand2_value = operand2()
+            # values of diff types are not equal so != is true
+            return type(operand1_value) is not type(operand2_value) or operand1_value != operand2_value
+        return evaluate
+
+    # unary operation: negation - (ex: -5)
+    def _compile_neg(self, expression):
+        # get the operand
+        operand1 = self.compile_expression(expression.dict['op1'])
+        error = self._error
+        def evaluate():
             # get the operand value
-            operand1_value = self.do_evaluate_expression(operand1)
-            
+            operand1_value = operand1()
+
             # operand must be of type int (handles case hwere bool is not intepreted as int)
-            if isinstance(operand1_value, int) and type(operand1_value) != bool:
+            if type(operand1_value) is int:
                 # negate the value
                 return -operand1_value
             else:
-                super().error(
+                error(
                     ErrorType.TYPE_ERROR,
                     "Incompatible types for arithmetic operation",
-                )         
-            
-        # unary operation: logical not ! (ex: !true)
-        elif expression.elem_type == '!':
-            # get the operand
-            operand1 = expression.dict['op1']
+                )
+        return evaluate
+
+    # unary operation: logical not ! (ex: !true)
+    def _compile_not(self, expression):
+        # get the operand
+        operand1 = self.compile_expression(expression.dict['op1'])
+        error = self._error
+        def evaluate():
             # get the operand value
-            operand1_value = self.do_evaluate_expression(operand1)
+            operand1_value = operand1()
             # operand must be of type bool
-            if isinstance(operand1_value, bool):
+            if type(operand1_value) is bool:
                 # logical negation (Python uses the keyword not)
                 return not operand1_value
             else:
-                super().error(
+                error(
                     ErrorType.TYPE_ERROR,
                     "Incompatible types for arithmetic operation",
-                )       
-                
-        # and operator
-        elif expression.elem_type == '&&':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
+                )
+        return evaluate
+
+    # and operator
+    def _compile_and(self, expression):
+        operand1, operand2 = self._compile_operands(expression)
+        error = self._error
+        def evaluate():
             # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
+            operand1_value = operand1()
+            operand2_value = operand2()
+            # exact type checks (type(x) is int is a pointer compare, and a bool never passes as an int)
+            operand1_type = type(operand1_value)
+            operand2_type = type(operand2_value)
+
             # if both the operands are of type bool
-            if isinstance(operand1_value, bool) and isinstance(operand2_value, bool):
+            if operand1_type is bool and operand2_type is bool:
                 # compare operands
                 return operand1_value and operand2_value
             else:
-                super().error(
+                error(
                     ErrorType.TYPE_ERROR,
                     "Incompatible types for arithmetic operation",
-                )   
-            
-        # or operator
-        elif expression.elem_type == '||':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
+                )
+        return evaluate
+
+    # or operator
+    def _compile_or(self, expression):
+        operand1, operand2 = self._compile_operands(expression)
+        error = self._error
+        def evaluate():
             # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
+            operand1_value = operand1()
+            operand2_value = operand2()
+            # exact type checks (type(x) is int is a pointer compare, and a bool never passes as an int)
+            operand1_type = type(operand1_value)
+            operand2_type = type(operand2_value)
+
             # if both the operands are of type bool
-            if isinstance(operand1_value, bool) and isinstance(operand2_value, bool):
+            if operand1_type is bool and operand2_type is bool:
                 # compare operands
                 return operand1_value or operand2_value
             else:
-                super().error(
+                error(
                     ErrorType.TYPE_ERROR,
                     "Incompatible types for arithmetic operation",
-                )     
-    
-    # Citation: The following code was found on Chatgpt
-    
-    def current_scope(self):
-        # Return the current scope (top of the stack) (the scope is an a list of dictonaries, every dictionary corresponds to the functions scope and if/for loop scopes in that function)
-        return self.call_stack[-1] 
-    
-    # End of citation
-                    
-#Main for testing purposes      
-#     program_source = """func main(){
-#                         var x;
-#                         x = 5 + 6;
-#                         print("The sum is: ", x);
-#                     }"""
-                    
-#     test_input_no_arg_program = """func main() {
-#                                     var b; 
-#                                     b = inputi();
-#                                     print(b);
-#                                 }"""
-    
-#     test_input_arg_program = """func main() {
-#                                     var b; 
-#                                     b = inputi("Enter a number: ");
-#                                     print(b);
-#                                 }"""
-                            
-#     test_spec_example = """func main() {
-#                             /* this is a comment */
-#                             var first;
-#                             var second;
-#                             first = inputi("Enter a first #: ");
-#                             second = inputi("Enter a second #: ");
-#                             var sum;
-#                             sum = (first + second);
-#                             print("The sum is ", sum, "!");
-#                         }"""
-                        
-#     test_var = """ func main(){
-#                         var first;
-#                         var second;
-#                         first = 5; 
-#                         second = first + 1 - 3;
-#                         var third;
-#                         third = (x + (5 - 3)) - y;
-#                         print("The sum is ", third, "!");
-#                 }"""
-                
-#     random_test = """
-#                 func main(){
-#                     var y;
-#                     y = 2;
-#                     var x;
-#                     x = 3;
-#                     print(y," is 1 plus ", x);
-#                 }
-#                 """
-                
-#     test_spec1 = """
-#                 func main() {
-#                     var a;
-#                     a = 5 + 10;
-#                     print(a);
-#                     print("that's all!");
-#                 }"""
-                
-#     test_spec2 = """
-#                 func main() {
-#                     var foo;
-#                     foo = inputi("Enter a value: ");
-#                     print(foo);
-#                 }
-#                 """
-                
-#     test_spec3 = """func main() {
-#                     var bar;
-#                     bar = 5;
-#                     print("The answer is: ", (10 + bar) - 6, "!");
-#                 }"""
-                
-#     test = """func main(){
-#                 var x;
-#                 x = "";
-#                 print(x);
-#             }"""
-            
-#     test1 = """
-#             func main() {
-#             print("Hello, world!");
-#             }
-#             """
-            
-#     test2 = """ func main() {
-#             var x;
-#             var y;
-#             x = 7;
-#             y = 3;
-#             print("Sum: ", x + y);
-#             print("Difference: ", x - y);          
-#             }"""
-            
-#     test3 = """
-#             func main() {
-#                 print(x); 
-#             }
-#             """
-                         
-#     test4 = """ func main() {
-#                     var result;
-#                     result = (5 + 3) - (2 + 1);
-#                     print("Result: ", result);
-#                 }"""  
-    
-#     test5 = """
-#                 func main() {
-#                 var age;
-#                 age = inputi("Enter your age: ");
-#                 print("Your age is: ", age);
-#             }
-#             """
-            
-#     test6 = """
-#                 func main() {
-#                     var x;
-#                     var x;
-#                 }
-#             """
-    
-#     test7 = """
-#             func main() {
-#             var x;
-#             x = "hello" + 5;
-#         }
-#             """
-    
-#     test8 = """
-#                 func main() {
-#                 unknown_function();  
-#             }
-#             """
-    
-#     test9 = """
-#             func main() {
-#             var x;
-#             print(x);  
-#         }"""
-        
-#     # guranteed to have a at least one statement
-#     test10 = """
-#             func main() {
-                
-#             }
-#             """
-            
-#     test11 = """
-#             func main() {
-#             var x;
-#             x = ((5 + (6 - 3)) - ((2 - 3) - (1 - 7)));
-#             print("Result: ", x);
-#             }
-#     """
-    
-#     test12 = """
-#             func main() {
-#                 var first;
-#                 var second;
-#                 first = inputi("Enter first number: ");
-#                 second = inputi("Enter second number: ");
-#                 print("Sum: ", first + second);
-#                 }
-#             """
-            
-#     test13 = """
-#             func main() {
-#                 var x;
-#                 x = y + 5; 
-#             }
-#             """
-            
-#     test14 = """
-#             func main() {
-#                 var x;
-#                 x = inputi("Enter a large number: ");
-#                 print("You entered: ", x);
-#             }
-#             """
-            
-#     test15 = """
-#             func main() {
-#                 print("Line 1");
-#                 print("Line 2");
-#                 print("Line 3");
-#                 print("Line 4");
-#                 print("Line 5");
-#             }
-#             """
-            
-#     ######################### Project 2 Tests ##################################
-    
-#     # should print 120
-#     test1_p2 = """ 
-#                 func main() { 
-#                     print(fact(5));
-#                 }
-#                 func fact(n) {
-#                     if (n <= 1) { return 1; } return n * fact(n-1);
-#                 }
-#                 """
-                
-#     # should print 3
-#     #              2
-#     #              1
-#     test2_p2 = """
-#                 func main() {
-#                     var i;
-#                     for (i = 3; i > 0; i = i - 1) {
-#                     print(i); 
-#                     }
-#                 }
-#                 """
-                
-#     test_multiplication = """
-#                     func main() {
-#                         var x;
-#                         var y;
-#                         x = 7;
-#                         y = 3;
-#                         print("Sum: ", x * y);
-#                     }
-#                     """
-    
-#     test_division = """
-#                     func main() {
-#                         var x;
-#                         var y;
-#                         x = 5;
-#                         y = 3;
-#                         print("Sum: ", x / y);
-#                     }
-#                     """
-                    
-#     test_unary = """
-#                     func main() {
-#                         var x;
-#                         x = -5;
-#                         print("Sum: ", x);
-#                     } 
-#                 """
-    
-#     test_concatenate = """
-#                         func main() {
-#                             print("abc" + "def");
-#                         } 
-#                         """
-#     # test ==                  
-#     test_comparison_equals = """
-#                             func main() {
-#                                print(5 < 5);
-#                                print(5 < 6);
-#                                var a;
-#                                a = 5;
-#                                print(6 <= 5);
-#                                var b;
-#                                b = 3;
-#                                print(b > 5);
-#                                print (5 >= 5);
-                               
-                               
-#                                var c;
-#                                var d;
-#                                var e;
-#                                c = true;
-#                                d = false;
-#                                e = true;
-#                                print (c == d);
-#                                print (c == e);
-                               
-#                                print (c != d);
-#                                print (c != e);
-                               
-#                             } 
-#                             """
-                            
-#     test_unary = """
-#                     func main() {
-#                         print(-6);
-#                         print(!true);
-#                     }
-#                 """
-    
-#     test_logical_binary_operators = """
-#                                     func main() {
-#                                         print(true || false);
-#                                         print(true || false && false);
-#                                         print(true && false);
-#                                     }
-#                                     """
-                                    
-#     test_if_statement = """
-#                         func foo(c) {
-#                             if (c == 10) {
-#                                 c = "hi";  /* reassigning c from outer-block */
-#                                 print(c);  /* prints "hi" */
-#                             }
-#                             print(c); /* prints “hi” */
-#                         }
-#                         func main() { 
-#                             foo(10);
-#                         }
-#                         """
-    
-#     test_if = """
-#         func main() {
-#             var x;
-#             x = 15;
-
-#             if (x > 10) {
-#                 print("Greater");
-#             } 
-#             else {
-#                 print("Smaller");
-#             }
-
-#             if (x < 10) {
-#                 print("This won't print");
-#             }
-#         }
-#             """
-            
-#     test_bad_expr1 = """
-#                     func main() {
-#                         var a;
-#                         a = true + 5;
-#                     }
-#                     """
-                    
-#     test = """
-#             func main() {
-#                 print(unknown_var);
-#             }
-#             """
-            
-#     test_simple_func_call = """
-#                             func foo() {
-#                                 print("hello world!");
-#                             }
-#                             func main() {
-#                                 foo();
-#                             }
-#                             """
-    
-#     test_func_call_with_args = """
-#                             func bletch(a,b,c) {
-#                                 print("The answer is: ", a+b*c);
-#                             }
-
-#                             func main() {
-#                                 bletch(1,2,3);
-#                             }
-#                             """
-                            
-     
-               
-#     test_for = """
-#                 func main() {
-#                     var i;
-#                     for (i=0; i < 5; i=i+1) {
-#                         print(i);
-#                     }
-#                 }     
-#                 """
-                
-#     test_static_scoping_1 = """
-#         func main() {
-#             var a;
-#             a = 5;
-#             if (true) {
-#                 print(a);
-#                 var a;
-#                 a = "foo";
-#                 print(a);
-#             }
-#             print(a);
-#         }
-#     """
-    
-#     test_static_scoping_simple = """
-#         func main() {
-#             var a;
-#             a = 5;
-#             if (true) {
-#                 print(a);
-#             }
-#         }
-#     """
-
-#     test_return = """
-#                 func foo(x) {
-#                     if (x < 0) {
-#                         print(x);
-#                         return -x;
-#                         print("this will not print");
-#                     }
-#                 print("this will not print either");
-#                 return 5*x;
-#                 }
-#                 func main() {
-#                     print("the positive value is ", foo(-1));
-#                 }
-#                 """
-                
-#     test_print = """
-#                 func main() {
-#                     var x;
-#                     x = 1;
-#                     print(x);
-#                 }
-#                 """
-                
-                          
-#     test_fact = """
-#                 func main() { 
-#                     print(fact(5));
-#                 }
-#                 func fact(n) {
-#                     if (n <= 1) { 
-#                     return 1; 
-#                     } 
-#                     return n * fact(n-1);
-#                 }
-#                 """
-                
-#     test_5 = """
-#             func bar(a) { print(a);
-#             }
-#             func main() { bar(5);
-#             bar("hi");
-#             bar(false || true);
-#             }
-#             """
-            
-#     test_6 = """
-#             func bletch(a,b,c) {
-#                 print("The answer is: ", a+b*c);
-#             }
-#             func main() 
-#             { 
-#                 bletch(1,3,2+4);
-#             }
-#             """
-            
-#     test_spec = """
-#                 func foo(a) { 
-#                     print(a);
-#                 }
-#                 func foo(a,b) {
-#                     print(a," ",b);
-#                 }
-#                 func main() { 
-#                     foo(5);
-#                     foo(6,7);
-#                 }
-#                 """
-                
-#     test_spec_10 = """
-#                 func foo() {
-#                     print("hello"); /* no explicit return command */
-#                 }
-#                 func bar() {
-#                     return; /* no return value specified */
-#                 }
-                
-#                 func main() { 
-#                     var val;
-#                     val = nil;
-#                     if (foo() == val && bar() == nil) { 
-#                         print("this should print!"); 
-#                     } 
-#                 }
-#                     """
-                    
-#     test_spec_11 = """
-#                     func main() { 
-#                         var val;
-#                         val = nil;
-#                         if (val == nil) { 
-#                             print("this should print!"); 
-#                         } 
-#                     }
-#                     """
-                    
-#     test_inputs = """
-#                 func main() {
-#                     var b; 
-#                     b = inputi("Hello");
-#                     print(b);
-#                 }
-#             """
-            
-#     test_nil = """
-#             func foo() {
-#                 print(1);
-#             }
-
-#             func bar() {
-#                 return nil;
-#             }
-
-#             func main() {
-#                 var x;
-#                 x = foo();
-#                 if (x == nil) {
-#                     print(2);
-#                 }
-#                 var y;
-#                 y = bar();
-#                 if (y == nil) {
-#                     print(3);
-#                 }
-#             }
-#                 """
-                
-#     test_nil2  = """
-    
-#                 func foo() {
-#                     print(1);
-#                 }
-                
-#                 func bar() {
-#                     return nil;
-#                 }
-                
-#                 func main() {
-#                     var x;
-#                     x = foo();
-#                     if (x == nil) {
-#                         print(2);
-#                     }
-#                     var y;
-#                     y = bar();
-#                 }
-    
-#                 """
-                
-#     test_compare = """
-#             func main() {
-#                 print(1 >= 1);
-#                 print(1 == "1");
-#                 print(1 == true); 
-#                 print(1 == nil);
-
-#                 print("----");
-
-#                 print("1" == 1);
-#                 print("1" == "1");
-#                 print("1" == true);
-#                 print("1" == nil);
-
-#                 print("----");
-
-#                 print(true == 1); 
-#                 print(true == "1");
-#                 print(true == true); /*issue*/
-#                 print(true == nil);
-
-#                 print("----");
-
-#                 print(nil == 1);
-#                 print(nil == "1");
-#                 print(nil == true);
-#                 print(nil == nil);
-#             }
-#             """
-            
-#     test_compare_1 = """
-#                     func main() {
-#                         print(true == true); /*issue*/
-#                     }
-
-#                     """
-                    
-#     test_spec_1000 = """
-#     func foo(a) { print(a);
-# }
-# func foo(a,b) { print(a," ",b);
-# }
-# func main() { foo(5);
-# foo(6,7); }
-#                     """
-                    
-#     test_spec_1001 = """
-#                 func foo() {
-# print("hello");
-# /* no explicit return command */
-# }
-# func bar() {
-# return; /* no return value specified */
-# }
-# func main() { var val;
-# val = nil;
-# if (foo() == val && bar() == nil) { print("this should print!"); } }
-#                     """
-                    
-#     test_spec_1002 = """
-#     func foo(x) {
-#   if (x < 0) {
-#     print(x);
-#     return -x;
-#     print("this will not print");
-#   }
-#   print("this will not print either");
-#   return 5*x;
-# }
-# func main() {
-#   print("the positive value is ", foo(-1));
-# }"""
-
-#     test_for_loop = """
-#                     func main() {
-#                         var i;
-#                         for (i = 3; i > 0; i = i - 1) {
-#                         print(i); 
-#                         }
-#                     }
-#                     """
-                    
-                    
-#     test_nil_cmp = """
-#                 func d() {
-#                     print("hello");
-#                 }
-
-#                 func main() {
-#                     print(nil == 5);
-#                     print(d() != nil); /* should be false */
-#                 }
-#                     """
-                    
-#     test_spec_string = """ 
-#     func main() {
-#     var foo;
-#     foo = inputs("Enter a value: ");
-#     print(foo);
-#     }
-#     """
-    
-#     test_nested_for = """
-#                         func main() {
-#                     var x;
-#                     var q;
-#                     for (x = 0; x < 3; x = x + 1) {
-#                         for (q = 0; q < 2; q = q + 1) {
-#                         print(q*q);
-#                         }
-#                     }
-#                     }
-#                     """
-                    
-#     test_nested_ret = """
-#     func foo(a) {
-#   if (a != 1) {
-#     if (a != 2) {
-#       var i;
-#       for (i = 0; i < 15; i = i + 1) {
-#         if (i == a) {
-#           return "oh";
-#         }
-#       }
-#     }
-#   }
-# }
-
-# func loop1() {
-#   return loop2();
-# }
-# func loop2() {
-#   return loop3();
-# }
-
-# func loop3() {
-#   return 5;
-# }
-
-# func main() {
-#   var a;
-#   a = 10;
-  
-#   print(foo(a));
-#   print(loop1());
-# }
-#     """
-    
-#     test_compare_more = """
-#                 func main () {
-#                     print("1" != 1);
-#                     print(true != 1);
-
-#                 }
-#                         """
-                        
-                        
-#     test_compare = """
-#             func main() {
-#                 print(1 >= 1);
-#                 print(1 == "1");
-#                 print(1 == true); 
-#                 print(1 == nil);
-
-#                 print("----");
-
-#                 print("1" == 1);
-#                 print("1" == "1");
-#                 print("1" == true);
-#                 print("1" == nil);
-
-#                 print("----");
-
-#                 print(true == 1); 
-#                 print(true == "1");
-#                 print(true == true); /*issue*/
-#                 print(true == nil);
-
-#                 print("----");
-
-#                 print(nil == 1);
-#                 print(nil == "1");
-#                 print(nil == true);
-#                 print(nil == nil);
-#             }
-#             """
-
-#     test_random = """
-#     func main() {
-#         var x;
-#     for (x=0; x < 2; x = x+1) {
-#         var x;
-#         x = -1;
-#         print(x);
-#     }
-#     print(x);
-#     }
-#                        """
-                       
-#     test_if_return = """
-#         func foo(c) { 
-#             if (c == 10) {
-#                 return 5;
-#             }
-#             else {
-#                 return 3;
-#             }
-#         }
-
-#         func main() {
-#             print(foo(10));
-#             print(foo(11));
-#         }
-#         """
-        
-#     testrandom3 = """
-# func main() {
-#   var s;
-#   var n;
-#   s = inputs();
-#   n = inputi();
-
-#   print(s == n);
-#   print(s == nil);
-#   print(n == nil);
-#   print(s == "1");
-
-#   print(s != n);
-#   print(s != nil);
-#   print(n != nil);
-#   print(s != "1");
-
-# }
-
-
-#                 """
-
-######################################### Proj 2 Test Cases 
-
-# def main():
-
-#     test_static_scoping = """
-# func foo(c) { 
-#   if (c == 10) {
-#     c = "hi";  /* reassigning c from the outer-block */
-#     print(c);  /* prints "hi" */
-#   }
-#   print(c); /* prints “hi” */
-# }
-
-# func main() {
-#   var c;
-#   c = 10;
-#   foo(c);
-#   print(c);
-# }
-#     """
-    
-#     test_bad = """
-#             func main() {
-#                 print("Hello");
-#                 return true >= true;
-#             }
-#                 """
-                
-    
-    
-#     test_ret_11 = """
-#         func main() {
-#             var x;
-#             x = 5;
-#             if (x == 5) {
-#                 print("Inside if pre return");
-#                 return;
-#                 print("Inside if post return");
-#             }
-#             print("Outside if");
-#         }
-#          """
-         
-        
-#     test_dup = """
-#             func main() { 
-#              var a;
-#              var a;
-#         }
-    
-    
-    
-#                 """
-                
-                
-#     test_factorial = """
-#         func main() {
-#   print(fact(5));
-# }
-
-# func fact(n) {
-#   if (n <= 1) { return 1; }
-#   return n * fact(n-1);
-# }
-#         """
-
-
-####################### proj 3 test cases ##########################
-
-# def main():
-    
-#     test_ret1 = """
-#         func main() : int {
-#             print(foo());
-#         }
-#         func foo() : int {
-#             return 1;
-#         }  
-#         """
-        
-#     test_print = """
-#                 func main() : void {
-#                     print(5);
-#                 }
-#                 """
-                       
-#     interpreter = Interpreter()
-#     interpreter.run(test_print)
-
-
-# if __name__ == "__main__":
-#     main()
-    
-    
-    # import os
-    # directory = '/Users/ricardovarelatellez/Downloads/v2/tests'
-
-    # # Loop through all files in the specified directory
-    # for filename in os.listdir(directory):
-    #     file_path = os.path.join(directory, filename)
-    #     if os.path.isfile(file_path):
-    #         print(f"Processing file: {file_path}")
-    #         with open(file_path, 'r') as file:
-    #             content = file.read()
-    #             # Run the interpreter on the file content
-    #             interpreter.run(content)  
-          
-    #interpreter.run(test_compare)
-            
-
-        
-  
-        
-# def main():
-#     interpreter = Interpreter()
-    
-#     with open('./test.br', 'r') as f:
-#         program = f.read()
-        
-#     interpreter.run(program)
-    
-# if __name__ == '__main__':
-#     main()
-
+                )
+        return evaluate
@@ -1,25 +1,635 @@
+import sys
 from intbase import InterpreterBase, ErrorType
 from brewparse import parse_program
+
+# opcodes for the flat bytecode that expressions made of operators are compiled into (every instruction is an (opcode, argument) tuple)
+OP_PUSH_CONST = 0          # push the argument (an int, string, bool or nil literal) onto the value stack
+OP_LOAD_VAR = 1            # push the value of the variable named by the argument
+OP_EVAL = 2                # push the value of the argument node using the tree walker (calls, new, dotted names, == and !=)
+OP_MUL = 3                 # pop two values and push their product
+OP_DIV = 4                 # pop two values and push their quotient
+OP_ADD = 5                 # pop two values and push their sum (or concatenation)
+OP_SUB = 6                 # pop two values and push their difference
+OP_LT = 7                  # pop two values and push op1 < op2
+OP_LE = 8                  # pop two values and push op1 <= op2
+OP_GT = 9                  # pop two values and push op1 > op2
+OP_GE = 10                 # pop two values and push op1 >= op2
+OP_NEG = 11                # negate the value on top of the stack
+OP_NOT = 12                # logical not of the value on top of the stack
+OP_JUMP_IF_FALSE_KEEP = 13 # coerce the top of the stack to bool if its an int, jump to the argument if its false (the value stays as the result of &&)
+OP_JUMP_IF_TRUE_KEEP = 14  # coerce the top of the stack to bool if its an int, jump to the argument if its true (the value stays as the result of ||)
+OP_AND = 15                # pop two values and push op1 && op2
+OP_OR = 16                 # pop two values and push op1 || op2
+OP_AND_BOOL = 17           # OP_AND once both operands were bools (an OP_AND rewrites itself into this, see _op_and)
+OP_OR_BOOL = 18            # OP_OR once both operands were bools
+OP_NOT_BOOL = 19           # OP_NOT once its operand was a bool
+
+# opcode of every binary operator the compiler lowers
+_BINARY_OPCODES = {'*': OP_MUL, '/': OP_DIV, '+': OP_ADD, '-': OP_SUB, '<': OP_LT, '<=': OP_LE, '>': OP_GT, '>=': OP_GE}
+
+# a variable (or a field of a struct instance): its current value and its declared type
+class Variable:
+    __slots__ = ('value', 'type')
+
+    def __init__(self, value, type):
+        self.value = value
+        self.type = type
+
+    # printing a struct prints its fields the same way they looked when every variable was a {'value': ..., 'type': ...} dict
+    def __repr__(self):
+        return repr({'value': self.value, 'type': self.type})
+
+
+# the built in types (every other type name has to be a struct)
+_PRIMITIVE_TYPES = frozenset({'int', 'string', 'bool'})
+
+# default value of each primitive type, for new variables and fields and for a function that ends without a return statement (structs and void give nil)
+_DEFAULT_VALUES = {'int': 0, 'bool': False, 'string': ""}
+
+# the python type of the values of each primitive type (a value of exactly that type needs no checks or coercion)
+_PYTHON_TYPES = {'int': int, 'bool': bool, 'string': str}
+
+# what a statement gives back when the function has to return nil
+# it is an object that can't be a brewin value, so a function returning the string "nil" isn't mistaken for it (checked with is)
+_RETURN_NIL = object()
+
+# an expression that has run this many times through the bytecode loop is turned into a python function (see ExpressionWriter)
+_HOT_EXPRESSION_COUNT = 100
+
+# a function that has been called this many times gets its own python function for binding its arguments and running its body (see FunctionWriter)
+_HOT_CALL_COUNT = 100
+
+# && and || nested deeper than this (in the second operand) stay in the bytecode loop (every level is one more indent in the python source)
+_MAX_WRITER_INDENT = 50
+
+# python operator for each arithmetic and comparison opcode (the operands are checked to be ints, or strings for +, first)
+_PY_OPERATORS = {OP_MUL: '*', OP_DIV: '//', OP_ADD: '+', OP_SUB: '-', OP_LT: '<', OP_LE: '<=', OP_GT: '>', OP_GE: '>='}
+
+# nodes that keep their elem_type for good (unlike 'pure' and 'vm' nodes, which turn into something else after they run), so generated code can call their handler directly
+_FIXED_ELEM_TYPES = frozenset({'var', 'fcall', 'new', 'nil', '==', '!='})
+
+
+# writes the source of a python function that does the same thing as the opcodes of a compiled expression
+# every value on the stack becomes a python local (t0, t1, ...) and every opcode becomes inline python with its type check,
+# so CPython runs the whole expression without going through the bytecode loop and the handler methods
+class ExpressionWriter:
+
+    def __init__(self, expr_dispatch):
+        # lines of the python function being written
+        self.lines = []
+        self.indent = 1
+        self.max_indent = 1
+        self.num_temps = 0
+        # names the generated code reads from its globals (the nodes it hands back to the tree walker)
+        self.constants = dict()
+        # the interpreter's elem_type -> handler table, and the global name given to each handler used so far
+        self.expr_dispatch = expr_dispatch
+        self.handler_names = dict()
+        # the python names/literals that are known to hold an int (arithmetic on two of them needs no type checks)
+        self.int_values = set()
+
+    # the function takes the scope list of the function that is running
+    def write_function(self, code):
+        stack = []
+        self.write_code(code, 0, len(code), stack)
+        self.emit(f"return {stack[-1]}")
+        return "def brewin_expression(scopes):\n" + "\n".join(self.lines) + "\n"
+
+    def emit(self, line):
+        self.lines.append("    " * self.indent + line)
+
+    def new_temp(self):
+        self.num_temps += 1
+        return f"t{self.num_temps - 1}"
+
+    # write the instructions from start up to (not including) end, the stack holds the python names/literals of the values
+    def write_code(self, code, start, end, stack):
+        ip = start
+        while ip < end:
+            op, arg = code[ip]
+            ip += 1
+            if op == OP_PUSH_CONST:
+                if type(arg) is int:
+                    self.int_values.add(repr(arg))
+                stack.append(repr(arg))
+            elif op == OP_LOAD_VAR:
+                stack.append(self.write_load(arg))
+            elif op == OP_EVAL:
+                stack.append(self.write_evaluate(arg))
+            elif op in _PY_OPERATORS:
+                operand2 = stack.pop()
+                operand1 = stack.pop()
+                value = self.new_temp()
+                # two ints: nothing can go wrong with the types (the result of arithmetic is an int too)
+                if operand1 in self.int_values and operand2 in self.int_values:
+                    self.emit(f"{value} = {operand1} {_PY_OPERATORS[op]} {operand2}")
+                    if op < OP_LT:
+                        self.int_values.add(value)
+                    stack.append(value)
+                    continue
+                # an attempt to compare a void type (e.g., the return of print()) to any other type must result in an error of ErrorType.TYPE_ERROR.
+                if op >= OP_LT:
+                    self.emit(f"if {operand1} == 'void' or {operand2} == 'void':")
+                    self.emit("    _error(ErrorType.TYPE_ERROR, \"Can't compare void type\")")
+                # strings can only be concatenated
+                if op == OP_ADD:
+                    self.emit(f"if type({operand1}) is type({operand2}) is int or type({operand1}) is type({operand2}) is str:")
+                else:
+                    self.emit(f"if type({operand1}) is type({operand2}) is int:")
+                self.emit(f"    {value} = {operand1} {_PY_OPERATORS[op]} {operand2}")
+                self.emit("else:")
+                self.emit("    _type_error()")
+                stack.append(value)
+            elif op == OP_NEG:
+                operand1 = stack.pop()
+                value = self.new_temp()
+                if operand1 in self.int_values:
+                    self.emit(f"{value} = -{operand1}")
+                    self.int_values.add(value)
+                    stack.append(value)
+                    continue
+                self.emit(f"if type({operand1}) is int:")
+                self.emit(f"    {value} = -{operand1}")
+                self.emit("else:")
+                self.emit("    _type_error()")
+                stack.append(value)
+            elif op == OP_NOT or op == OP_NOT_BOOL:
+                value = self.write_coercion(stack.pop())
+                self.emit(f"if type({value}) is bool:")
+                self.emit(f"    {value} = not {value}")
+                self.emit("else:")
+                self.emit("    _type_error()")
+                stack.append(value)
+            # the second operand (up to the jump target) only runs when the first one doesn't decide the result
+            elif op == OP_JUMP_IF_FALSE_KEEP or op == OP_JUMP_IF_TRUE_KEEP:
+                value = self.write_coercion(stack.pop())
+                # the first operand has to be a bool before the second one is even evaluated
+                self.emit(f"if type({value}) is not bool:")
+                self.emit("    _type_error()")
+                self.emit(f"if {value} is not {op == OP_JUMP_IF_TRUE_KEEP}:")
+                self.indent += 1
+                self.max_indent = max(self.max_indent, self.indent)
+                # the && / || at the end of the range leaves its result on top of this stack
+                inner_stack = [value]
+                self.write_code(code, ip, arg, inner_stack)
+                self.emit(f"{value} = {inner_stack[-1]}")
+                self.indent -= 1
+                stack.append(value)
+                ip = arg
+            elif op == OP_AND or op == OP_AND_BOOL or op == OP_OR or op == OP_OR_BOOL:
+                operand2 = self.write_coercion(stack.pop())
+                operand1 = stack.pop()
+                value = self.new_temp()
+                self.emit(f"if type({operand1}) is type({operand2}) is bool:")
+                self.emit(f"    {value} = {operand1} {'and' if op == OP_AND or op == OP_AND_BOOL else 'or'} {operand2}")
+                self.emit("else:")
+                self.emit("    _type_error()")
+                stack.append(value)
+
+    # hand a node back to the tree walker (straight to its handler if its elem_type can't change)
+    def write_evaluate(self, node):
+        node_name = f"n{len(self.constants)}"
+        self.constants[node_name] = node
+        value = self.new_temp()
+        if node.elem_type in _FIXED_ELEM_TYPES:
+            if node.elem_type not in self.handler_names:
+                handler_name = f"h{len(self.handler_names)}"
+                self.handler_names[node.elem_type] = handler_name
+                self.constants[handler_name] = self.expr_dispatch[node.elem_type]
+            self.emit(f"{value} = {self.handler_names[node.elem_type]}({node_name})")
+        else:
+            self.emit(f"{value} = _evaluate({node_name})")
+        return value
+
+    # read a variable into a new temporary (the innermost scope that has the variable holds its value)
+    # the innermost scope is checked on its own first since it usually is the function's only scope
+    def write_load(self, var_name):
+        value = self.new_temp()
+        self.emit(f"{value} = scopes[-1].get({var_name!r})")
+        self.emit(f"if {value} is None:")
+        self.emit(f"    {value} = _find_variable({var_name!r})")
+        self.emit(f"    if {value} is None:")
+        self.emit(f"        _error(ErrorType.NAME_ERROR, {f'Variable {var_name} has not been defined'!r})")
+        self.emit(f"{value} = {value}.value")
+        return value
+
+    # copy a value into a new temporary and turn it into a bool if its an int (0 is false, any other int is true)
+    def write_coercion(self, operand):
+        value = self.new_temp()
+        self.emit(f"{value} = {operand}")
+        self.emit(f"if type({value}) is int:")
+        self.emit(f"    {value} = {value} != 0")
+        return value
+
  
+# writes the source of a python function that runs a whole for loop (its init, condition, update and body)
+# only loops that don't define variables or return are written, so every name they use is the same Variable for the whole loop:
+# the variables are looked up once when the loop starts and passed in (v0, v1, ...), and the scopes of the iterations are never pushed since they would stay empty
+# their values are kept in python locals (x0, x1, ...) while the loop runs, and the assigned ones are stored back into their Variables before anything else could read them
+# anything that isn't an assignment, if, for, call, literal, variable or compiled operator is handed back to the tree walker
+class LoopWriter(ExpressionWriter):
+
+    def __init__(self, expr_dispatch, resolve):
+        super().__init__(expr_dispatch)
+        # finds the Variable a name refers to when the loop starts (None if there isn't one)
+        self.resolve = resolve
+        # name -> python parameter for every variable the loop reads or assigns, and the Variables they were found as
+        self.variables = dict()
+        self.found = []
+        # set when something in the loop can't be written
+        self.failed = False
+        # the python parameters of the variables the loop assigns to
+        self.assigned = []
+
+    # a loop can be written if everything in it is an assignment to a plain name, an if, a for or a call (with the same in their bodies)
+    @staticmethod
+    def can_write(statement_node):
+        work = [statement_node]
+        while work:
+            statement = work.pop()
+            if statement.elem_type == '=':
+                if statement.dot_path is not None:
+                    return False
+            elif statement.elem_type == 'for':
+                work.append(statement.init)
+                work.append(statement.update)
+                work.extend(statement.statements)
+            elif statement.elem_type == 'if':
+                work.extend(statement.statements)
+                if statement.else_statements is not None:
+                    work.extend(statement.else_statements)
+            elif statement.elem_type != 'fcall':
+                return False
+        return True
+
+    # the function takes the Variables of the loop in the order of self.found (None if a variable can't be found or isn't a primitive that can be assigned to)
+    def write_function(self, statement_node):
+        # every variable that is assigned has to be found before any code is written so it can be stored back at every call
+        work = [statement_node]
+        while work:
+            statement = work.pop()
+            if statement.elem_type == '=':
+                parameter = self.variable(statement.name)
+                if parameter is None:
+                    return None
+                if parameter not in self.assigned:
+                    self.assigned.append(parameter)
+            elif statement.elem_type == 'for':
+                work.append(statement.init)
+                work.append(statement.update)
+                work.extend(statement.statements)
+            elif statement.elem_type == 'if':
+                work.extend(statement.statements)
+                if statement.else_statements is not None:
+                    work.extend(statement.else_statements)
+        if not self.write_statement(statement_node) or self.failed or self.max_indent > _MAX_WRITER_INDENT:
+            return None
+        self.write_store()
+        self.emit("return None")
+        parameters = ", ".join(f"v{index}" for index in range(len(self.found)))
+        # the values of every variable the loop uses are read once at the start
+        loads = [f"    x{index} = v{index}.value" for index in range(len(self.found))]
+        return f"def brewin_loop({parameters}):\n" + "\n".join(loads + self.lines) + "\n"
+
+    # store the values of the assigned variables back into their Variables (anything handed back to the tree walker might read them)
+    def write_store(self):
+        for parameter in self.assigned:
+            self.emit(f"{parameter}.value = x{parameter[1:]}")
+
+    def write_evaluate(self, node):
+        self.write_store()
+        return super().write_evaluate(node)
+
+    # the python parameter holding the Variable of a name
+    def variable(self, var_name):
+        if var_name not in self.variables:
+            variable = self.resolve(var_name)
+            if variable is None:
+                return None
+            self.variables[var_name] = f"v{len(self.found)}"
+            self.found.append(variable)
+        return self.variables[var_name]
+
+    def write_load(self, var_name):
+        parameter = self.variable(var_name)
+        if parameter is None:
+            self.failed = True
+            return "None"
+        # nothing can change the local while the expression that reads it is running
+        value = f"x{parameter[1:]}"
+        # a variable declared as an int always holds an int (every assignment to it is checked)
+        if self.found[int(parameter[1:])].type == 'int':
+            self.int_values.add(value)
+        return value
+
+    # write an expression and give back the python name/literal holding its value
+    def write_value(self, expression):
+        elem_type = expression.elem_type
+        if elem_type == 'int' or elem_type == 'string' or elem_type == 'bool':
+            if elem_type == 'int':
+                self.int_values.add(repr(expression.val))
+            return repr(expression.val)
+        if elem_type == 'var' and expression.dot_path is None:
+            return self.write_load(expression.name)
+        # operators that were compiled into opcodes (and maybe already into their own python function)
+        if elem_type == 'vm' or elem_type == 'python':
+            stack = []
+            self.write_code(expression.code, 0, len(expression.code), stack)
+            return stack[-1]
+        return self.write_evaluate(expression)
+
+    def indent_block(self):
+        self.indent += 1
+        self.max_indent = max(self.max_indent, self.indent)
+
+    def write_block(self, statements):
+        self.indent_block()
+        self.emit("pass")
+        for statement in statements:
+            if not self.write_statement(statement):
+                return False
+        self.indent -= 1
+        return True
+
+    # write one statement, False if the loop can't be written after all
+    def write_statement(self, statement):
+        if statement.elem_type == '=':
+            return self.write_assignment(statement)
+        # the value of a call used as a statement is thrown away
+        if statement.elem_type == 'fcall':
+            node_name = f"n{len(self.constants)}"
+            self.constants[node_name] = statement
+            self.write_store()
+            self.emit(f"_call({node_name})")
+            return True
+        if statement.elem_type == 'if':
+            condition = self.write_condition(statement.condition, "condition of the if statement does not evaluate to a boolean")
+            self.emit(f"if {condition}:")
+            if not self.write_block(statement.statements):
+                return False
+            if statement.else_statements is not None:
+                self.emit("else:")
+                if not self.write_block(statement.else_statements):
+                    return False
+            return True
+        # for
+        if not self.write_assignment(statement.init):
+            return False
+        self.emit("while True:")
+        self.indent_block()
+        condition = self.write_condition(statement.condition, "condition of the for loop does not evaluate to a boolean")
+        self.emit(f"if not {condition}:")
+        self.emit("    break")
+        self.indent -= 1
+        if not self.write_block(statement.statements):
+            return False
+        self.indent_block()
+        if not self.write_assignment(statement.update):
+            return False
+        self.indent -= 1
+        return True
+
+    # the condition of an if or for has to be a bool (an int is coerced)
+    def write_condition(self, expression, message):
+        condition = self.write_coercion(self.write_value(expression))
+        self.emit(f"if type({condition}) is not bool:")
+        self.emit(f"    _error(ErrorType.TYPE_ERROR, {message!r})")
+        return condition
+
+    # the checks of do_assignment for a variable declared as an int, bool or string (other variables aren't written)
+    def write_assignment(self, statement):
+        parameter = self.variable(statement.name)
+        if parameter is None or self.found[int(parameter[1:])].type not in _PRIMITIVE_TYPES:
+            return False
+        variable_type = self.found[int(parameter[1:])].type
+        value = self.new_temp()
+        operand = self.write_value(statement.expression)
+        self.emit(f"{value} = {operand}")
+        # an int assigned to an int variable needs no check
+        if variable_type == 'int' and operand in self.int_values:
+            self.emit(f"x{parameter[1:]} = {value}")
+            return True
+        if variable_type == 'bool':
+            # assigning an integer value/variable to a boolean variable
+            self.emit(f"if type({value}) is int:")
+            self.emit(f"    {value} = {value} != 0")
+            self.emit(f"elif type({value}) is not bool:")
+        else:
+            self.emit(f"if type({value}) is not {'int' if variable_type == 'int' else 'str'}:")
+        self.emit("    _error(ErrorType.TYPE_ERROR, 'type of variable and value are incompatible')")
+        self.emit(f"x{parameter[1:]} = {value}")
+        return True
+
+
+# writes the source of a python function that does what run_func does for one brewin function
+# the names, types and checks of the parameters and of the return value are written into the code, and the statements of the body are called one after the other
+# assignments, definitions and calls never give back a return value, so only if, for and return statements have their result checked
+class FunctionWriter:
+
+    def __init__(self):
+        # lines of the python function being written
+        self.lines = []
+        self.indent = 1
+        # names the generated code reads from its globals (the statement nodes and the methods that run them)
+        self.constants = dict()
+
+    def emit(self, line):
+        self.lines.append("    " * self.indent + line)
+
+    def constant(self, value):
+        name = f"n{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    # stmt_dispatch is the interpreter's elem_type -> method table
+    def write_function(self, func_def, stmt_dispatch):
+        self.emit("local_scope = {}")
+        for index, (parameter_name, parameter_type) in enumerate(zip(func_def.param_names, func_def.param_types)):
+            self.write_parameter(index, parameter_name, parameter_type)
+        self.emit("_push_frame(local_scope)")
+        for statement in func_def.statements:
+            handler = stmt_dispatch.get(statement.elem_type)
+            if handler is None:
+                continue
+            node = self.constant(statement)
+            run = self.constant(handler)
+            if statement.elem_type != 'if' and statement.elem_type != 'for' and statement.elem_type != 'return':
+                self.emit(f"{run}({node})")
+                continue
+            if statement.elem_type == 'return':
+                self.emit(f"_check_return({node}, {func_def.return_type!r})")
+            self.emit(f"result = {run}({node})")
+            self.emit("if result is not None:")
+            self.indent += 1
+            self.write_return(func_def)
+            self.indent -= 1
+        # the function does not have a return statement, return the default value for the function's return type
+        self.emit("_pop_frame()")
+        self.emit(f"return {func_def.default_return!r}")
+        return "def brewin_function(args):\n" + "\n".join(self.lines) + "\n"
+
+    # the same checks run_func does on an argument, for a parameter whose type is known
+    def write_parameter(self, index, parameter_name, parameter_type):
+        argument = f"a{index}"
+        value = f"v{index}"
+        self.emit(f"{argument} = args[{index}]")
+        # check that param type matches argument type when a variable of the calling function is passed
+        self.emit(f"if {argument}.elem_type == 'var' and {argument}.name in _interpreter._function_scope:")
+        self.emit(f"    variable = _interpreter._function_scope[{argument}.name]")
+        if parameter_type == 'bool':
+            # we can pass int to bool
+            self.emit("    if variable.type == 'int':")
+            self.emit(f"        {value} = variable.value != 0")
+            self.emit("    else:")
+            self.emit(f"        if variable.type != 'bool':")
+            self.emit("            _error(ErrorType.TYPE_ERROR, 'target variable and source value are incompatible')")
+            self.emit(f"        {value} = _evaluate({argument})")
+        else:
+            self.emit(f"    if variable.type != {parameter_type!r}:")
+            self.emit("        _error(ErrorType.TYPE_ERROR, 'target variable and source value are incompatible')")
+            self.emit(f"    {value} = _evaluate({argument})")
+        self.emit("else:")
+        self.emit(f"    {value} = _evaluate({argument})")
+        # check that arguments passed match the parameter types (a value of exactly the parameter's type needs no check)
+        python_type = _PYTHON_TYPES.get(parameter_type)
+        if python_type is not None:
+            self.emit(f"if type({value}) is not {python_type.__name__}:")
+            self.indent += 1
+        self.emit(f"if not _is_type_compatible({parameter_type!r}, {value}):")
+        self.emit("    _error(ErrorType.TYPE_ERROR, 'target variable and source value are incompatible')")
+        if parameter_type == 'bool':
+            # passing an integer value/variable to a function that has a boolean formal parameter
+            self.emit(f"{value} = {value} != 0")
+        if python_type is not None:
+            self.indent -= 1
+        self.emit(f"local_scope[{parameter_name!r}] = Variable({value}, {parameter_type!r})")
+
+    # what run_func does with the result of a statement that isn't None
+    def write_return(self, func_def):
+        if func_def.is_void:
+            self.emit("_error(ErrorType.TYPE_ERROR, 'cant return value from void func')")
+        # note a function can return nil so its techincally returning something (ex: return nil; or return;)
+        self.emit("if result is _RETURN_NIL:")
+        self.emit("    return None")
+        # note return has handled popping from stack so need for popping here
+        self.emit(f"if not _is_type_compatible({func_def.return_type!r}, result):")
+        self.emit("    _error(ErrorType.TYPE_ERROR, 'return type and return value are incompatible')")
+        # returning an integer value/variable from a function that has a boolean return type
+        if func_def.return_type == 'bool':
+            self.emit("if type(result) is int:")
+            self.emit("    result = result != 0")
+        self.emit("return result")
+
+
 # Interpreter class derived from interpreter base class
 class Interpreter(InterpreterBase):
+    # the attributes set in __init__ get fixed slots on the instance (InterpreterBase still has its own __dict__ for what it sets)
+    __slots__ = (
+        'call_stack',
+        '_function_scope',
+        '_top_scope',
+        'func_name_to_ast',
+        'struct_tracker',
+        '_error',
+        '_output',
+        '_stmt_dispatch',
+        '_expr_dispatch',
+        '_pure_operations',
+        '_op_handlers',
+        '_vm_stack',
+        '_compiled_operations',
+    )
+
     def __init__(self, console_output=True, inp=None, trace_output=False):
         # call InterpreterBase's constructor
         super().__init__(console_output, inp)
         # call stack will keep track of functions using a last in first out approach, each dict keeps track of things like variables, e.g., a dict that maps variable names to their current value (e.g., { "foo" → 11 })
         self.call_stack = [] 
+        # the scope list of the function on top of the call stack (kept in sync with call_stack so we dont index it on every variable access)
+        self._top_scope = None
+        # the first scope of that list (the parameters and the variables defined directly in the function body)
+        self._function_scope = None
         # store function names (tracker for funcs) in a dictionary
         self.func_name_to_ast = dict()
         # keeps track of structs
         self.struct_tracker = {}
-        # keep track of structs 
-        self.variable_type_tracker = {}
+        # bind the InterpreterBase error method once (super().error builds a new bound method on every call)
+        self._error = self.error
+        # same for output, which every print goes through
+        self._output = self.output
+        # elem_type -> method that runs that kind of statement
+        self._stmt_dispatch = {
+            'vardef': self.do_definition,
+            '=': self.do_assignment,
+            'fcall': self.do_call_statement,
+            'if': self.do_if_statement,
+            'for': self.do_for_loop,
+            'return': self.do_return_statement,
+        }
+        # elem_type -> method that evaluates that kind of expression
+        self._expr_dispatch = {
+            'int': self._eval_const,
+            'string': self._eval_const,
+            'bool': self._eval_const,
+            'nil': self._eval_nil,
+            'fcall': self._eval_fcall,
+            'new': self._eval_new,
+            'var': self._eval_var,
+            '*': self._eval_mul,
+            '/': self._eval_div,
+            '+': self._eval_add,
+            '-': self._eval_sub,
+            '==': self._eval_eq,
+            '!=': self._eval_ne,
+            '<': self._eval_lt,
+            '<=': self._eval_le,
+            '>': self._eval_gt,
+            '>=': self._eval_ge,
+            'neg': self._eval_neg,
+            '!': self._eval_not,
+            '&&': self._eval_and,
+            '||': self._eval_or,
+            'pure': self._eval_pure,
+            'vm': self._eval_vm,
+            'python': self._eval_python,
+        }
+        # operations that don't read variables or call anything themselves
+        self._pure_operations = {'*', '/', '+', '-', '==', '!=', '<', '<=', '>', '>=', 'neg', '!', '&&', '||'}
+        # handler of every opcode, indexed by the opcode (see _eval_vm)
+        self._op_handlers = [
+            self._op_push_const,
+            self._op_load_var,
+            self._op_eval,
+            self._op_mul,
+            self._op_div,
+            self._op_add,
+            self._op_sub,
+            self._op_lt,
+            self._op_le,
+            self._op_gt,
+            self._op_ge,
+            self._op_neg,
+            self._op_not,
+            self._op_jump_if_false_keep,
+            self._op_jump_if_true_keep,
+            self._op_and,
+            self._op_or,
+            self._op_and_bool,
+            self._op_or_bool,
+            self._op_not_bool,
+        ]
+        # value stack of the bytecode loop (see _eval_vm)
+        self._vm_stack = []
+        # operations the bytecode compiler lowers into opcodes (== and != look at the operand nodes themselves so they stay in the tree walker)
+        self._compiled_operations = {'*', '/', '+', '-', '<', '<=', '>', '>=', 'neg', '!', '&&', '||'}
         
         
     # The Interpreter is passed in a program as a list of strings that needs to be interpreted
     def run(self, program):
         # parse program into AST
         ast = parse_program(program)
+        # copy every node's fields into attributes once so evaluating reads expression.op1 instead of expression.dict['op1']
+        self._preprocess_ast(ast)
         # set up a function tracker that keeps track of the func names
         # set up struct tracker that keeps track of the struct names
         self.set_up_struct_tracker(ast)
@@ -27,41 +637,186 @@ class Interpreter(InterpreterBase):
         
         # look for the main function node in AST (will throw error if no main found)
         if ("main", 0) not in self.func_name_to_ast:
-            super().error(ErrorType.NAME_ERROR, "Function main not found")
+            self._error(ErrorType.NAME_ERROR, "Function main not found")
         # get the main func node
         main_func_node = self.func_name_to_ast[("main", 0)]
         # call run func on main function node (remember main func has no args so we say None)
         self.run_func(main_func_node, [])
      
+    # walk the whole AST once and copy each node's fields out of node.dict into plain attributes (node.op1, node.name, node.args, ...)
+    # attribute reads skip hashing the key string on every evaluation, and names and type names are interned so comparing them is a pointer check
+    # (uses a work list instead of recursion so deep expressions can't overflow the Python stack)
+    def _preprocess_ast(self, ast):
+        # every node, parents before their children
+        order = []
+        work = [ast]
+        while work:
+            node = work.pop()
+            order.append(node)
+            # the elem_type strings come from the source text so they are interned too (the dispatch dict and the == checks against literals then match on the pointer)
+            node.elem_type = sys.intern(node.elem_type)
+            for key, value in node.dict.items():
+                if (key == 'name' or key == 'var_type' or key == 'return_type') and value is not None:
+                    value = sys.intern(value)
+                setattr(node, key, value)
+                # visit the child nodes too
+                if type(value) is list:
+                    work.extend(value)
+                elif hasattr(value, 'dict'):
+                    work.append(value)
+        # an assignment to a dotted name (or a dotted variable) keeps the names split up (b.f.i -> ("b", "f", "i"))
+        for node in order:
+            if node.elem_type == '=' or node.elem_type == 'var':
+                # the parts are interned like every other name, so looking them up in the scopes and struct instances matches on the pointer
+                node.dot_path = tuple(sys.intern(part) for part in node.name.split(".")) if "." in node.name else None
+                # the fields after the first name (("f", "i") for b.f.i), so reading a dotted variable doesn't slice the path every time
+                node.field_path = node.dot_path[1:] if node.dot_path is not None else None
+                # where the scope that had the name was the last time (counted back from the innermost scope, see find_scope)
+                node.scope_offset = -1
+            # a for loop is written as a python function the first time it runs (see compile_loop)
+            if node.elem_type == 'for':
+                node.python_loop = None
+            # the function a call runs is looked up the first time it runs (the functions of a program never change)
+            if node.elem_type == 'fcall':
+                node.resolved_func = None
+            # a block only needs its own scope if it defines a variable (a block without a vardef never puts anything in its scope)
+            if node.elem_type == 'for' or node.elem_type == 'if':
+                node.needs_scope = any(statement.elem_type == 'vardef' for statement in node.statements)
+            if node.elem_type == 'if':
+                node.else_needs_scope = node.else_statements is not None and any(statement.elem_type == 'vardef' for statement in node.else_statements)
+        # boolean operations decided by a literal are folded first (see _fold)
+        # an operation whose operands are all literals (or operations on literals) gives the same value every time it runs
+        # it is marked 'pure' so the first time it evaluates without an error its value is saved on the node (see _eval_pure)
+        # walking the list backwards marks the children first
+        for node in reversed(order):
+            self._fold(node)
+            if node.elem_type in self._pure_operations and all(
+                operand.elem_type in ('int', 'string', 'bool', 'nil', 'pure')
+                for operand in (node.dict.get('op1'), node.dict.get('op2')) if operand is not None
+            ):
+                node.pure_operation = node.elem_type
+                node.elem_type = 'pure'
+        # the operators that are an operand of another compiled operator become part of their parent's code
+        inner = set()
+        for node in order:
+            if node.elem_type in self._compiled_operations:
+                inner.add(id(node.op1))
+                if node.elem_type != 'neg' and node.elem_type != '!':
+                    inner.add(id(node.op2))
+        # every other compiled operator is the root of a tree that gets lowered into one flat list of opcodes
+        for node in order:
+            if node.elem_type in self._compiled_operations and id(node) not in inner:
+                code = []
+                self._compile(node, code)
+                node.code = code
+                node.runs = 0
+                node.elem_type = 'vm'
+
+    # fold the boolean operations whose result is known before the program runs (its children are already folded)
+    # true || x and false && x never evaluate x so they become the literal, !true becomes false and !!x becomes x when x is always a bool
+    def _fold(self, node):
+        elem_type = node.elem_type
+        if elem_type != '!' and elem_type != '&&' and elem_type != '||':
+            return
+        operand1 = node.op1
+        # the truth value of a bool or int literal (0 is false, any other int is true)
+        if operand1.elem_type == 'bool' or operand1.elem_type == 'int':
+            operand1_value = operand1.val != 0 if operand1.elem_type == 'int' else operand1.val
+            if elem_type == '!':
+                self._fold_to_literal(node, not operand1_value)
+            elif elem_type == '&&' and operand1_value is False:
+                self._fold_to_literal(node, False)
+            elif elem_type == '||' and operand1_value is True:
+                self._fold_to_literal(node, True)
+        # these operations always give a bool (or an error) so negating them twice gives the same value
+        elif elem_type == '!' and operand1.elem_type == '!' and operand1.op1.elem_type in ('==', '!=', '<', '<=', '>', '>=', '!', '&&', '||'):
+            node.__dict__.update(operand1.op1.__dict__)
+
+    # turn a node into a bool literal in place (the parent keeps pointing at the same node)
+    def _fold_to_literal(self, node, value):
+        node.elem_type = 'bool'
+        node.val = value
+        node.dict = {'val': value}
+
+    # lower an expression so that running its opcodes leaves its value on top of the stack
+    # operands are pushed in the same order the tree walker evaluates them, so errors and calls happen in the same order
+    def _compile(self, node, code):
+        elem_type = node.elem_type
+        if elem_type == 'int' or elem_type == 'string' or elem_type == 'bool':
+            code.append((OP_PUSH_CONST, node.val))
+        elif elem_type == 'nil':
+            code.append((OP_PUSH_CONST, None))
+        elif elem_type == 'var' and node.dot_path is None:
+            code.append((OP_LOAD_VAR, node.name))
+        elif elem_type in _BINARY_OPCODES:
+            self._compile(node.op1, code)
+            self._compile(node.op2, code)
+            code.append((_BINARY_OPCODES[elem_type], None))
+        elif elem_type == 'neg':
+            self._compile(node.op1, code)
+            code.append((OP_NEG, None))
+        elif elem_type == '!':
+            self._compile(node.op1, code)
+            code.append((OP_NOT, None))
+        # op1 JUMP_IF_FALSE_KEEP end; op2; AND; end: (the second operand is skipped when the first one decides the result)
+        elif elem_type == '&&' or elem_type == '||':
+            self._compile(node.op1, code)
+            jump = len(code)
+            code.append(None)
+            self._compile(node.op2, code)
+            code.append((OP_AND if elem_type == '&&' else OP_OR, None))
+            code[jump] = (OP_JUMP_IF_FALSE_KEEP if elem_type == '&&' else OP_JUMP_IF_TRUE_KEEP, len(code))
+        # anything else (calls, new, dotted names, == and !=, operations on literals) is evaluated by the tree walker
+        else:
+            code.append((OP_EVAL, node))
+
     # struct tracker is a dictionary that keeps track of struct names   
     def set_up_struct_tracker(self, ast):
         # loop through struct definition nodes 
-        for struct_def in ast.dict['structs']:
-            struct_name = struct_def.dict['name']
+        for struct_def in ast.structs:
+            struct_name = struct_def.name
             # map struct name to structs node
             self.struct_tracker[struct_name] = struct_def
+            # map every field name to its type so checking a field after a dot is one lookup
+            struct_def.field_types = {field.name: field.var_type for field in struct_def.fields}
+            # (name, default value, type) of every field, worked out the first time an instance is made (see do_new_struct_instance)
+            struct_def.field_defaults = None
         
         
     # function tracker is a dictionary that keeps track of function names
     def set_up_function_tracker(self, ast):
+        struct_tracker = self.struct_tracker
         # loop through function Nodes
-        for func_def in ast.dict['functions']:
-            name = func_def.dict['name']
+        for func_def in ast.functions:
+            name = func_def.name
             # 'args' which maps to a list of Argument nodes
-            number_of_params = len(func_def.dict['args'])
+            number_of_params = len(func_def.args)
             
             # check that parameters are valid (if struct is a parameter it must be a struct that exists)
-            for param in func_def.dict['args']:
-                # check if param is a struct type
-                #print(param.dict['var_type'])
-                if param.dict['var_type'] != 'int' and param.dict['var_type'] != 'string' and param.dict['var_type'] != 'bool':
-                    if param.dict['var_type'] not in self.struct_tracker:
-                        super().error(ErrorType.TYPE_ERROR, f" Invalid type for formal parameter {param.dict['name']} in function {name}")
+            for param in func_def.args:
+                if param.var_type not in _PRIMITIVE_TYPES and param.var_type not in struct_tracker:
+                    self._error(ErrorType.TYPE_ERROR, f" Invalid type for formal parameter {param.name} in function {name}")
                  
             # chekc that the function has a valid return type       
-            if func_def.dict['return_type'] != 'void' and func_def.dict['return_type'] != 'string' and func_def.dict['return_type'] != 'int' and func_def.dict['return_type'] != 'bool' and func_def.dict['return_type'] not in self.struct_tracker:
-                super().error(ErrorType.TYPE_ERROR, f" Invalid return type for func {name}")
-
+            if func_def.return_type != 'void' and func_def.return_type not in _PRIMITIVE_TYPES and func_def.return_type not in struct_tracker:
+                self._error(ErrorType.TYPE_ERROR, f" Invalid return type for func {name}")
+
+            # everything run_func needs on every call is worked out once here (the parameters as flat tuples, if its void and what it returns by default)
+            func_def.param_names = tuple(param.name for param in func_def.args)
+            func_def.param_types = tuple(param.var_type for param in func_def.args)
+            func_def.is_void = func_def.return_type == 'void'
+            func_def.default_return = _DEFAULT_VALUES.get(func_def.return_type)
+            # a hot function is run by its own python function (see compile_function)
+            func_def.calls = 0
+            func_def.python_function = None
+            # the return statements directly in the body get checked before they run (see check_return), what those checks need is worked out here
+            for statement in func_def.statements:
+                if statement.elem_type == 'return':
+                    expression = statement.expression
+                    # returning a variable (it might hold a struct of the wrong type)
+                    statement.returns_var = expression is not None and expression.elem_type == 'var'
+                    # returning nil from a void function or one that returns a primitive is always an error
+                    statement.returns_bad_nil = expression is not None and expression.elem_type == 'nil' and (func_def.is_void or func_def.return_type in _PRIMITIVE_TYPES)
             
             # this line adds the function name and number of args as a key to func_name_to_ast dictionary (e.g. key (function name, # of params))
             self.func_name_to_ast[(name, number_of_params)] = func_def
@@ -69,166 +824,164 @@ class Interpreter(InterpreterBase):
         
     # find a function in function tracker by name and len of args 
     def get_func_by_name_and_param_len(self, name, args):
-        if (name, args) not in self.func_name_to_ast:
-            super().error(ErrorType.NAME_ERROR, f"Function {name} not found")
-        return self.func_name_to_ast[(name, args)]
+        func_def = self.func_name_to_ast.get((name, args))
+        if func_def is None:
+            self._error(ErrorType.NAME_ERROR, f"Function {name} not found")
+        return func_def
         
     # Execute each statement inside the main function (at this point we pass in the arg values)    
     def run_func(self, func_node, args):
         # remember at this point we have verified the function exists
         
+        # a function that was called a lot binds its arguments and runs its body through the python function written for it
+        if func_node.python_function is not None:
+            return func_node.python_function(args)
+        func_node.calls += 1
+        if func_node.calls == _HOT_CALL_COUNT:
+            func_node.python_function = self.compile_function(func_node)
+        
         # new local scope for function (it keeps track of variable names with a list of dictionaries, note we add a new dictionary for every if or for loop)
         # make a dict for the variables in the func
         local_scope = dict()        
         
         # match arg nodes with the paramters
-        for arg_var_node, arg_value in zip(func_node.dict['args'], args):
-            # get the parameter type
-            parameter_type = arg_var_node.dict['var_type']
-            
+        for parameter_name, parameter_type, arg_value in zip(func_node.param_names, func_node.param_types, args):
             coerce = False
             if arg_value.elem_type == 'var':
-                arg_value_name = arg_value.dict['name']
+                arg_value_name = arg_value.name
                 # check that param type matches argument type
-                if arg_value_name in self.call_stack[-1][0]:
+                arg_variable = self._function_scope.get(arg_value_name)
+                if arg_variable is not None:
                     # we can pass int to bool
-                    if (parameter_type == 'bool' and self.call_stack[-1][0][arg_value_name]['type'] == 'int'):
+                    if (parameter_type == 'bool' and arg_variable.type == 'int'):
                         coerce = True
                         pass
-                    elif (self.call_stack[-1][0][arg_value_name]['type'] != parameter_type):
-                        super().error(ErrorType.TYPE_ERROR, f"target variable and source value are incompatible")
+                    elif (arg_variable.type != parameter_type):
+                        self._error(ErrorType.TYPE_ERROR, f"target variable and source value are incompatible")
 
             # coerce int to bool 
-            if (coerce == True):
-                evaluated_arg_value = self.int_to_bool_coercion(self.call_stack[-1][0][arg_value_name]['value'])
+            if coerce:
+                evaluated_arg_value = self._function_scope[arg_value_name].value != 0
             else:
             # Note we can pass in an expression as an arg value (ex: -1)
                 evaluated_arg_value = self.do_evaluate_expression(arg_value)
             
 
-            # check that arguments passed match the parameter types
-            if self.is_type_compatible(parameter_type, evaluated_arg_value) == False:
-                super().error(ErrorType.TYPE_ERROR, f"target variable and source value are incompatible")
-            
-            # passing an integer value/variable to a function that has a boolean formal parameter  
-            if parameter_type == 'bool' and isinstance(evaluated_arg_value, int):
-                evaluated_arg_value = self.int_to_bool_coercion(evaluated_arg_value)
+            # the value already has the type of the parameter (the usual case) so there is nothing to check or coerce
+            if _PYTHON_TYPES.get(parameter_type) is not type(evaluated_arg_value):
+                # check that arguments passed match the parameter types
+                if not self.is_type_compatible(parameter_type, evaluated_arg_value):
+                    self._error(ErrorType.TYPE_ERROR, f"target variable and source value are incompatible")
+                
+                # passing an integer value/variable to a function that has a boolean formal parameter  
+                if parameter_type == 'bool' and type(evaluated_arg_value) is int:
+                    evaluated_arg_value = evaluated_arg_value != 0
             
             # match parameter name with argument value and type
-            local_scope[arg_var_node.dict['name']] = {
-                'value': evaluated_arg_value,
-                'type': parameter_type
-            }
+            local_scope[parameter_name] = Variable(evaluated_arg_value, parameter_type)
         
         # call_stack is our global variable that keeps track of function scopes
         # We push the functions local_scope onto the stack
-        self.call_stack.append([local_scope])
+        self.push_frame(local_scope)
         
+        return_type_of_func = func_node.return_type
         # Execute each statement inside the function
-        for statement in func_node.dict['statements']:
+        for statement in func_node.statements:
             # result is the return statment
-            
-            # check if struct return type matches the returned struct type
-            if (statement.elem_type == 'return'):
-                if (statement.dict['expression'] != None):
-                    #print("EXPRESSION", statement.dict['expression'])
-                    if (statement.dict['expression'].elem_type == 'var'):
-                        arg_value_name = statement.dict['expression'].dict['name']
-                        if arg_value_name in self.call_stack[-1][0]:
-                            if self.call_stack[-1][0][arg_value_name]['type'] in self.struct_tracker:
-                               if self.call_stack[-1][0][arg_value_name]['type'] != func_node.dict['return_type']:
-                                super().error(ErrorType.TYPE_ERROR, f"target variable and source value are incompatible")
-             
-            # check if we return nil from primitive
-            if (statement.elem_type == 'return'):
-                if (statement.dict['expression'] != None):
-                    if statement.dict['expression'].elem_type == 'nil':
-                    #if statement.dict['expression'] ==
-                        #print(func_node.dict['return_type'])
-                        if func_node.dict['return_type'] == 'string' or func_node.dict['return_type'] == 'int' or func_node.dict['return_type'] == 'bool' or func_node.dict['return_type'] == 'void':
-                            super().error(ErrorType.TYPE_ERROR, f"cant return nil for primitive return type")
-                
+            if statement.elem_type == 'return':
+                self.check_return(statement, return_type_of_func)
             
             result = self.run_statement(statement)
             
-            if(func_node.dict['return_type'] == 'void') and result != None:
-                super().error(ErrorType.TYPE_ERROR, f"cant return value from void func")
+            if func_node.is_void and result is not None:
+                self._error(ErrorType.TYPE_ERROR, f"cant return value from void func")
                 
                 
             # note a function can return nil so its techincally returning something (ex: return nil; or return;)
-            if (result == "nil"):
+            if result is _RETURN_NIL:
                 return None
             
                 
             # we have a return statement in the function
-            if (result != None):
+            if (result is not None):
                 # note return has handled popping from stack so need for popping here       
-                return_type_of_func = func_node.dict['return_type']
-                # print(return_type_of_func)
-                # print("result", result)
-                if (self.is_type_compatible(return_type_of_func, result)) == False:
-                    super().error(ErrorType.TYPE_ERROR, f"return type and return value are incompatible")
+                if not self.is_type_compatible(return_type_of_func, result):
+                    self._error(ErrorType.TYPE_ERROR, f"return type and return value are incompatible")
                     
                 # returning an integer value/variable from a function that has a boolean return type
-                if return_type_of_func == 'bool' and isinstance(result, int):
-                    result = self.int_to_bool_coercion(result)
+                if return_type_of_func == 'bool' and type(result) is int:
+                    result = result != 0
                 
                 return result
             
         # the function does not have a return statement, return the default value for the function's return type upon the function's completion
-        return_type = func_node.dict['return_type']
-        
-        #print(return_type)
-        
-        # return type maps to a string holding the return type of the function
-        if (return_type == 'int'):
-            default_value = 0
-        elif (return_type == 'bool'):
-            default_value = False
-        elif (return_type == 'string'):
-            default_value = ""
-        # we have a user defined structure
-        else:
-            # we have a user defined structure to return
-            #else: 
-            default_value = None
-        
-        
         # we dont have something to return (so we just pop scope)
+        self.pop_frame()
+        return func_node.default_return
+    
+    # write the python function that binds the arguments of a function and runs its body (see FunctionWriter)
+    def compile_function(self, func_node):
+        writer = FunctionWriter()
+        source = writer.write_function(func_node, self._stmt_dispatch)
+        namespace = dict(
+            writer.constants,
+            _interpreter=self,
+            _error=self._error,
+            ErrorType=ErrorType,
+            Variable=Variable,
+            _RETURN_NIL=_RETURN_NIL,
+            _evaluate=self.do_evaluate_expression,
+            _is_type_compatible=self.is_type_compatible,
+            _check_return=self.check_return,
+            _push_frame=self.push_frame,
+            _pop_frame=self.pop_frame,
+        )
+        exec(compile(source, "<brewin function>", "exec"), namespace)
+        return namespace['brewin_function']
+
+    # a function starts running: its scope list (starting with local_scope) goes on top of the call stack
+    def push_frame(self, local_scope):
+        self._top_scope = [local_scope]
+        self._function_scope = local_scope
+        self.call_stack.append(self._top_scope)
+
+    # a function is done: the function that called it is on top of the call stack again
+    def pop_frame(self):
         self.call_stack.pop()
-        return default_value
-    
-    # process different kind of statements     
+        self._top_scope = self.call_stack[-1] if self.call_stack else None
+        self._function_scope = self._top_scope[0] if self._top_scope else None
+
+    # check a return statement in the body of a function before it runs
+    def check_return(self, statement, return_type_of_func):
+        # check if struct return type matches the returned struct type
+        if statement.returns_var:
+            returned_variable = self._function_scope.get(statement.expression.name)
+            if returned_variable is not None:
+                if returned_variable.type in self.struct_tracker:
+                    if returned_variable.type != return_type_of_func:
+                        self._error(ErrorType.TYPE_ERROR, f"target variable and source value are incompatible")
+        # check if we return nil from primitive
+        elif statement.returns_bad_nil:
+            self._error(ErrorType.TYPE_ERROR, f"cant return nil for primitive return type")
+
+    # process different kind of statements (one dict lookup on elem_type picks the method that runs it)
+    # if, for and return can give back the value of a return statement, the others always give None
     def run_statement(self, statement_node):
-        # is_definition
-        if statement_node.elem_type == 'vardef':
-            self.do_definition(statement_node)
-        # is_assignment
-        elif statement_node.elem_type == '=':
-            self.do_assignment(statement_node)
-        # is_func_call (note only print can be found in the statement node not print)
-        elif statement_node.elem_type == 'fcall':
-            self.do_func_call(statement_node)
-        # is if statement
-        elif statement_node.elem_type == 'if':
-            # there can be a return in the if statement
-            return self.do_if_statement(statement_node)
-        # is for loop
-        elif statement_node.elem_type == 'for':
-            # there can be a return in the for loop
-            return self.do_for_loop(statement_node)
-        # is a return statement
-        elif statement_node.elem_type == 'return':
-            return self.do_return_statement(statement_node)
+        handler = self._stmt_dispatch.get(statement_node.elem_type)
+        if handler is not None:
+            return handler(statement_node)
+    
+    # is_func_call as a statement (note the value of the call is thrown away)
+    def do_call_statement(self, statement_node):
+        self.do_func_call(statement_node)
     
     
     def do_return_statement(self, statement_node):
         # get the expression
-        expression = statement_node.dict['expression'] 
+        expression = statement_node.expression 
         
         # first check if the return value is None (ex: return;)
-        if expression == None:
-            #expression = "return with no value"
+        if expression is None:
             return None
         
         # 'expression' which maps to an expression, variable or constant to return or None (if the return statement returns a default value of nil)
@@ -236,363 +989,185 @@ class Interpreter(InterpreterBase):
         evaluated_expression = self.do_evaluate_expression(expression)
         
         # this means we had a 'return nil;' SO we techincally return something
-        if evaluated_expression == None:
+        if evaluated_expression is None:
             return None
         
         # pop the whole scope we are in when we encounter return
-        self.call_stack.pop()
+        self.pop_frame()
         return evaluated_expression
     
      
     def do_for_loop(self, statement_node):
+        # the loop was written as a python function (False if it can't be), it runs as long as its names still refer to variables of the same types
+        if statement_node.python_loop is None:
+            statement_node.python_loop = self.compile_loop(statement_node)
+        if statement_node.python_loop is not False:
+            variables = self.find_loop_variables(statement_node)
+            if variables is not None:
+                return statement_node.python_loop(*variables)
         # handle the assignment
-        self.do_assignment(statement_node.dict['init'])
+        self.do_assignment(statement_node.init)
+        # everything the loop reads on every iteration is put in locals once (a call inside the loop puts the same scope list back on top when it returns)
+        needs_scope = statement_node.needs_scope
+        condition = statement_node.condition
+        statements = statement_node.statements
+        update = statement_node.update
+        scopes = self._top_scope
+        evaluate = self.do_evaluate_expression
+        run_statement = self.run_statement
+        do_assignment = self.do_assignment
             
         while True:
             # if the condition is true so we run the statements inside the for loop
-            # we are in the for loop so now can can add its scope to stack
-            local_scope = dict()
-            self.current_scope().append(local_scope)
+            # we are in the for loop so now can can add its scope to stack (only if the body defines variables)
+            if needs_scope:
+                scopes.append(dict())
             # check if the condition of the for loop does not evaluate to a boolean
-            is_condition = self.do_evaluate_expression(statement_node.dict['condition'])
+            is_condition = evaluate(condition)
             
             #using an integer value/variable as the condition for a for statement e.g., for (k = 5; k ; k = k - 1)
-            if type(is_condition) == int:
-                is_condition = self.int_to_bool_coercion(is_condition)
+            if type(is_condition) is int:
+                is_condition = is_condition != 0
             
-            if isinstance(is_condition, bool) == False:
-                            super().error(
+            if type(is_condition) is not bool:
+                            self._error(
                         ErrorType.TYPE_ERROR,
                         "condition of the for loop does not evaluate to a boolean",
                     )
             # we have finished exceuting the for loop so we can pop its scope from the stack
-            elif is_condition == False:
-                self.current_scope().pop()
+            elif not is_condition:
+                if needs_scope:
+                    scopes.pop()
                 return
             
             # conditon is true so we run statements inside for loop
-            for statement in statement_node.dict['statements']:
-                result = self.run_statement(statement)
-                if (result != None):
+            for statement in statements:
+                result = run_statement(statement)
+                if result is not None:
                     return result
                 
             # pop the dictonary (local_scope) of the for loop iteration
-            self.current_scope().pop()
+            if needs_scope:
+                scopes.pop()
             # update the condition and check if its true
-            self.do_assignment(statement_node.dict['update'])
+            do_assignment(update)
         
         
     def do_if_statement(self, statement_node):
         # the expression/variable/value that is the condition of the if statement must evaluate to a boolean
-        is_it_bool = self.do_evaluate_expression(statement_node.dict['condition'])
+        is_it_bool = self.do_evaluate_expression(statement_node.condition)
         
         # using an integer value/variable as the condition for an if statement: if (some_int_variable) { /* do this */ }
-        if type(is_it_bool) == int:
-            is_it_bool = self.int_to_bool_coercion(is_it_bool)
+        if type(is_it_bool) is int:
+            is_it_bool = is_it_bool != 0
         
-        if isinstance(is_it_bool, bool) == False:
-            super().error(
+        if type(is_it_bool) is not bool:
+            self._error(
                     ErrorType.TYPE_ERROR,
                     "condition of the if statement does not evaluate to a boolean",
                 )
             
         # condition maps to a boolean expression, variable or constant that must be True for the if statement to be executed
-        if (is_it_bool == True):
-            # we need a new scope for if statement
-            local_scope = dict() 
-            self.current_scope().append(local_scope)
+        if is_it_bool:
+            # we need a new scope for if statement (only if it defines variables)
+            if statement_node.needs_scope:
+                self._top_scope.append(dict())
             # eun statemnts in if statement
-            for statement in statement_node.dict['statements']:
+            for statement in statement_node.statements:
                 # result is the return statment (in case we have return in if statement)
-                
-                print(statement)
-                
                 result = self.run_statement(statement)
-                # if the return statement inside the if statment did return with no return value (ex: return;)
-                if result == "return with no value":
-                    self.call_stack.pop()
-                    return "nil"
-                
-                if (result != None):
+                if (result is not None):
                 # we have finished executing function so we can return (return handles the popping offf the stack)
                     return result
                 
             # delete the if statement scope from list of dictionaries
-            self.current_scope().pop()
+            if statement_node.needs_scope:
+                self._top_scope.pop()
         
         # condition in if statement is false  
         else:
             # There is no else clause
-            if statement_node.dict['else_statements'] is None:
+            if statement_node.else_statements is None:
                 # we continue running the rest of the statements otuside if clause (we dont need to pop in this case as the if clause was false so we never created a scope for the if clause)
                 return
             # we have an else clause
             else:
-                # we need a scope for brackets in else clause
-                local_scope = dict()
-                self.current_scope().append(local_scope)
+                # we need a scope for brackets in else clause (only if it defines variables)
+                if statement_node.else_needs_scope:
+                    self._top_scope.append(dict())
                 # run statements in else clause
-                for statement in statement_node.dict['else_statements']:
+                for statement in statement_node.else_statements:
                     result = self.run_statement(statement)
-                    if (result != None):
+                    if (result is not None):
                         return result
                 # pop else scope
-                self.current_scope().pop()
+                if statement_node.else_needs_scope:
+                    self._top_scope.pop()
             
     # Add variable name to variable_tracker if possible (can't redefine it)
     def do_definition(self, statement_node):
         # check that the varibale is not already defined in the current scope which is the current dictionary we are in
-        if statement_node.dict['name'] in self.current_scope()[-1]:
-            super().error(
+        if statement_node.name in self._top_scope[-1]:
+            self._error(
                 ErrorType.NAME_ERROR,
-                f"variable {statement_node.dict['name']} defined more than once",
+                f"variable {statement_node.name} defined more than once",
             )
         else:
-            variable_type = statement_node.dict['var_type']
+            variable_type = statement_node.var_type
             
             # intialize the variable with its default value
-            if (variable_type == 'int'):
-                default_value = 0
-            elif (variable_type == 'bool'):
-                default_value = False
-            elif (variable_type == 'string'):
-                default_value = ""
+            if variable_type in _PRIMITIVE_TYPES:
+                default_value = _DEFAULT_VALUES[variable_type]
             # we have a user defined structure
             else:
                 # check that the type exists (check if its in struct tracker
                 if (variable_type not in self.struct_tracker):
-                    super().error(
+                    self._error(
                     ErrorType.TYPE_ERROR,
                     "Variable type was not found",
                 )
                 # user defined structure should be nil 
                 default_value = None
                 
-            # add the variable def to the last dictionary in list of dictionaries (name as key and value as a dictionary with 'value' and 'type' as keys) (this is dictionary of dictionaries logic)
-            self.current_scope()[-1][statement_node.dict['name']] = {
-                'value' : default_value,
-                'type' : variable_type
-            }
-            # will help with checking if argument matches paramter type
-            self.variable_type_tracker[statement_node.dict['name']] = {
-                'value' : default_value,
-                'type' : variable_type
-            }
+            # add the variable def to the last dictionary in list of dictionaries (name as key and a Variable holding its value and type)
+            self._top_scope[-1][statement_node.name] = Variable(default_value, variable_type)
     
     # assign value to variable     
     def do_assignment(self, statement_node):
         # get the name of the variable (ex: 'x')
-        variable_name = statement_node.dict['name']
-        
-        # simple case for when we have one key and one field
-        if "." in variable_name:
-            split_var_name = variable_name.split(".")
-            if len(split_var_name) == 2:
-                # top level field
-                struct_name = split_var_name[0]
-                struct_field = split_var_name[1]
-                # verify that struct name is in scope
-                in_scope = False
-                dictionary_scope = None
-                struct_instance = None
-
-                for dict_scope in reversed(self.current_scope()):
-                    if struct_name in dict_scope:
-                        # we save the dictionary where this struct name is located
-                        dictionary_scope = dict_scope
-                        in_scope = True
-                        struct_instance = dict_scope[struct_name]
-                        # as soon as we find the first dict that has this variable we break
-                        break
-                    
-                # variable name not in scope
-                if in_scope == False:
-                    super().error(
-                        ErrorType.NAME_ERROR,
-                        f"Variable {variable_name} has not been defined",
-                    )
-                # If, during execution, the variable to the left of a dot is nil, then you must generate an error of ErrorType.FAULT_ERROR.
-                if struct_instance['value'] == None:
-                    super().error(ErrorType.FAULT_ERROR,f"variable to the left of dot is nil",
-                    )
-                # If, during execution, the variable to the left of a dot is not a struct type, then you must generate an error of ErrorType.TYPE_ERROR.
-                if struct_instance['type'] not in self.struct_tracker:
-                    super().error(ErrorType.TYPE_ERROR, "struct to left of dot is not a struct type",
-                    )
-                # If, during execution, a field name is invalid (e.g., it's not a valid field in a struct definition), then you must generate an error of ErrorType.NAME_ERROR.
-                struct_instance_type = struct_instance['type']
-                struct_def = self.struct_tracker[struct_instance_type]
-                does_field_exist = False
-                for field in struct_def.dict['fields']:
-                    if field.dict['name'] == struct_field:
-                        field_type_expected = field.dict['var_type']
-                        does_field_exist = True
-                        break
-                # field does not exist
-                if does_field_exist == False:
-                    super().error(ErrorType.NAME_ERROR, f"Field to right of dot does not exist",)
-
-
-                # get expression node (the value being assigned to variable)
-                expression = statement_node.dict['expression']
-                # call do_evaulate_expression which handles the expression (ex: x = 5 + 6;)
-                resulting_value = self.do_evaluate_expression(expression)
-                # check if field type and value are compatible
-                if self.is_type_compatible(field_type_expected, resulting_value) == False:
-                #If the types of the target variable and source value are incompatible, you must generate an error
-                    super().error(ErrorType.TYPE_ERROR, f"field type and value are incompatible")
-
-                # assign field to value (field is not a struct)
-                if type(resulting_value) == int or type(resulting_value) == str or type(resulting_value) == bool:
-                    # assigning an int to bool field
-                    if type(struct_instance['value'][struct_field]['value']) == bool and type(resulting_value) == int:
-                        bool_resulting_value = self.int_to_bool_coercion(resulting_value)
-                        struct_instance['value'][struct_field]['value'] = bool_resulting_value
-                        return 
-                
-                struct_instance['value'][struct_field]['value'] = resulting_value
-                return
-                
-        #### case where we have multiple fields ##########
+        variable_name = statement_node.name
+        # the name already split on the dots (None if there is no dot)
+        split_var_name = statement_node.dot_path
         
-        # check if variable has the dot operator
-        if "." in variable_name:
-            split_var_name = variable_name.split(".")
-            # top level field
-            struct_name = split_var_name[0]
-            
-            # handle case where top level is not a struct
-            if struct_name in self.call_stack[-1][0]:
-                # top level type not found
-                if self.call_stack[-1][0][struct_name]['type'] not in self.struct_tracker:
-                    super().error(ErrorType.TYPE_ERROR, f"dot used with non struct")
-                # top level is None
-                if self.call_stack[-1][0][struct_name]['value'] is None:
-                    super().error(ErrorType.FAULT_ERROR, f"top level is None")
-            
-            # verify that struct name is in scope
-            in_scope = False
-            dictionary_scope = None
-            struct_instance = None
-            
-            for dict_scope in reversed(self.current_scope()):
-                if struct_name in dict_scope:
-                    # we save the dictionary where this struct name is located
-                    dictionary_scope = dict_scope
-                    in_scope = True
-                    struct_instance = dict_scope[struct_name]
-                    # as soon as we find the first dict that has this variable we break
-                    break
-            
-            # variable name not in scope
-            if in_scope == False:
-                super().error(
-                    ErrorType.NAME_ERROR,
-                    f"Variable {variable_name} has not been defined",
-                )
-                
-            # If, during execution, the variable to the left of a dot is nil, then you must generate an error of ErrorType.FAULT_ERROR.
-            if struct_instance['value'] == None:
-                super().error(ErrorType.FAULT_ERROR,f"variable to the left of dot is nil",
-                    )
-                    
-            # If, during execution, the variable to the left of a dot is not a struct type, then you must generate an error of ErrorType.TYPE_ERROR.
-            if struct_instance['type'] not in self.struct_tracker:
-                super().error(ErrorType.TYPE_ERROR, "struct to left of dot is not a struct type",
-                    )
-                
-    
-            struct_instance_type = struct_instance['type']
-            # traverse through b.f.i ["b", "f", "i"]
-            # start fom first field
-            for i in range(1, len(split_var_name)):
-                # get the field of the top level structure
-                struct_field = split_var_name[i]  
-                # If, during execution, a field name is invalid (e.g., it's not a valid field in a struct definition), then you must generate an error of ErrorType.NAME_ERROR. 
-                struct_def = self.struct_tracker[struct_instance_type]
-            
-                does_field_exist = False
-                for field in struct_def.dict['fields']:
-                    if field.dict['name'] == struct_field: 
-                        field_type_expected = field.dict['var_type']
-                        does_field_exist = True
-                        break
-                # field does not exist
-                if does_field_exist == False:
-                    super().error(ErrorType.NAME_ERROR, f"Field to right of dot does not exist")
-                    
-    
-                # we finished checking the last field
-                if (i == len(split_var_name) - 1):
-                    struct_instance = struct_instance[split_var_name[-2]]['value']
-                    break
-                
-                if (i != 1):
-                    struct_instance = struct_instance[split_var_name[i-1]]['value']
-                    struct_instance_type = struct_instance[struct_field]['type']
-                    continue
-                
-                # go deeper into nested structure
-                struct_instance = struct_instance['value']
-    
-                # nested unallocated struct
-                if (struct_instance[struct_field]['value']) is None:
-                    super().error(ErrorType.FAULT_ERROR,f"nested unallocated struct")
-                
-                struct_instance_type = struct_instance[struct_field]['type']
-                    
-            
-            # get expression node (the value being assigned to variable)
-            expression = statement_node.dict['expression']
-            # call do_evaulate_expression which handles the expression (ex: x = 5 + 6;)
-            resulting_value = self.do_evaluate_expression(expression)
-            # check if field type and value are compatible
-            if self.is_type_compatible(field_type_expected, resulting_value) == False:
-            #If the types of the target variable and source value are incompatible, you must generate an error
-                super().error(ErrorType.TYPE_ERROR, f"field type and value are incompatible")
-                
-            
-            if type(resulting_value) == int or type(resulting_value) == str or type(resulting_value) == bool:
-                # adding "value" makes sure we only modfiy the value field
-                    struct_instance[struct_field]['value'] = resulting_value
-                    return
-            
-            # assign field to value
-            struct_instance[struct_field]['value'] = resulting_value
+        # assignment to a field of a struct (b.f.i ["b", "f", "i"])
+        if split_var_name is not None:
+            self.do_field_assignment(statement_node, split_var_name)
             
         ############### regular variable assignment ###################### 
         # aka regular variable name with no dot operator
         else:
-            # verify that variable name is in scope
-            in_scope = False
-            dictionary_scope = None
-            for dict in reversed(self.current_scope()):
-                if variable_name in dict:
-                    # we save the dictionary where this vvariable name is located
-                    dictionary_scope = dict
-                    in_scope = True
-                    # as soon as we find the first dict that has this variable we break
-                    break
+            # verify that variable name is in scope (and save the dictionary where this variable name is located)
+            dictionary_scope = self.find_scope(statement_node, variable_name)
             
             # variable name not in scope
-            if in_scope == False:
-                super().error(
+            if dictionary_scope is None:
+                self._error(
                     ErrorType.NAME_ERROR,
                     f"Variable {variable_name} has not been defined",
                 )
             
             # get expression node (the value being assigned to variable)
-            expression = statement_node.dict['expression']
+            expression = statement_node.expression
     
             # case where we try to initalize a struct to struct of diff ty[e]
             if expression.elem_type == 'new':
-                new_type = expression.dict['var_type']
-                if variable_name in self.current_scope()[0]:
-                    variable_type = self.current_scope()[0][variable_name]['type']
-                    #print(variable_type)
+                new_type = expression.var_type
+                tracked_variable = self._function_scope.get(variable_name)
+                if tracked_variable is not None:
+                    variable_type = tracked_variable.type
                     if variable_type in self.struct_tracker:
                         if (new_type != variable_type):
-                            super().error( ErrorType.TYPE_ERROR, f"cant assign var to diff struct")
+                            self._error( ErrorType.TYPE_ERROR, f"cant assign var to diff struct")
     
             
             # call do_evaulate_expression which handles the expression (ex: x = 5 + 6;)
@@ -600,3841 +1175,1074 @@ class Interpreter(InterpreterBase):
             
             
             # check that the resulting value matches the variables declared type
-            declared_variable_type = dictionary_scope[variable_name]['type']
+            declared_variable_type = dictionary_scope[variable_name].type
             
-            if self.is_type_compatible(declared_variable_type, resulting_value) == False:
+            if not self.is_type_compatible(declared_variable_type, resulting_value):
             #If the types of the target variable and source value are incompatible, you must generate an error
-                super().error(ErrorType.TYPE_ERROR, f"type of variable and value are incompatible")
+                self._error(ErrorType.TYPE_ERROR, f"type of variable and value are incompatible")
                 
             # check if we are assigning an integer value/variable to a boolean variable
-            if declared_variable_type == 'bool' and type(resulting_value) == int:
-                resulting_value = self.int_to_bool_coercion(resulting_value)
+            if declared_variable_type == 'bool' and type(resulting_value) is int:
+                resulting_value = resulting_value != 0
             
             # set the value to its corresponding variable in dict   
-            dictionary_scope[variable_name]['value'] = resulting_value
+            dictionary_scope[variable_name].value = resulting_value
             
           
-    # coercions from integer values/variables to boolean values/variables.
-    def int_to_bool_coercion (self, value):
-        if value == 0:
-            return False
-        else:
-            return True
+    # assign to the last field of a dotted name (the same checks for b.x as for b.f.i)
+    def do_field_assignment(self, statement_node, split_var_name):
+        # top level field
+        struct_name = split_var_name[0]
+        
+        # handle case where top level is not a struct (when we have multiple fields)
+        top_level = self._function_scope.get(struct_name) if len(split_var_name) > 2 else None
+        if top_level is not None:
+            # top level type not found
+            if top_level.type not in self.struct_tracker:
+                self._error(ErrorType.TYPE_ERROR, f"dot used with non struct")
+            # top level is None
+            if top_level.value is None:
+                self._error(ErrorType.FAULT_ERROR, f"top level is None")
+        
+        # verify that struct name is in scope
+        dictionary_scope = self.find_scope(statement_node, struct_name)
+        # variable name not in scope
+        if dictionary_scope is None:
+            self._error(
+                ErrorType.NAME_ERROR,
+                f"Variable {statement_node.name} has not been defined",
+            )
+        struct_instance = dictionary_scope[struct_name]
+        # If, during execution, the variable to the left of a dot is nil, then you must generate an error of ErrorType.FAULT_ERROR.
+        if struct_instance.value is None:
+            self._error(ErrorType.FAULT_ERROR,f"variable to the left of dot is nil",
+            )
+        # If, during execution, the variable to the left of a dot is not a struct type, then you must generate an error of ErrorType.TYPE_ERROR.
+        if struct_instance.type not in self.struct_tracker:
+            self._error(ErrorType.TYPE_ERROR, "struct to left of dot is not a struct type",
+            )
+        
+        # go deeper into the nested structures until we have the struct that holds the last field
+        struct_instance_type = struct_instance.type
+        fields = struct_instance.value
+        for struct_field in split_var_name[1:-1]:
+            # If, during execution, a field name is invalid (e.g., it's not a valid field in a struct definition), then you must generate an error of ErrorType.NAME_ERROR.
+            self.find_field_type(struct_instance_type, struct_field)
+            # nested unallocated struct
+            if fields[struct_field].value is None:
+                self._error(ErrorType.FAULT_ERROR,f"nested unallocated struct")
+            struct_instance_type = fields[struct_field].type
+            if struct_instance_type not in self.struct_tracker:
+                self._error(ErrorType.TYPE_ERROR, "struct to left of dot is not a struct type")
+            fields = fields[struct_field].value
+        
+        struct_field = split_var_name[-1]
+        field_type_expected = self.find_field_type(struct_instance_type, struct_field)
+        
+        # get expression node (the value being assigned to variable)
+        expression = statement_node.expression
+        # call do_evaulate_expression which handles the expression (ex: x = 5 + 6;)
+        resulting_value = self.do_evaluate_expression(expression)
+        # check if field type and value are compatible
+        if not self.is_type_compatible(field_type_expected, resulting_value):
+        #If the types of the target variable and source value are incompatible, you must generate an error
+            self._error(ErrorType.TYPE_ERROR, f"field type and value are incompatible")
+        
+        # assigning an int to bool field (the declared type of the field already says if it's a bool)
+        if field_type_expected == 'bool' and type(resulting_value) is int:
+            resulting_value = resulting_value != 0
         
+        # assign field to value (adding "value" makes sure we only modfiy the value field)
+        fields[struct_field].value = resulting_value
+
+    # the innermost scope that has the name (None if it isn't defined)
+    # the same node finds its name the same number of scopes back every time (the blocks around it are the same), so that offset is saved on the node and checked first
+    def find_scope(self, node, var_name):
+        scopes = self._top_scope
+        offset = node.scope_offset
+        if len(scopes) >= -offset and var_name in scopes[offset]:
+            return scopes[offset]
+        for offset in range(-1, -len(scopes) - 1, -1):
+            if var_name in scopes[offset]:
+                node.scope_offset = offset
+                return scopes[offset]
+        return None
+
+    # get the declared type of a field of a struct type (NAME_ERROR if the struct doesn't have that field)
+    def find_field_type(self, struct_type, struct_field):
+        field_types = self.struct_tracker[struct_type].field_types
+        # field does not exist
+        if struct_field not in field_types:
+            self._error(ErrorType.NAME_ERROR, f"Field to right of dot does not exist")
+        return field_types[struct_field]
+
     # Citation: The following code was found on perplexiy.ai
     # Check if a value's type is compatible with the declared type     
     def is_type_compatible(self, declared_type, value):
         # only structs can be assigned to Nil (None)
-        if value == None:
-            if declared_type != 'int' and declared_type != 'bool' and declared_type != 'string':
+        if value is None:
+            if declared_type not in _PRIMITIVE_TYPES:
                 # we can only assign structs to nil
                 if declared_type in self.struct_tracker:
                     return True
             return False
-        if declared_type == 'int' and type(value) == int:
-            return True
-        elif declared_type == 'bool' and type(value) == bool:
-            return True
-        elif declared_type == 'string' and type(value) == str:
-            return True
+        # the python type an int, bool or string variable holds (None for a struct)
+        python_type = _PYTHON_TYPES.get(declared_type)
+        if python_type is not None:
+            if type(value) is python_type:
+                return True
+            # Brewin++ allows coercion from int to bool (coercion)
+            return python_type is bool and type(value) is int
         # we use a dict to represent structs (check that struct exists)
-        elif declared_type in self.struct_tracker and type(value) == dict:
-            return True
-        # Brewin++ allows coercion from int to bool (coercion)
-        elif declared_type == 'bool' and type(value) == int:  
-            return True  
-        else:
-            return False
+        return declared_type in self.struct_tracker and type(value) is dict
     # end of citation 
             
     # determine which function is in the func node (print() found in statement nodes and inputi() found in expression nodes or just a general functiuon)
     def do_func_call(self, func_node):
         # only found in expression nodes
         # evaluate_input_call will help us get the user input
-        if func_node.dict['name'] == 'inputi':    
+        name = func_node.name
+        if name == 'inputi':    
             user_input = self.do_evaluate_input_call(func_node)
             return user_input
         # same as inputi but for strings
-        elif func_node.dict['name'] == 'inputs':
+        elif name == 'inputs':
             user_input = self.do_evaluate_input_call(func_node)
             return user_input
-        elif func_node.dict['name'] == 'print':
+        elif name == 'print':
             self.do_evaluate_print_call(func_node)
             # make sure print returns void
             return None
         else:
             # verify the func definition exists
-            function = self.get_func_by_name_and_param_len(func_node.dict['name'], len(func_node.dict['args']))
+            args = func_node.args
+            function = func_node.resolved_func
+            if function is None:
+                function = self.get_func_by_name_and_param_len(name, len(args))
+                func_node.resolved_func = function
             
             # remember args you pass in to functions can be expressions (ex: foo(n-1); this is handled by run_func)
             # pass in the function defintion and then pass in the arg values
-            return self.run_func(function, func_node.dict['args'])
+            return self.run_func(function, args)
             
             
     # evaluate the print call (actually output what print wants to print)
     def do_evaluate_print_call(self, print_node):
-        string_to_output = ""
+        # the text of every argument, joined once at the end
+        parts = []
+        evaluate = self.do_evaluate_expression
         # loop through arguments of print statement
-        for argument in print_node.dict['args']:
+        for argument in print_node.args:
+            expression_value = evaluate(argument)
             # check if the argument is a bool so we can make it lowercase
-            expression_value = self.do_evaluate_expression(argument)
-            if (isinstance(expression_value, bool)):
-                lowercase_bool = str(expression_value)
-                string_to_output += lowercase_bool.lower()
-                continue
+            if type(expression_value) is bool:
+                parts.append('true' if expression_value else 'false')
             # we print "nil"
-            if (expression_value == None):
-                string_to_output += "nil"
-                continue
+            elif expression_value is None:
+                parts.append("nil")
             else:
-                string_to_output += str(expression_value)
+                parts.append(str(expression_value))
         # output using the output() method in our InterpreterBase base class (output() method automatically appends a newline character after each line it prints, so you do not need to output a newline yourself.)
-        #print("STRING TO OUTPOUT", string_to_output)
-        super().output(string_to_output)
+        self._output("".join(parts))
         return None
         
     # get the user input 
     def do_evaluate_input_call(self, input_node):
         # If an inputi() expression has more than one parameter passed to it, then you must generate an error of type ErrorType.NAME_ERROR by calling InterpreterBase.error()
-        if len(input_node.dict['args']) > 1:
-            super().error(
+        args = input_node.args
+        if len(args) > 1:
+            self._error(
                 ErrorType.NAME_ERROR,
                 f"No inputi() function found that takes > 1 parameter",
                 )
             
         # If an inputi() function call has a prompt parameter, you must first output it to the screen using our InterpreterBase output() method before obtaining input from the user
         # assume that the inputi() function is invoked with a single argument, the argument will always have the type of string
-        if len(input_node.dict['args']) == 1:
-            input_prompt = self.do_evaluate_expression(input_node.dict['args'][0])
-            super().output(input_prompt)
+        if len(args) == 1:
+            input_prompt = self.do_evaluate_expression(args[0])
+            self._output(input_prompt)
  
         # the user wants to input a string
-        if input_node.dict['name'] == 'inputs':
-            user_string_input = super().get_input()
+        if input_node.name == 'inputs':
+            user_string_input = self.get_input()
             return user_string_input
             
         # the user wants to input an integer
-        user_input = int(super().get_input())
+        user_input = int(self.get_input())
         return user_input
     
     # Citation: The following code was found on perplexiy.ai
     def do_new_struct_instance(self, structure_type):
         # get the struct definition node
         struct_def = self.struct_tracker[structure_type]
-        # Create a new instance of the struct with default field values
-        # every key is the field name mapped with its valuu
-        struct_instance = {}
-        # create new struct instance (set its fields to default values)
-        for field in struct_def.dict['fields']:
-            field_name = field.dict['name']
-            field_type = field.dict['var_type']
-            
-            if field_type == 'int':
-                # struct_instance[field_name] = 0
-                struct_instance[field_name] = {
-                    'value' : 0,
-                    'type' : field_type
-                }
-            elif field_type == 'bool':
-                # struct_instance[field_name] = False
-                struct_instance[field_name] = {
-                    'value' : False,
-                    'type' : field_type
-                }
-            elif field_type == 'string':
-                # struct_instance[field_name] = ""
-                struct_instance[field_name] = {
-                    'value' : "",
-                    'type' : field_type
-                }
-            # we have another struct as a field
-            else:
-                # check if the field type is valid
-                if field_type not in self.struct_tracker:
-                    super().error(ErrorType.TYPE_ERROR, f"nested field type {field_type} is unknown")   
-                # else we know know the field type exists we instantiate its fields
-                struct_instance[field_name] = {
-                     'value' : None,
-                     'type' : field_type
-                }
+        # the default value of every field only has to be worked out (and its type checked) once
+        if struct_def.field_defaults is None:
+            field_defaults = []
+            for field in struct_def.fields:
+                field_name = field.name
+                field_type = field.var_type
+                
+                if field_type in _PRIMITIVE_TYPES:
+                    field_defaults.append((field_name, _DEFAULT_VALUES[field_type], field_type))
+                # we have another struct as a field
+                else:
+                    # check if the field type is valid
+                    if field_type not in self.struct_tracker:
+                        self._error(ErrorType.TYPE_ERROR, f"nested field type {field_type} is unknown")   
+                    # else we know know the field type exists (nested structs start as nil)
+                    field_defaults.append((field_name, None, field_type))
+            struct_def.field_defaults = tuple(field_defaults)
         
-        return struct_instance
+        # Create a new instance of the struct with default field values
+        # every key is the field name mapped with its own Variable
+        return {field_name: Variable(default_value, field_type) for field_name, default_value, field_type in struct_def.field_defaults}
     # end of citation
             
     
-    # handle expression node
+    # handle expression node (one dict lookup on elem_type picks the method that evaluates it)
+    # literals and plain variables are the most common operands so they are handled right here without the extra method call
     def do_evaluate_expression(self, expression):
-        # case where we assign a variable to an int (ex: x = 5)
-        if expression.elem_type == 'int':
-            return expression.dict['val']
-        # case where we assign a variable to a string (ex: x = "foo")
-        elif expression.elem_type == 'string':
-            return expression.dict['val']
-        # case where we assign a variable to a boolean
-        elif expression.elem_type == 'bool':
-            return expression.dict['val']
-        # case where we assign a variable to a nil value (nil values are like nullptr in C++ or None in Python)
-        elif expression.elem_type == 'nil':
-            return None
-        # case where we have an inputi() or inputs() in an expression (only the case for proj 1)
-        elif expression.elem_type == 'fcall':
-            # do func call will determine that it should be an input func or regular func
-            func_name = expression.dict['name']
-            
-            # check if custom func is return void
-            if (func_name,len(expression.dict['args'])) in self.func_name_to_ast:
-                func_def = self.get_func_by_name_and_param_len(func_name, len(expression.dict['args']))
-                # Invoking a void return type function as part of an expression should always throw an error of ErrorType.TYPE_ERROR.
-                if func_def.dict['return_type'] == 'void':
-                    super().error(ErrorType.TYPE_ERROR, f"can't use a func with a void return type in an expression")
-  
-            return self.do_func_call(expression)
-        
-        # case where expression node is a new command
-        elif expression.elem_type == 'new':
-            if expression.dict['var_type'] not in self.struct_tracker:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "struct type was not found",
-                )
-            struct_type = expression.dict['var_type']
-            return self.do_new_struct_instance(struct_type)
-                
-        # case where we have a variable (x = y)
-        elif expression.elem_type == 'var':
-            # If an expression refers to a variable that has not yet been defined, then you must generate an error of type ErrorType.NAME_ERROR by calling InterpreterBase.error()
-            var_name = expression.dict['name']
-            # simple case for when we have one key and one field
-            # check if var name has a dot () (if we try to do print(s1.a))
-            if "." in var_name:
-                split_var_name = var_name.split(".")
-                if len(split_var_name) == 2:
-                    struct_name = split_var_name[0]
-                    struct_field = split_var_name[1]
-                    #print("SPLITTTT", split_var_name)
-                    
-                    in_scope = False
-                    struct_instance = None
-                    
-                    for dict in reversed(self.current_scope()):
-                        if struct_name in dict:
-                            in_scope = True
-                            
-                            # get the field and its value
-                            variable_dictionary = dict.get(struct_name)
-                            
-                            if variable_dictionary['type'] == 'int' or variable_dictionary['type'] == 'string' or variable_dictionary['type'] == 'bool':
-                                super().error(ErrorType.TYPE_ERROR, "struct to left of dot is not a struct type")
-                    
-                            struct_def = self.struct_tracker[variable_dictionary['type']]            
-                            
-                            does_field_exist = False
-                            for field in struct_def.dict['fields']:
-                                if field.dict['name'] == struct_field:
-                                    does_field_exist = True
-                                    break
-                            # field does not exist
-                            if does_field_exist == False:
-                                super().error(ErrorType.NAME_ERROR, f"Field to right of dot does not exist")
-                            
-
-                            
-                            # struct is set to nil
-                            if variable_dictionary['value'] == None:
-                                super().error(ErrorType.FAULT_ERROR,f"can't print field of a nil struct")
-                            
-                            # case where value is found
-                            if type(variable_dictionary['value'][struct_field]) == int or type(variable_dictionary['value'][struct_field]) == str or type(variable_dictionary['value'][struct_field]) == bool:
-                                return variable_dictionary['value'][struct_field]
-                            
-                            # case where element to right of field is Nil
-                            if variable_dictionary['value'][struct_field]['value'] == None:
-                                return None
-                            
-                            
-                            return variable_dictionary['value'][struct_field]['value']
-                    
-                    # We have looped through all dicts in array and var was not found       
-                    # case where var_name to left of dot was not found
-                    if (in_scope == False):
-                        super().error(
-                            ErrorType.NAME_ERROR,
-                            f"Variable {expression.dict['name']} has not been defined",
-                        )
+        elem_type = expression.elem_type
+        if elem_type == 'int' or elem_type == 'bool' or elem_type == 'string':
+            return expression.val
+        if elem_type == 'var':
+            var_name = expression.name
+            if expression.dot_path is None:
+                # the name is almost always in the same scope as last time
+                scopes = self._top_scope
+                offset = expression.scope_offset
+                if len(scopes) >= -offset and var_name in scopes[offset]:
+                    return scopes[offset][var_name].value
+                scope = self.find_scope(expression, var_name)
+                if scope is not None:
+                    return scope[var_name].value
+            # dotted names and the undefined variable error are handled by _eval_var
+        handler = self._expr_dispatch.get(elem_type)
+        if handler is not None:
+            return handler(expression)
+        # anything else evaluates to None
+        return None
 
-            
-            # case for multiple keys
-            # check if var name has a dot (if we try to do print(s1.a))
-            if "." in var_name:
-                # start fom first field
-                split_var_name = var_name.split(".")
-                struct_name = split_var_name[0]
-                # verify that struct name is in scope
-                in_scope = False
-                struct_instance = None
-                
-                for dict_scope in reversed(self.current_scope()):
-                    if struct_name in dict_scope:
-                        # we save the dictionary where this struct name is located
-                        in_scope = True
-                        struct_instance = dict_scope[struct_name]
-                        #print("struct_instance", struct_instance)
-                        # as soon as we find the first dict that has this variable we break
-                        break
-                
-                # variable name not in scope
-                if in_scope == False:
-                    super().error(
-                        ErrorType.NAME_ERROR,
-                        f"Variable {var_name} has not been defined",
-                    )
-                
-                # If, during execution, the variable to the left of a dot is nil, then you must generate an error of ErrorType.FAULT_ERROR.
-                if struct_instance['value'] == None:
-                        super().error(ErrorType.FAULT_ERROR,f"variable to the left of dot is nil",
-                        )
-                        
-                # If, during execution, the variable to the left of a dot is not a struct type, then you must generate an error of ErrorType.TYPE_ERROR.
-                if struct_instance['type'] not in self.struct_tracker:
-                        super().error(ErrorType.TYPE_ERROR, "struct to left of dot is not a struct type",
-                        )
-                        
-                struct_instance_type = struct_instance['type']
-                # traverse through b.f.i ["b", "f", "i"]
-                # start fom first field
-                for i in range(1, len(split_var_name)):
-                    # get the field of the top level structure
-                    struct_field = split_var_name[i] 
-                    
-                    if struct_instance_type not in self.struct_tracker:
-                        super().error(ErrorType.TYPE_ERROR, "struct to left of dot is not a struct type",
-                        )
-                    
-                    struct_def = self.struct_tracker[struct_instance_type]
-                    
-                    does_field_exist = False
-                    for field in struct_def.dict['fields']:
-                        if field.dict['name'] == struct_field:
-                            #field_type_expected = field.dict['var_type']
-                            does_field_exist = True
-                            break
-                    # field does not exist
-                    if does_field_exist == False:
-                        super().error(ErrorType.NAME_ERROR, f"Field to right of dot does not exist")
-                        
-                    # we finished checking the last field
-                    if (i == len(split_var_name) - 1):
-                        struct_instance = struct_instance[split_var_name[-2]]['value']
-                        break   
+    # case where we assign a variable to an int, string or boolean (ex: x = 5, x = "foo", x = true)
+    def _eval_const(self, expression):
+        return expression.val
+
+    # an operation on literals: evaluate it like normal the first time, then the node turns into a literal holding the value (ex: -1, 2 * 3)
+    # if it causes an error it stays as it is so the error happens every time it runs
+    def _eval_pure(self, expression):
+        value = self._expr_dispatch[expression.pure_operation](expression)
+        if type(value) is int:
+            expression.elem_type = 'int'
+        elif type(value) is str:
+            expression.elem_type = 'string'
+        elif type(value) is bool:
+            expression.elem_type = 'bool'
+        else:
+            return value
+        expression.val = value
+        return value
+
+    # an expression lowered into opcodes by _compile: run them with a single loop over a value stack
+    # each opcode has its own handler (self._op_handlers is indexed by the opcode) that returns the index of the next instruction, so jumps cost nothing extra
+    def _eval_vm(self, expression):
+        # a hot expression is turned into a python function and runs through _eval_python from then on
+        expression.runs += 1
+        if expression.runs == _HOT_EXPRESSION_COUNT:
+            python_function = self.compile_to_python(expression)
+            if python_function is not None:
+                expression.python_function = python_function
+                expression.elem_type = 'python'
+                return python_function(self._top_scope)
+        # every run shares one value stack, a run leaves exactly one value on it (a call inside the expression runs on top of it and takes its value off again)
+        stack = self._vm_stack
+        # locals are faster than attribute lookups inside the loop
+        handlers = self._op_handlers
+        code = expression.code
+        end = len(code)
+        ip = 0
+        while ip < end:
+            ip = handlers[code[ip][0]](code, ip, stack)
+        return stack.pop()
+
+    # write the opcodes of an expression as python source and run it to get the function (None if its nested too deep to write)
+    def compile_to_python(self, expression):
+        writer = ExpressionWriter(self._expr_dispatch)
+        source = writer.write_function(expression.code)
+        if writer.max_indent > _MAX_WRITER_INDENT:
+            return None
+        namespace = dict(writer.constants, _error=self._error, _type_error=self._type_error, ErrorType=ErrorType, _evaluate=self.do_evaluate_expression, _find_variable=self.find_variable)
+        exec(compile(source, "<brewin expression>", "exec"), namespace)
+        return namespace['brewin_expression']
 
-                    # go deeper into nested structure
-                    #print("STRUCT INSTANCE AFTER YAY", struct_instance['value'])
-                    if (i != 1):
-                        #struct_instance = struct_instance[struct_field['value']
-                        struct_instance = struct_instance[split_var_name[i-1]]['value']
-                        struct_instance_type = struct_instance[struct_field]['type']
-                        continue
+    # write a for loop as a python function (see LoopWriter), False if it can't be
+    def compile_loop(self, statement_node):
+        if not LoopWriter.can_write(statement_node):
+            return False
+        writer = LoopWriter(self._expr_dispatch, self.find_variable)
+        source = writer.write_function(statement_node)
+        if source is None:
+            return False
+        # the names are looked up again every time the loop starts
+        statement_node.loop_names = tuple(writer.variables)
+        statement_node.loop_types = tuple(variable.type for variable in writer.found)
+        namespace = dict(writer.constants, _error=self._error, _type_error=self._type_error, ErrorType=ErrorType, _evaluate=self.do_evaluate_expression, _call=self.do_func_call)
+        exec(compile(source, "<brewin loop>", "exec"), namespace)
+        return namespace['brewin_loop']
+
+    # the innermost Variable with that name (None if there isn't one)
+    def find_variable(self, var_name):
+        for dict in reversed(self._top_scope):
+            if var_name in dict:
+                return dict[var_name]
+        return None
 
-                    # go deeper into nested structure
-                    struct_instance = struct_instance['value']
-                    # check if filed value is nil
-                    if (struct_instance[struct_field]['value']) is None:
-                        super().error(ErrorType.FAULT_ERROR, f'field is none')
-                    
-                    struct_instance_type = struct_instance[struct_field]['type']
-                
-                # return the value at that field
-                return struct_instance[struct_field]['value']
-            
-            else:   
-                # check if the variable was defined at all     
-                for dict in reversed(self.current_scope()):
-                    if expression.dict['name'] in dict:
-                        # return variable value
-                        vaiable_name = dict.get(expression.dict['name'])
-                        return vaiable_name['value']
-                    
-                
-                # We have looped through all dicts in array and var was not found
-                super().error(
+    # the Variables a compiled loop works on, None if one of them isn't defined or has a different type than when the loop was written
+    def find_loop_variables(self, statement_node):
+        variables = []
+        for var_name, var_type in zip(statement_node.loop_names, statement_node.loop_types):
+            variable = self.find_variable(var_name)
+            if variable is None or variable.type != var_type:
+                return None
+            variables.append(variable)
+        return variables
+
+    # an expression that was turned into a python function (see ExpressionWriter)
+    def _eval_python(self, expression):
+        return expression.python_function(self._top_scope)
+
+    def _op_push_const(self, code, ip, stack):
+        stack.append(code[ip][1])
+        return ip + 1
+
+    def _op_load_var(self, code, ip, stack):
+        var_name = code[ip][1]
+        # the innermost scope that has the variable holds its value (the innermost scope is usually the only one, so it's checked first on its own)
+        variable = self._top_scope[-1].get(var_name)
+        if variable is None:
+            variable = self.find_variable(var_name)
+            if variable is None:
+                self._error(
                     ErrorType.NAME_ERROR,
-                    f"Variable {expression.dict['name']} has not been defined",
+                    f"Variable {var_name} has not been defined",
                 )
+        stack.append(variable.value)
+        return ip + 1
+
+    def _op_eval(self, code, ip, stack):
+        stack.append(self.do_evaluate_expression(code[ip][1]))
+        return ip + 1
+
+    # binary operations pop op2 and write their result over op1 (no tuple of operands and no list growth per operation)
+    def _op_mul(self, code, ip, stack):
+        operand2_value = stack.pop()
+        operand1_value = stack[-1]
+        if type(operand1_value) is type(operand2_value) is int:
+            stack[-1] = operand1_value * operand2_value
+            return ip + 1
+        self._type_error()
+
+    def _op_div(self, code, ip, stack):
+        operand2_value = stack.pop()
+        operand1_value = stack[-1]
+        if type(operand1_value) is type(operand2_value) is int:
+            stack[-1] = operand1_value // operand2_value
+            return ip + 1
+        self._type_error()
+
+    def _op_add(self, code, ip, stack):
+        operand2_value = stack.pop()
+        operand1_value = stack[-1]
+        # strings can be concatenated too
+        if type(operand1_value) is type(operand2_value) is int or type(operand1_value) is type(operand2_value) is str:
+            stack[-1] = operand1_value + operand2_value
+            return ip + 1
+        self._type_error()
+
+    def _op_sub(self, code, ip, stack):
+        operand2_value = stack.pop()
+        operand1_value = stack[-1]
+        if type(operand1_value) is type(operand2_value) is int:
+            stack[-1] = operand1_value - operand2_value
+            return ip + 1
+        self._type_error()
+
+    # an attempt to compare a void type (e.g., the return of print()) to any other type must result in an error of ErrorType.TYPE_ERROR.
+    def _check_compared_operands(self, operand1_value, operand2_value):
+        if operand1_value == 'void' or operand2_value == 'void':
+            self._error(ErrorType.TYPE_ERROR, "Can't compare void type")
+        self._type_error()
+
+    def _op_lt(self, code, ip, stack):
+        operand2_value = stack.pop()
+        operand1_value = stack[-1]
+        if type(operand1_value) is type(operand2_value) is int:
+            stack[-1] = operand1_value < operand2_value
+            return ip + 1
+        self._check_compared_operands(operand1_value, operand2_value)
+
+    def _op_le(self, code, ip, stack):
+        operand2_value = stack.pop()
+        operand1_value = stack[-1]
+        if type(operand1_value) is type(operand2_value) is int:
+            stack[-1] = operand1_value <= operand2_value
+            return ip + 1
+        self._check_compared_operands(operand1_value, operand2_value)
+
+    def _op_gt(self, code, ip, stack):
+        operand2_value = stack.pop()
+        operand1_value = stack[-1]
+        if type(operand1_value) is type(operand2_value) is int:
+            stack[-1] = operand1_value > operand2_value
+            return ip + 1
+        self._check_compared_operands(operand1_value, operand2_value)
+
+    def _op_ge(self, code, ip, stack):
+        operand2_value = stack.pop()
+        operand1_value = stack[-1]
+        if type(operand1_value) is type(operand2_value) is int:
+            stack[-1] = operand1_value >= operand2_value
+            return ip + 1
+        self._check_compared_operands(operand1_value, operand2_value)
+
+    def _op_neg(self, code, ip, stack):
+        # operand must be of type int (handles case hwere bool is not intepreted as int)
+        if type(stack[-1]) is int:
+            stack[-1] = -stack[-1]
+            return ip + 1
+        self._type_error()
+
+    def _op_not(self, code, ip, stack):
+        operand1_value = stack[-1]
+        if type(operand1_value) is int:
+            operand1_value = operand1_value != 0
+        # operand must be of type bool
+        if type(operand1_value) is bool:
+            # this ! had a bool so it probably always will, use the version without the int check from now on
+            if stack[-1] is operand1_value:
+                code[ip] = (OP_NOT_BOOL, None)
+            stack[-1] = not operand1_value
+            return ip + 1
+        self._type_error()
+
+    # short circuiting: false && anything is false so the second operand is jumped over (the false stays on the stack as the result)
+    def _op_jump_if_false_keep(self, code, ip, stack):
+        if type(stack[-1]) is int:
+            stack[-1] = stack[-1] != 0
+        if stack[-1] is False:
+            return code[ip][1]
+        # the first operand has to be a bool before the second one is even evaluated
+        if stack[-1] is not True:
+            self._type_error()
+        return ip + 1
+
+    # short circuiting: true || anything is true so the second operand is jumped over (the true stays on the stack as the result)
+    def _op_jump_if_true_keep(self, code, ip, stack):
+        if type(stack[-1]) is int:
+            stack[-1] = stack[-1] != 0
+        if stack[-1] is True:
+            return code[ip][1]
+        # the first operand has to be a bool before the second one is even evaluated
+        if stack[-1] is not False:
+            self._type_error()
+        return ip + 1
+
+    # pop the second operand of && or || and check both (the first one was already coerced by the jump), checking the value of an integer in an and/or expression
+    def _pop_bool_operand(self, stack):
+        operand2_value = stack.pop()
+        if type(operand2_value) is int:
+            operand2_value = operand2_value != 0
+        if type(stack[-1]) is type(operand2_value) is bool:
+            return operand2_value
+        self._type_error()
+
+    def _op_and(self, code, ip, stack):
+        # both operands were bools without coercing them so use the version without the checks from now on
+        if stack[-2] is True and type(stack[-1]) is bool:
+            code[ip] = (OP_AND_BOOL, None)
+        operand2_value = self._pop_bool_operand(stack)
+        stack[-1] = stack[-1] and operand2_value
+        return ip + 1
+
+    def _op_or(self, code, ip, stack):
+        # both operands were bools without coercing them so use the version without the checks from now on
+        if stack[-2] is False and type(stack[-1]) is bool:
+            code[ip] = (OP_OR_BOOL, None)
+        operand2_value = self._pop_bool_operand(stack)
+        stack[-1] = stack[-1] or operand2_value
+        return ip + 1
+
+    # the jump already skipped a false first operand so true && op2 is just op2
+    # if the operands stop being bools the instruction goes back to OP_AND, which does the checks (and reports the error)
+    def _op_and_bool(self, code, ip, stack):
+        if stack[-2] is True and type(stack[-1]) is bool:
+            operand2_value = stack.pop()
+            stack[-1] = operand2_value
+            return ip + 1
+        code[ip] = (OP_AND, None)
+        return self._op_and(code, ip, stack)
+
+    # the jump already skipped a true first operand so false || op2 is just op2
+    def _op_or_bool(self, code, ip, stack):
+        if stack[-2] is False and type(stack[-1]) is bool:
+            operand2_value = stack.pop()
+            stack[-1] = operand2_value
+            return ip + 1
+        code[ip] = (OP_OR, None)
+        return self._op_or(code, ip, stack)
+
+    def _op_not_bool(self, code, ip, stack):
+        if stack[-1] is True:
+            stack[-1] = False
+        elif stack[-1] is False:
+            stack[-1] = True
+        else:
+            code[ip] = (OP_NOT, None)
+            return self._op_not(code, ip, stack)
+        return ip + 1
+
+    # the error every operator reports when its operands have the wrong types (kept out of the evaluators so they stay small)
+    def _type_error(self):
+        self._error(
+            ErrorType.TYPE_ERROR,
+            "Incompatible types for arithmetic operation",
+        )
+
+    # case where we assign a variable to a nil value (nil values are like nullptr in C++ or None in Python)
+    def _eval_nil(self, expression):
+        return None
 
-        elif expression.elem_type == '*':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-            
-            # special case to handle booleans which python interprets as ints
-            if isinstance(operand1_value, bool) or isinstance(operand2_value, bool):
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-            
-            # if both the operands are of type int
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int):
-                return operand1_value * operand2_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-                
-        elif expression.elem_type == '/':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-                        
-            # special case to handle booleans which python interprets as ints
-            if isinstance(operand1_value, bool) or isinstance(operand2_value, bool):
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-            
-            # if both the operands are of type int
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int):
-                return operand1_value // operand2_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )     
+    # case where we have an inputi() or inputs() in an expression (only the case for proj 1)
+    def _eval_fcall(self, expression):
+        # do func call will determine that it should be an input func or regular func
+        func_name = expression.name
+        
+        # check if custom func is return void
+        func_def = expression.resolved_func
+        if func_def is None:
+            func_def = self.func_name_to_ast.get((func_name, len(expression.args)))
+        if func_def is not None:
+            # Invoking a void return type function as part of an expression should always throw an error of ErrorType.TYPE_ERROR.
+            if func_def.return_type == 'void':
+                self._error(ErrorType.TYPE_ERROR, f"can't use a func with a void return type in an expression")
+  
+        return self.do_func_call(expression)
+
+    # case where expression node is a new command
+    def _eval_new(self, expression):
+        if expression.var_type not in self.struct_tracker:
+            self._error(
+                ErrorType.TYPE_ERROR,
+                "struct type was not found",
+            )
+        struct_type = expression.var_type
+        return self.do_new_struct_instance(struct_type)
+
+    # case where we have a variable (x = y)
+    def _eval_var(self, expression):
+        # If an expression refers to a variable that has not yet been defined, then you must generate an error of type ErrorType.NAME_ERROR by calling InterpreterBase.error()
+        # the name already split on the dots (None if there is no dot)
+        split_var_name = expression.dot_path
+        # check if var name has a dot (if we try to do print(s1.a) or print(b.f.i))
+        if split_var_name is not None:
+            return self.get_field_value(expression, split_var_name)
+        
+        # check if the variable was defined at all (and return its value)
+        dictionary_scope = self.find_scope(expression, expression.name)
+        if dictionary_scope is not None:
+            return dictionary_scope[expression.name].value
+        
+        # We have looped through all dicts in array and var was not found
+        self._error(
+            ErrorType.NAME_ERROR,
+            f"Variable {expression.name} has not been defined",
+        )
+
+    # the value of the last field of a dotted name (b.f.i ["b", "f", "i"]), going one field deeper at a time
+    def get_field_value(self, expression, split_var_name):
+        struct_name = split_var_name[0]
+        # verify that struct name is in scope
+        dictionary_scope = self.find_scope(expression, struct_name)
+        # case where var_name to left of dot was not found
+        if dictionary_scope is None:
+            self._error(
+                ErrorType.NAME_ERROR,
+                f"Variable {expression.name} has not been defined",
+            )
+        struct_instance = dictionary_scope[struct_name]
+        struct_instance_type = struct_instance.type
+        fields = struct_instance.value
+        struct_tracker = self.struct_tracker
+        
+        for struct_field in expression.field_path:
+            # If, during execution, the variable to the left of a dot is not a struct type, then you must generate an error of ErrorType.TYPE_ERROR.
+            struct_def = struct_tracker.get(struct_instance_type)
+            if struct_def is None:
+                self._error(ErrorType.TYPE_ERROR, "struct to left of dot is not a struct type")
+            # If, during execution, a field name is invalid (e.g., it's not a valid field in a struct definition), then you must generate an error of ErrorType.NAME_ERROR.
+            if struct_field not in struct_def.field_types:
+                self._error(ErrorType.NAME_ERROR, f"Field to right of dot does not exist")
+            # If, during execution, the variable to the left of a dot is nil, then you must generate an error of ErrorType.FAULT_ERROR.
+            if fields is None:
+                self._error(ErrorType.FAULT_ERROR, f"can't access field of a nil struct")
+            # go deeper into nested structure
+            field = fields[struct_field]
+            struct_instance_type = field.type
+            fields = field.value
+        
+        # return the value at that field
+        return fields
+
+    def _eval_mul(self, expression):
+        # get the two operands
+        operand1 = expression.op1
+        operand2 = expression.op2
+        # get the operand values
+        operand1_value = self.do_evaluate_expression(operand1)
+        operand2_value = self.do_evaluate_expression(operand2)
+        
+        # special case to handle booleans which python interprets as ints
+        if type(operand1_value) is bool or type(operand2_value) is bool:
+            self._type_error()
+        
+        # if both the operands are of type int
+        if type(operand1_value) is type(operand2_value) is int:
+            return operand1_value * operand2_value
+        else:
+            self._type_error()
+
+    def _eval_div(self, expression):
+        # get the two operands
+        operand1 = expression.op1
+        operand2 = expression.op2
+        # get the operand values
+        operand1_value = self.do_evaluate_expression(operand1)
+        operand2_value = self.do_evaluate_expression(operand2)
+                    
+        # special case to handle booleans which python interprets as ints
+        if type(operand1_value) is bool or type(operand2_value) is bool:
+            self._type_error()
+        
+        # if both the operands are of type int
+        if type(operand1_value) is type(operand2_value) is int:
+            return operand1_value // operand2_value
+        else:
+            self._type_error()     
+
+    # case where we add 
+    def _eval_add(self, expression):
+        # get the two operands
+        operand1 = expression.op1
+        operand2 = expression.op2
+        # get the operand values
+        operand1_value = self.do_evaluate_expression(operand1)
+        operand2_value = self.do_evaluate_expression(operand2)
+        
+        # special case to handle booleans which python interprets as ints
+        if type(operand1_value) is bool or type(operand2_value) is bool:
+            self._type_error()
+        
+        # if both the operands are of type int or string (concatenate them)
+        elif type(operand1_value) is type(operand2_value) is int or type(operand1_value) is type(operand2_value) is str:
+            return operand1_value + operand2_value       
+        else:
+            self._type_error()
 
-        # case where we add 
-        elif expression.elem_type == '+':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-            
-            # special case to handle booleans which python interprets as ints
-            if isinstance(operand1_value, bool) or isinstance(operand2_value, bool):
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-            
-            # if both the operands are of type int or string (concatenate them)
-            elif isinstance(operand1_value, int) and isinstance(operand2_value, int) or isinstance(operand1_value, str) and isinstance(operand2_value, str):
-                return operand1_value + operand2_value       
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
+    # case where we subtract
+    def _eval_sub(self, expression):
+        # get the two operands
+        operand1 = expression.op1
+        operand2 = expression.op2
         
-        # case where we subtract
-        elif expression.elem_type == '-':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-                        
-            # special case to handle booleans which python interprets as ints
-            if isinstance(operand1_value, bool) or isinstance(operand2_value, bool):
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-                
-            # if both the operands are of type int
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int):
-                return operand1_value - operand2_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-                 
-                 
-        elif expression.elem_type == '==':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
+        # get the operand values
+        operand1_value = self.do_evaluate_expression(operand1)
+        operand2_value = self.do_evaluate_expression(operand2)
+                    
+        # special case to handle booleans which python interprets as ints
+        if type(operand1_value) is bool or type(operand2_value) is bool:
+            self._type_error()
             
-            # check that only strcuts are compared to nil
-            if self.do_evaluate_expression(operand2) == None:
-                # handles wnere var is not defined
-                operand1_value = self.do_evaluate_expression(operand1)
-                # check that we only compare structs to nil
-                if type(operand1_value) == int or type(operand1_value) == str or type(operand1_value) == bool:
-                    super().error(ErrorType.TYPE_ERROR, f"cant compare nonstruct to nil")
-                # we know its an int at this point
-                if operand1.elem_type == 'var':
-                    if (operand1_value == None):
+        # if both the operands are of type int
+        if type(operand1_value) is type(operand2_value) is int:
+            return operand1_value - operand2_value
+        else:
+            self._type_error()
+
+    def _eval_eq(self, expression):
+        # get the two operands
+        operand1 = expression.op1
+        operand2 = expression.op2
+        # evaluate each operand once (the second one first, which is the order the checks below have always run them in)
+        operand2_value = self.do_evaluate_expression(operand2)
+        operand1_value = self.do_evaluate_expression(operand1)
+        # the type of each operand is only worked out once too
+        operand1_type = type(operand1_value)
+        operand2_type = type(operand2_value)
+        
+        # check that only strcuts are compared to nil
+        if operand2_value is None:
+            # check that we only compare structs to nil
+            if operand1_type is int or operand1_type is str or operand1_type is bool:
+                self._error(ErrorType.TYPE_ERROR, f"cant compare nonstruct to nil")
+            # we know its an int at this point
+            if operand1.elem_type == 'var':
+                if (operand1_value is None):
+                    return True
+                # struct is not None
+                else:
+                    return False
+            
+        if operand1_value is None:
+            # check that we only compare structs to nil
+            if operand2_type is int or operand2_type is str or operand2_type is bool:
+                self._error(ErrorType.TYPE_ERROR, f"cant compare nonstruct to nil")
+            if operand2.elem_type == 'var':
+                if (operand2_value is None):
+                    return True
+                # struct is not None
+                else:
+                    return False
+
+        # check that we are comparing strucs of same type
+        if operand1.elem_type == 'var' and operand2.elem_type == 'var':
+            operand1variable = self._function_scope.get(operand1.name)
+            operand2variable = self._function_scope.get(operand2.name)
+            if operand1variable is not None and operand2variable is not None:
+                operand1type = operand1variable.type
+                operand2type = operand2variable.type
+                if (operand1type in self.struct_tracker and operand2type in self.struct_tracker):
+                    # handles struct comparison (true if point to same object)
+                    if (operand1type != operand2type):
+                        self._error(ErrorType.TYPE_ERROR, f"can't compare unrelated types {operand1type} and {operand2type}")
+                    # compares structs by reference
+                    if operand1variable.value is operand2variable.value:
                         return True
-                    # struct is not None
-                    else:
-                        return False
-                
-            if self.do_evaluate_expression(operand1) == None:
-                # handles wnere var is not defined
-                operand2_value = self.do_evaluate_expression(operand2)
-                # check that we only compare structs to nil
-                if type(operand2_value) == int or type(operand2_value) == str or type(operand2_value) == bool:
-                    super().error(ErrorType.TYPE_ERROR, f"cant compare nonstruct to nil")
-                if operand2.elem_type == 'var':
-                    if (operand2_value == None):
+                        
+        # handle case where we compare two structs (compare by object reference)
+        if operand1.elem_type == 'var' and operand2.elem_type == 'var':
+            if operand1_type is not bool and operand1_type is not str and operand1_type is not int:
+                if operand2_type is not bool and operand2_type is not str and operand2_type is not int:
+                    if operand1_value is operand2_value:
                         return True
-                    # struct is not None
-                    else:
+                    else: 
                         return False
-
-            # check that we are comparing strucs of same type
-            if operand1.elem_type == 'var' and operand2.elem_type == 'var':
-                operand1name = operand1.dict['name']
-                operand2name = operand2.dict['name']
-                if operand1name in self.call_stack[-1][0] and operand2name in self.call_stack[-1][0]:
-                    operand1type = self.call_stack[-1][0][operand1name]['type']
-                    operand2type = self.call_stack[-1][0][operand2name]['type']
-                    if (operand1type in self.struct_tracker and operand2type in self.struct_tracker):
-                        # handles struct comparison (true if point to same object)
-                        if (operand1type != operand2type):
-                            super().error(ErrorType.TYPE_ERROR, f"can't compare unrelated types {operand1type} and {operand2type}")
-                        # compares structs by reference
-                        if self.call_stack[-1][0][operand1name]['value'] is self.call_stack[-1][0][operand2name]['value']:
-                            return True
-                            
-            # handle case where we compare two structs (compare by object reference)
-            if operand1.elem_type == 'var' and operand2.elem_type == 'var':
-                operand1_value = self.do_evaluate_expression(operand1)
-                operand2_value = self.do_evaluate_expression(operand2)
-                if type(operand1_value) != bool and type(operand1_value) != str and type(operand1_value) != int:
-                    if type(operand2_value) != bool and type(operand2_value) != str and type(operand2_value) != int:
-                        if operand1_value is operand2_value:
-                            return True
-                        else: 
-                            return False
-            
+        
+        
+        # from here if we have a struct we know there is an issue
+        if operand1_type is not str and operand1_type is not bool and operand1_type is not int:
+            self._error(ErrorType.TYPE_ERROR, f"cant compare struct to primitive")   
             
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
+        if operand2_type is not str and operand2_type is not bool and operand2_type is not int:
+            self._error(ErrorType.TYPE_ERROR, f"cant compare struct to primitive")   
             
-            # from here if we have a struct we know there is an issue
-            if type(operand1_value) != str and type(operand1_value) != bool and type(operand1_value) != int:
-                super().error(ErrorType.TYPE_ERROR, f"cant compare struct to primitive")   
-                
-            if type(operand2_value) != str and type(operand2_value) != bool and type(operand2_value) != int:
-                super().error(ErrorType.TYPE_ERROR, f"cant compare struct to primitive")   
+        
+        # if both the operands are nil (None) return true
+        if (operand1_value is None and operand2_value is None):
+            return True
+        
+        # an attempt to compare a void type (e.g., the return of print()) to any other type must result in an error of ErrorType.TYPE_ERROR.
+        #if 
+        if (operand1_value == 'void' or operand2_value == 'void'):
+            self._error(ErrorType.TYPE_ERROR, "Can't compare void type")
+        
+        # check for comparing ints to bools which is allowed
+        # e.g., 5 == true would be true, false == 0 would be true
+        # have to be careful that we dont change an int to a bool if we actually want to compare two ints
+        if operand1_type is not operand2_type:
+            if operand1_type is int:
+                operand1_value = operand1_value != 0
+                operand1_type = bool
+            if operand2_type is int:
+                operand2_value = operand2_value != 0
+                operand2_type = bool
                 
-            
-            # if both the operands are nil (None) return true
-            if (operand1_value == None and operand2_value == None):
-                return True
-            
-            # an attempt to compare a void type (e.g., the return of print()) to any other type must result in an error of ErrorType.TYPE_ERROR.
-            #if 
-            if (operand1_value == 'void' or operand2_value == 'void'):
-                super().error(ErrorType.TYPE_ERROR, "Can't compare void type")
-            
-            # check for comparing ints to bools which is allowed
-            # e.g., 5 == true would be true, false == 0 would be true
-            # have to be careful that we dont change an int to a bool if we actually want to compare two ints
-            if type(operand1_value) != type(operand2_value):
-                if type(operand1_value) == int:
-                    operand1_value = self.int_to_bool_coercion(operand1_value)
-                if type(operand2_value) == int:
-                    operand2_value = self.int_to_bool_coercion(operand2_value)
+        # cant compare bool to string
+        if (operand1_type is bool and operand2_type is str) or (operand2_type is bool and operand1_type is str):
+            self._error(ErrorType.TYPE_ERROR, "Can't compare values of diff types")
+        
+        # if both the operands are of type int or type string or type bool
+        if operand1_type is operand2_type:
+            return operand1_value == operand2_value
+        else:
+            # values of diff types safety check
+            # self._error(ErrorType.TYPE_ERROR, "Can't compare values of diff types")
+            return False
+
+    def _eval_ne(self, expression):
+        # get the two operands
+        operand1 = expression.op1
+        operand2 = expression.op2
+        # evaluate each operand once (the second one first, which is the order the checks below have always run them in)
+        operand2_value = self.do_evaluate_expression(operand2)
+        operand1_value = self.do_evaluate_expression(operand1)
+        # the type of each operand is only worked out once too
+        operand1_type = type(operand1_value)
+        operand2_type = type(operand2_value)
+        
+        # check that only strcuts are compared to nil
+        if operand2_value is None:
+            # check that we only compare structs to nil
+            if operand1_type is int or operand1_type is str or operand1_type is bool:
+                self._error(ErrorType.TYPE_ERROR, f"cant compare nonstruct to nil")
+            if operand1.elem_type == 'var':
+                if (operand1_value is None):
+                    return False
+                # struct is not None
+                else:
+                    return True
                     
-            # cant compare bool to string
-            if (type(operand1_value) == bool and type(operand2_value) == str) or (type(operand2_value) == bool and type(operand1_value) == str):
-                super().error(ErrorType.TYPE_ERROR, "Can't compare values of diff types")
-            
-            # if both the operands are of type int or type string or type bool
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int) or isinstance(operand1_value, str) and isinstance(operand2_value, str) or isinstance(operand1_value, bool) and isinstance(operand2_value, bool):
-                return operand1_value == operand2_value
-            else:
-                # values of diff types safety check
-                # super().error(ErrorType.TYPE_ERROR, "Can't compare values of diff types")
-                return False
+        if operand1_value is None:
+            # check that we only compare structs to nil
+            if operand2_type is int or operand2_type is str or operand2_type is bool:
+                self._error(ErrorType.TYPE_ERROR, f"cant compare nonstruct to nil")
+            if operand2.elem_type == 'var':
+                if (operand2_value is None):
+                    return False
+                # struct is not None
+                else:
+                    return True
         
-        elif expression.elem_type == '!=':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-    
-            # check that only strcuts are compared to nil
-            if self.do_evaluate_expression(operand2) == None:
-                # handles wnere var is not defined
-                operand1_value = self.do_evaluate_expression(operand1)
-                # check that we only compare structs to nil
-                if type(operand1_value) == int or type(operand1_value) == str or type(operand1_value) == bool:
-                    super().error(ErrorType.TYPE_ERROR, f"cant compare nonstruct to nil")
-                if operand1.elem_type == 'var':
-                    if (operand1_value == None):
+        if operand1.elem_type == 'var' and operand2.elem_type == 'var':
+            if operand1_type is not bool and operand1_type is not str and operand1_type is not int:
+                if operand2_type is not bool and operand2_type is not str and operand2_type is not int:
+                    if operand1_value is operand2_value:
                         return False
-                    # struct is not None
-                    else:
+                    else: 
                         return True
-                        
-            if self.do_evaluate_expression(operand1) == None:
-                # handles wnere var is not defined
-                operand2_value = self.do_evaluate_expression(operand2)
-                # check that we only compare structs to nil
-                if type(operand2_value) == int or type(operand2_value) == str or type(operand2_value) == bool:
-                    super().error(ErrorType.TYPE_ERROR, f"cant compare nonstruct to nil")
-                if operand2.elem_type == 'var':
-                    if (operand2_value == None):
+        
+        # check that are are comparing strucs of same type
+        if operand1.elem_type == 'var' and operand2.elem_type == 'var':
+            operand1variable = self._function_scope.get(operand1.name)
+            operand2variable = self._function_scope.get(operand2.name)
+            if operand1variable is not None and operand2variable is not None:
+                operand1type = operand1variable.type
+                operand2type = operand2variable.type
+                if (operand1type in self.struct_tracker and operand2type in self.struct_tracker):
+                    # compares structs by reference
+                    if operand1variable.value is operand2variable.value:
                         return False
-                    # struct is not None
-                    else:
-                        return True
-            
-            if operand1.elem_type == 'var' and operand2.elem_type == 'var':
-                operand1_value = self.do_evaluate_expression(operand1)
-                operand2_value = self.do_evaluate_expression(operand2)
-                
-                if type(operand1_value) != bool and type(operand1_value) != str and type(operand1_value) != int:
-                    if type(operand2_value) != bool and type(operand2_value) != str and type(operand2_value) != int:
-                        if operand1_value is operand2_value:
-                            return False
-                        else: 
-                            return True
-            
-            # check that are are comparing strucs of same type
-            if operand1.elem_type == 'var' and operand2.elem_type == 'var':
-                operand1name = operand1.dict['name']
-                operand2name = operand2.dict['name']
-                if operand1name in self.call_stack[-1][0] and operand2name in self.call_stack[-1][0]:
-                    operand1type = self.call_stack[-1][0][operand1name]['type']
-                    operand2type = self.call_stack[-1][0][operand2name]['type']
-                    if (operand1type in self.struct_tracker and operand2type in self.struct_tracker):
-                        # compares structs by reference
-                        if self.call_stack[-1][0][operand1name]['value'] is self.call_stack[-1][0][operand2name]['value']:
-                            return False
-                        if (operand1type != operand2type):
-                            super().error(ErrorType.TYPE_ERROR, f"can't compare unrelated types {operand1type} and {operand2type}")
-            
-            
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
+                    if (operand1type != operand2type):
+                        self._error(ErrorType.TYPE_ERROR, f"can't compare unrelated types {operand1type} and {operand2type}")
+        
+        
+        # from here if we have a struct we know there is an issue
+        if operand1_type is not str and operand1_type is not bool and operand1_type is not int:
+            self._error(ErrorType.TYPE_ERROR, f"cant compare struct to primitive")   
             
-            # from here if we have a struct we know there is an issue
-            if type(operand1_value) != str and type(operand1_value) != bool and type(operand1_value) != int:
-                super().error(ErrorType.TYPE_ERROR, f"cant compare struct to primitive")   
+        if operand2_type is not str and operand2_type is not bool and operand2_type is not int:
+            self._error(ErrorType.TYPE_ERROR, f"cant compare struct to primitive")   
+        
+        # if both the operands are nil (None)
+        if (operand1_value is None and operand2_value is None):
+            return False
+        
+        # an attempt to compare a void type (e.g., the return of print()) to any other type must result in an error of ErrorType.TYPE_ERROR.
+        if (operand1_value == 'void' or operand2_value == 'void'):
+            self._error(ErrorType.TYPE_ERROR, "Can't compare void type")
+        
+        # check for comparing ints to bools which is allowed
+        # e.g., 5 == true would be true, false == 0 would be true
+        # have to be careful that we dont change an int to a bool if we actually want to compare two ints
+        if operand1_type is not operand2_type:
+            if operand1_type is int:
+                operand1_value = operand1_value != 0
+                operand1_type = bool
+            if operand2_type is int:
+                operand2_value = operand2_value != 0
+                operand2_type = bool
                 
-            if type(operand2_value) != str and type(operand2_value) != bool and type(operand2_value) != int:
-                super().error(ErrorType.TYPE_ERROR, f"cant compare struct to primitive")   
-            
-            # if both the operands are nil (None)
-            if (operand1_value == None and operand2_value == None):
-                return False
-            
-            # an attempt to compare a void type (e.g., the return of print()) to any other type must result in an error of ErrorType.TYPE_ERROR.
-            if (operand1_value == 'void' or operand2_value == 'void'):
-                super().error(ErrorType.TYPE_ERROR, "Can't compare void type")
-            
-            # check for comparing ints to bools which is allowed
-            # e.g., 5 == true would be true, false == 0 would be true
-            # have to be careful that we dont change an int to a bool if we actually want to compare two ints
-            if type(operand1_value) != type(operand2_value):
-                if type(operand1_value) == int:
-                    operand1_value = self.int_to_bool_coercion(operand1_value)
-                if type(operand2_value) == int:
-                    operand2_value = self.int_to_bool_coercion(operand2_value)
+        # cant compare bool to string
+        if (operand1_type is bool and operand2_type is str) or (operand2_type is bool and operand1_type is str):
+            self._error(ErrorType.TYPE_ERROR, "Can't compare values of diff types")
+    
+        # if both the operands are of type int or type string or type bool
+        if operand1_type is operand2_type:
+            # compare operands
+            return operand1_value != operand2_value
+        else:
+            # # values of diff types safety check
+            # we return true since != says they are not equal
+            return True
+
+    def _eval_lt(self, expression):
+        # get the two operands
+        operand1 = expression.op1
+        operand2 = expression.op2
+        # get the operand values
+        operand1_value = self.do_evaluate_expression(operand1)
+        operand2_value = self.do_evaluate_expression(operand2)
+        
+        # an attempt to compare a void type (e.g., the return of print()) to any other type must result in an error of ErrorType.TYPE_ERROR.
+        if (operand1_value == 'void' or operand2_value == 'void'):
+            self._error(ErrorType.TYPE_ERROR, "Can't compare void type")
+        
+        # special case to handle booleans which python interprets as ints
+        if type(operand1_value) is bool or type(operand2_value) is bool:
+            self._type_error()
+        
+        # if both the operands are of type int
+        if type(operand1_value) is type(operand2_value) is int:
+            # compare operands
+            return operand1_value < operand2_value
+        else:
+            self._type_error()
+
+    def _eval_le(self, expression):
+        # get the two operands
+        operand1 = expression.op1
+        operand2 = expression.op2
+        # get the operand values
+        operand1_value = self.do_evaluate_expression(operand1)
+        operand2_value = self.do_evaluate_expression(operand2)
+        
+        # an attempt to compare a void type (e.g., the return of print()) to any other type must result in an error of ErrorType.TYPE_ERROR.
+        if (operand1_value == 'void' or operand2_value == 'void'):
+            self._error(ErrorType.TYPE_ERROR, "Can't compare void type")
                     
-            # cant compare bool to string
-            if (type(operand1_value) == bool and type(operand2_value) == str) or (type(operand2_value) == bool and type(operand1_value) == str):
-                super().error(ErrorType.TYPE_ERROR, "Can't compare values of diff types")
+        # special case to handle booleans which python interprets as ints
+        if type(operand1_value) is bool or type(operand2_value) is bool:
+            self._type_error()
         
-            # if both the operands are of type int or type string or type bool
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int) or isinstance(operand1_value, str) and isinstance(operand2_value, str) or isinstance(operand1_value, bool) and isinstance(operand2_value, bool):
-                # compare operands
-                return operand1_value != operand2_value
-            else:
-                # # values of diff types safety check
-                # we return true since != says they are not equal
-                return True
-            
-                
-        elif expression.elem_type == '<':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-            
-            # an attempt to compare a void type (e.g., the return of print()) to any other type must result in an error of ErrorType.TYPE_ERROR.
-            if (operand1_value == 'void' or operand2_value == 'void'):
-                super().error(ErrorType.TYPE_ERROR, "Can't compare void type")
-            
-            # special case to handle booleans which python interprets as ints
-            if isinstance(operand1_value, bool) or isinstance(operand2_value, bool):
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-            
-            # if both the operands are of type int
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int):
-                # compare operands
-                return operand1_value < operand2_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-                
-        elif expression.elem_type == '<=':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-            
-            # an attempt to compare a void type (e.g., the return of print()) to any other type must result in an error of ErrorType.TYPE_ERROR.
-            if (operand1_value == 'void' or operand2_value == 'void'):
-                super().error(ErrorType.TYPE_ERROR, "Can't compare void type")
-                        
-            # special case to handle booleans which python interprets as ints
-            if isinstance(operand1_value, bool) or isinstance(operand2_value, bool):
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-            
-            # if both the operands are of type int
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int):
-                # compare operands
-                return operand1_value <= operand2_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-                
-        elif expression.elem_type == '>':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-            
-            # an attempt to compare a void type (e.g., the return of print()) to any other type must result in an error of ErrorType.TYPE_ERROR.
-            if (operand1_value == 'void' or operand2_value == 'void'):
-                super().error(ErrorType.TYPE_ERROR, "Can't compare void type")
-                 
-            # special case to handle booleans which python interprets as ints
-            if isinstance(operand1_value, bool) or isinstance(operand2_value, bool):
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-            
-            # if both the operands are of type int
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int):
-                # compare operands
-                return operand1_value > operand2_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-                
-        elif expression.elem_type == '>=':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-            
-            # an attempt to compare a void type (e.g., the return of print()) to any other type must result in an error of ErrorType.TYPE_ERROR.
-            if (operand1_value == 'void' or operand2_value == 'void'):
-                super().error(ErrorType.TYPE_ERROR, "Can't compare void type")
-                        
-            # special case to handle booleans which python interprets as ints
-            if isinstance(operand1_value, bool) or isinstance(operand2_value, bool):
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )
-            
-            # if both the operands are of type int
-            if isinstance(operand1_value, int) and isinstance(operand2_value, int):
-                # compare operands
-                return operand1_value >= operand2_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )                
+        # if both the operands are of type int
+        if type(operand1_value) is type(operand2_value) is int:
+            # compare operands
+            return operand1_value <= operand2_value
+        else:
+            self._type_error()
+
+    def _eval_gt(self, expression):
+        # get the two operands
+        operand1 = expression.op1
+        operand2 = expression.op2
+        # get the operand values
+        operand1_value = self.do_evaluate_expression(operand1)
+        operand2_value = self.do_evaluate_expression(operand2)
         
-        # unary operation: negation - (ex: -5)
-        elif expression.elem_type == 'neg':
-            # get the operand
-            operand1 = expression.dict['op1']
-            # get the operand value
-            operand1_value = self.do_evaluate_expression(operand1)
-            
-            # operand must be of type int (handles case hwere bool is not intepreted as int)
-            if isinstance(operand1_value, int) and type(operand1_value) != bool:
-                # negate the value
-                return -operand1_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )         
-            
-        # unary operation: logical not ! (ex: !true)
-        elif expression.elem_type == '!':
-            # get the operand
-            operand1 = expression.dict['op1']
-            
-            # get the operand value
-            operand1_value = self.do_evaluate_expression(operand1)
-            if type(operand1_value) == int:
-                operand1_value = self.int_to_bool_coercion(operand1_value)
-            
-            # operand must be of type bool
-            if isinstance(operand1_value, bool):
-                # logical negation (Python uses the keyword not)
-                return not operand1_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )       
-                
-        # and operator
-        elif expression.elem_type == '&&':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-            
-            # checking the value of an integer in an and/or expression, e.g., if (int_variable || bool_variable && other_int_variable) { /* do this */ }
-            if type(operand1_value) == int:
-                operand1_value = self.int_to_bool_coercion(operand1_value)
-            if type(operand2_value) == int:
-                operand2_value = self.int_to_bool_coercion(operand2_value)  
-            
-            
-            # if both the operands are of type bool
-            if isinstance(operand1_value, bool) and isinstance(operand2_value, bool):
-                # compare operands
-                return operand1_value and operand2_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )   
-            
-        # or operator
-        elif expression.elem_type == '||':
-            # get the two operands
-            operand1 = expression.dict['op1']
-            operand2 = expression.dict['op2']
-            # get the operand values
-            operand1_value = self.do_evaluate_expression(operand1)
-            operand2_value = self.do_evaluate_expression(operand2)
-            
-            # checking the value of an integer in an and/or expression, e.g., if (int_variable || bool_variable && other_int_variable) { /* do this */ }
-            if type(operand1_value) == int:
-                operand1_value = self.int_to_bool_coercion(operand1_value)
-            if type(operand2_value) == int:
-                operand2_value = self.int_to_bool_coercion(operand2_value)  
-            
-            # if both the operands are of type bool
-            if isinstance(operand1_value, bool) and isinstance(operand2_value, bool):
-                # compare operands
-                return operand1_value or operand2_value
-            else:
-                super().error(
-                    ErrorType.TYPE_ERROR,
-                    "Incompatible types for arithmetic operation",
-                )     
-    
-
-    def current_scope(self):
-        # Return the current scope (top of the stack) (the scope is an a list of dictonaries, every dictionary corresponds to the functions scope and if/for loop scopes in that function)
-        return self.call_stack[-1] 
-    
-    
-
-    
-####################### proj 3 test cases ##########################
-    
-#     test_ret1 = """
-#         func main() : int {
-#             print(foo());
-#         }
-#         func foo() : int {
-#             return 1;
-#         }  
-#         """
+        # an attempt to compare a void type (e.g., the return of print()) to any other type must result in an error of ErrorType.TYPE_ERROR.
+        if (operand1_value == 'void' or operand2_value == 'void'):
+            self._error(ErrorType.TYPE_ERROR, "Can't compare void type")
+             
+        # special case to handle booleans which python interprets as ints
+        if type(operand1_value) is bool or type(operand2_value) is bool:
+            self._type_error()
         
-#     test_print = """
-#                 func main() : void {
-#                     print(5);
-#                     print("Hello, Brewin++!");
-#                     print("Hello");
-#                     print("World");
-#                 }
-#                 """
-                
-#     test_int_return_from_func = """
-#                         func main() : void {
-#                             print(getFive());
-#                         }
-
-#                         func getFive() : int {
-#                             return 5;
-#                         }
-#                         """
-
-
-#     test_basic_addition = """
-#                 func main() : void {
-#                     print(add(2, 3));
-#                 }
-
-#                 func add(a: int, b: int) : int {
-#                     return a + b;
-#                 }
-#                 """
-                
-#     test_define_and_print = """
-#             func main() : void {
-#                 var x: int;
-#                 x = 10;
-#                 print(x);
-#             }
-#             """
-            
-#     # should throw a type error
-#     test_assign1 = """
-#                 func main() : int {
-#                     var a: int; 
-#                     a = true;
-#                     print(a);
-#                 }
-#                 """
-                
-#     #should throw a type error
-#     test_pass2 = """
-#             func main() : void {
-#                 var a: bool; 
-#                 a = true;
-#                 foo(a);
-#             }
-            
-#             func foo(x:int) : void {
-#                 print(x);
-#             }
-#             """
+        # if both the operands are of type int
+        if type(operand1_value) is type(operand2_value) is int:
+            # compare operands
+            return operand1_value > operand2_value
+        else:
+            self._type_error()
+
+    def _eval_ge(self, expression):
+        # get the two operands
+        operand1 = expression.op1
+        operand2 = expression.op2
+        # get the operand values
+        operand1_value = self.do_evaluate_expression(operand1)
+        operand2_value = self.do_evaluate_expression(operand2)
         
-#     # should throw a fault error
-#     test_assign_nil = """
-#             struct s {
-#                 a:int;
-#             }
-
-#             func main() : int {
-#                 var x: s;
-#                 x = new s;
-#                 x = nil;
-#                 print(x.a);
-                
-#             }
-#             """
-            
-            
-#     test_struct2 = """
-#     struct foo {
-#         i:int;
-#     }
-
-#     struct bar {
-#         f:foo;
-#     }
-
-#     func main() : void {
-#         var b : bar;
-#         b = new bar;
-#         b.f.i = 10;
-#         print(b.f.i);
-#     }
-#     """
-    
-    
-#     test_multi_dot = """
-#         struct ant {
-#             i:int;
-#         }
-
-#         struct bat {
-#             a:ant;
-#         }
-
-#         struct cat {
-#             b:bat;
-#         }
-
-#         struct dog {
-#             c:cat;
-#         }
-
-#         func main() : int {
-#             var d: dog; 
-#             d = new dog;
-#             d.c = new cat;
-#         }
-#         """
-    
-#     test_struct2 = """
-
-#         struct foo {
-#             i:int;
-#         }
-
-#         struct bar {
-#             f:foo;
-#         }
-
-#         func main() : void {
-#             var b : bar;
-#             b = new bar;
-#             b.f = new foo;
-#             b.f.i = 10;
-#             print(b.f.i);
-#         }
-#         """
-
-#     test_struct1 = """
-#         struct foo {
-#             a:int;
-#             b:bool;
-#             c:string;
-#         }
-
-#         func main() : void {
-#             var s1 : foo;
-#             print(s1);
-
-#             s1 = new foo;
-#             print(s1.a);
-#             print(s1.b);
-#             print(s1.c);
-            
-#             s1.a = 10;
-#             s1.b = true;
-#             s1.c = "barf";
-#             print(s1.a);
-#             print(s1.b);
-#             print(s1.c);
-#         }
-#     """
-
-#     test_multi_dot = """
-    
-#         struct ant {
-#             i:int;
-#         }
+        # an attempt to compare a void type (e.g., the return of print()) to any other type must result in an error of ErrorType.TYPE_ERROR.
+        if (operand1_value == 'void' or operand2_value == 'void'):
+            self._error(ErrorType.TYPE_ERROR, "Can't compare void type")
+                    
+        # special case to handle booleans which python interprets as ints
+        if type(operand1_value) is bool or type(operand2_value) is bool:
+            self._type_error()
         
-#         struct bat {
-#             a:ant;
-#         }
-
-#         struct cat {
-#             b:bat;
-#         }
-
-#         struct dog {
-#             c:cat;
-#         }
-
-#         func main() : int {
-#         var d: dog; 
-#         d = new dog;
-#         d.c = new cat;
-#         d.c.b = new bat;
-#         d.c.b.a = new ant;
-#         d.c.b.a.i = 15;
+        # if both the operands are of type int
+        if type(operand1_value) is type(operand2_value) is int:
+            # compare operands
+            return operand1_value >= operand2_value
+        else:
+            self._type_error()                
+
+    # unary operation: negation - (ex: -5)
+    def _eval_neg(self, expression):
+        # get the operand
+        operand1 = expression.op1
+        # get the operand value
+        operand1_value = self.do_evaluate_expression(operand1)
         
-#         print(d.c.b.a.i);
-#         }
-#     """
-
-#     test_challenge1 = """
-    
-#     struct list {
-#     val: int;
-#     next: list;
-# }
-
-# func cons(val: int, l: list) : list {
-#     var h: list;
-#     h = new list;
-#     h.val = val;
-#     h.next = l;
-#     return h;
-# }
-
-# func rev_app(l: list, a: list) : list {
-#     if (l == nil) {
-#         return a;
-#     }
-
-#     return rev_app(l.next, cons(l.val, a));
-# }
-
-# func reverse(l: list) : list {
-#     var a: list;
-
-#     return rev_app(l, a);
-# }
-
-# func print_list(l: list): void {
-#     var x: list;
-#     var n: int;
-#     for (x = l; x != nil; x = x.next) {
-#         print(x.val);
-#         n = n + 1;
-#     }
-#     print("N=", n);
-# }
-
-# func main() : void {
-#     var n: int;
-#     var i: int;
-#     var l: list;
-#     var r: list;
+        # operand must be of type int (handles case hwere bool is not intepreted as int)
+        if type(operand1_value) is int:
+            # negate the value
+            return -operand1_value
+        else:
+            self._type_error()         
 
-#     n = inputi();
-#     for (i = n; i; i = i - 1) {
-#         var n: int;
-#         n = inputi();
-#         l = cons(n, l);
-#     }
-#     r = reverse(l);
-#     print_list(r);
-# }
-#             """
-            
-            
-#     test_spec_trust = """
-#         struct Person { 
-#         name: string; 
-#         age: int; 
-#         student: bool;
-#         }
+    # unary operation: logical not ! (ex: !true)
+    def _eval_not(self, expression):
+        # get the operand
+        operand1 = expression.op1
         
-#         func main() : void { 
-#         var p: Person;
-#         p = new Person; 
-#         p.name = "Carey"; 
-#         p.age = 21; 
-#         p.student = false; 
-#         foo(p);
-#         }
+        # get the operand value
+        operand1_value = self.do_evaluate_expression(operand1)
+        if type(operand1_value) is int:
+            operand1_value = operand1_value != 0
         
-#         func foo(p : Person) : void {
-#         print(p.name, " is ", p.age, " years old.");
-#         }               
-#                 """
-             
-#     test_spec_nil = """
-#         struct dog {
-#             name: string; 
-#             vaccinated: bool;
-#         }
-#         func main() : void {
-#         var d: dog;    /* d is an object reference whose value is nil */
-#         print (d == nil);  /* prints true, because d was initialized to nil */
-#         }
-#             """    
+        # operand must be of type bool
+        if type(operand1_value) is bool:
+            # logical negation (Python uses the keyword not)
+            return not operand1_value
+        else:
+            self._type_error()       
+
+    # and operator
+    def _eval_and(self, expression):
+        # get the two operands
+        operand1 = expression.op1
+        operand2 = expression.op2
+        # get the first operand value
+        operand1_value = self.do_evaluate_expression(operand1)
         
+        # checking the value of an integer in an and/or expression, e.g., if (int_variable || bool_variable && other_int_variable) { /* do this */ }
+        if type(operand1_value) is int:
+            operand1_value = operand1_value != 0
         
-#     test_spec_false_nil = """
-#     struct flea {
-#         age: int;
-#         infected : bool;
-#     }
-#     struct dog {
-#         name: string; 
-#         vaccinated: bool; 
-#         companion: flea;
-#     }
-#     func main() : void {
-#         var d: dog;
-#         d = new dog; /* sets d object reference to point to a dog structure */
-#         print(d.vaccinated); /* prints false - default bool value */
-#         print(d.companion); /* prints nil - default struct object reference */
-#         /* we may now set d's fields */
-#         d.name = "Koda"; 
-#         d.vaccinated = true;
-#         d.companion = new flea;
-#         d.companion.age = 3;
-#         print("d AFTER COMPANION", d);
-#         print(d.companion.age);
-#     }
-#     """
-
-#     test_oscar = """
-    
-#         struct Person {
-#       name: string;
-#       age: int;
-#       student: bool;
-#       friend: Person;
-#     }
-    
-    
-#     struct Dog {
-#         name: string;
-#         dog_years: int;
-#         sibilings: Dog;
-#       }
-
-
-#       func main() : void {
-#         var a: Person;
-#         a = new Person;
-#         a.name = "bruh";
-#         a.friend = new Person;
-#         a.friend.name = "friend 2";
-#         a.friend.friend = new Person;
-#         a.friend.friend.name = "friend 3";
-#         print(a.name);
-#         print(a.friend.friend.name);
-#       }
-    
-    
-#     """
-    
-#     test_pass_by_or1 = """
-#         struct foo {
-#             a:int;
-#             }
-
-#         func main() : int {
-#             var f: foo; 
-#             f = new foo;
-#             var ten: int;
-#             ten = 10;
-#             f.a = ten;
-#             foo(f);
-#             print(f.a);
-#             print(ten);
-#         }
-
-#         func foo(x:foo) : void {
-#             x.a = 20;
-#         }
-#     """
-    
-#     # should be a fault error
-#     test_assign_nil = """
-#     struct s {
-#         a:int;
-#     }
-
-#     func main() : int {
-#         var x: s;
-#         x = new s;
-#         x = nil;
-#         print(x.a);
-#     }
-#     """
-
-#     #should be a TYPE Error
-#     test_cmp_void3 = """
-    
-#     func main() : void {
-#         var b: bool;
-#         b = foo() == nil;
-#         print(foo());
-#     }
-
-#     func foo() : void {
-#         var a: int;
-#     }  
-#     """
-
-
-
-
-
-
-
-# ########## student Test cases ############################
-
-
-# def main():
-    
-# #     test_brewinpp = """
-    
-# #         func main() : void {
-# #         var n : int;
-# #         n = inputi("Enter a number: ");
-# #         print(fact(n));
-# #         }
-
-# #         func fact(n : int) : int {
-# #         if (n <= 1) { return 1; }
-# #         return n * fact(n-1);
-# # }
-    
-# #     """
-    
-# #     test_coerce_struct = """
-# #     struct animal {
-# #     name : string;
-# #     noise : string;
-# #     color : string;
-# #     extinct : bool;
-# #     ears: int; 
-# #     }
-# #     func main() : void {
-# #     var pig : animal;
-# #     var extinct : bool;
-# #     extinct = make_pig(pig, 0);
-# #     print(extinct);
-# #     }
-# #     func make_pig(a : animal, extinct : int) : bool{
-# #     if (a == nil){
-# #         print("making a pig");
-# #         a = new animal;
-# #     }
-# #     a.extinct = extinct;
-# #     return a.extinct;
-# # }
-# #     """
-    
-# #     test_coercion1 = """
-# #     func main() : void {
-# #   print(5 || false);
-# #   var a:int;
-# #   a = 1;
-# #   if (a) {
-# #     print("if works on integers now!");
-# #   }
-# #   foo(a-1);
-# # }
-
-# # func foo(b : bool) : void {
-# #   print(b);
-# # }
-# # """
-
-# #     test_default_ret1 = """
-# #     func main() : void {
-# #         print(foo());
-# #         print(bar());
-# #     }
-
-# #     func foo() : int {
-# #         return; /* returns 0 */
-# #     }
-    
-# #     func bar() : bool { 
-# #         print("bar");
-# #     }  /* returns false*/
-    
-# #     """
-    
-# #     test_default_ret2 = """
-# #     struct dog {
-# #         bark: int;
-# #         bite: int;
-# #     }
-
-# #     func bar() : int {
-# #         return;  /* no return value specified - returns 0 */
-# #     }
-
-# #     func bletch() : bool {
-# #         print("hi");
-# #         /* no explicit return; bletch must return default bool of false */
-# #     }
-
-# #     func boing() : dog {
-# #         return;  /* returns nil */
-# #     }
-
-# #     func main() : void {
-# #         var val: int;
-# #         val = bar();
-# #         print(val);  /* prints 0 */
-# #         print(bletch()); /* prints false */
-# #         print(boing()); /* prints nil */
-# #     }
-# #     """
-    
-# #     test_functions1 = """
-# #     func foo(a:int, b:string, c:int, d:bool) : int {
-# #         print(b, d);
-# #         return a + c;
-# #     }
-
-# #     func talk_to(name:string): void {
-# #         if (name == "Carey") {
-# #             print("Go away!");
-# #             return;  /* using return is OK w/void, just don't specify a value */
-# #         }
-# #         print("Greetings");
-# #     }
-
-# #     func main() : void {
-# #         print(foo(10, "blah", 20, false));
-# #         talk_to("Bonnie");
-# #     }
-# #     """
-    
-# #     test_nil_ret = """
-# #     struct person {
-# #         name : string;
-# #     }
-# #     func incorrect() : int{
-# #         var x : int;
-# #         return 9;
-# #     }
-# #     func correct() : person{
-# #         print("i should print");
-# #         return nil;
-# #     }
-# #     func main() : void{
-# #         print("hi");
-# #         correct();
-# #         incorrect();
-# #     }  
-# #     """
-    
-    
-# #     test_nil_ret2 = """
-# #     struct person {
-# #     name : string;
-# #     }
-# #     func incorrect() : int{
-# #     var x : int;
-# #     return 9;
-# #     }
-# #     func correct() : person{
-# #     print("i should print");
-# #     return;
-# #     }
-# #     func main() : void{
-# #     var p : person;
-# #     print("hi");
-# #     p = correct();
-# #     print(p);
-# #     print(correct());
-# #     incorrect();
-# #     }
-# #     """
-    
-# #     test_nil_struct = """
-# #         struct animal {
-# #         name : string;
-# #         noise : string;
-# #         color : string;
-# #         extinct : bool;
-# #         ears: int; 
-# #     }
-# #     func main() : void {
-# #     var pig : animal;
-# #     var noise : string;
-# #     noise = make_pig(pig);
-# #     print(noise);
-# #     }
-# #     func make_pig(a : animal) : string{
-# #     if (a == nil){
-# #         print("making a pig");
-# #         a = new animal;
-# #     }
-# #     a.noise = "oink";
-# #     return a.noise;
-# #     }
-# #     """
-    
-# #     test_obj_ref1 = """
-# #     struct dog {
-# #     name: string;
-# #     vaccinated: bool;  
-# #     }
-
-# #     func main() : void {
-# #     var d: dog;
-# #     d = new dog;
-# #     steal_dog(d, "My new Dog");
-# #     print(d.name);
-# #     }
-
-# #     func steal_dog(d : dog, name: string) : void {
-# #     d.name = name;
-# #     }
-# #     """
-    
-# #     test_obj_ref2 = """
-# #     struct dog {
-# #   name: string;
-# #   vaccinated: bool;  
-# # }
-
-# # func main() : void {
-# #   var d: dog;
-# #   d = steal_dog(new dog, "Spots");
-# #   print(d.name);
-
-# #   }
-
-# # func steal_dog(d : dog, name: string) : dog {
-# #   d.name = name;
-# #   return d;
-# # }
-# #     """
-    
-# #     test_obj_ref3 = """
-# #     struct dog {
-# #  bark: int;
-# #  bite: int;
-# # }
-
-# # func foo(d: dog) : dog {  /* d holds the same object reference that the koda variable holds */
-# #   d.bark = 10;
-# #   return d;  		/* this returns the same object reference that the koda variable holds */
-# # }
-
-# #  func main() : void {
-# #   var koda: dog;
-# #   var kippy: dog;
-# #   koda = new dog;
-# #   kippy = foo(koda);	/* kippy holds the same object reference as koda */
-# #   kippy.bite = 20;
-# #   print(koda.bark, " ", koda.bite); /* prints 10 20 */
-# # }
-# #     """
-    
-# #     test_self_ref_struct = """
-# #     struct node {
-# #         value: int;
-# #         next: node;
-# #     }
-
-# #     func main() : void {
-# #         var n : node;
-# #           print(n);
-# #           n = new node;
-# #           print(n.value);
-# #           print(n.next);
-          
-# #     }
-# #     """
-    
-# #     test_self_ref_struct2 = """
-# #     struct node {
-# #   value: int;
-# #   next: node;
-# # }
-
-# # func main() : void {
-# #   var n : node;
-# #   var p : node;
-# #   var q : node; 
-# #   print(n);
-# #   n = new node;
-# #   p = new node;
-# #   q = new node;
-# #   n.value = 9;
-# #   n.next = p;
-# #   print(n.value);
-# #   p.value = 9;
-# #   print(p.value);
-# #   print(p.next);
-# #   print(n.next.value);
-# #   n.next.next = q;
-# #   n.next.next.value = 10;
-# #   print(p.next.value);
-# #   print(q.value + 1);
-# # }
-# #     """
-    
-# #     test_structs_1 = """
-# #     struct flea {
-# #   age: int;
-# #   infected : bool;
-# # }
-
-# # struct dog {
-# #   name: string;
-# #   vaccinated: bool;  
-# #   companion: flea;
-# # }
-
-# # func main() : void {
-# #   var d: dog;     
-# #   d = new dog;   /* sets d object reference to point to a dog structure */
-
-# #   print(d.vaccinated); /* prints false - default bool value */
-# #   print(d.companion); /* prints nil - default struct object reference */
-
-# #   /* we may now set d's fields */
-# #   d.name = "Koda";
-# #   d.vaccinated = true;
-# #   d.companion = new flea;
-# #   d.companion.age = 3; 
-# # }
-    
-# #     """
-    
-# #     test_structs1 = """
-# # struct Person {
-# #   name: string;
-# #   age: int;
-# #   student: bool;
-# # }
-
-# # func main() : void {
-# #   var p: Person;
-# #   p = new Person;
-# #   p.name = "Carey";
-# #   p.age = 21;
-# #   p.student = false;
-# #   foo(p);
-# # }
-
-# # func foo(p : Person) : void {
-# #   print(p.name, " is ", p.age, " years old.");
-# # } 
-    
-    
-# #     """
-    
-# #     test_structs2 = """
-# #     struct animal {
-# #     name : string;
-# #     extinct : bool;
-# #     ears: int; 
-# # }
-# # func main() : void {
-# #    var pig : animal;
-# #    var ret: bool;
-# #    ret = is_extinct(pig);
-# #    print(ret);
-# #    pig = new animal;
-# #    pig.extinct = true;
-# #    ret = is_extinct(pig);
-# #    print(ret);
-# #    destroy_animals("pig", pig);
-# #    print(pig.extinct);
-   
-# # }
-# # func is_extinct(p : animal) : bool {
-# #   if (p == nil){
-# #     print("i go in here first");
-# #     return 0;
-# #   }
-# #   else{
-# #     return p.extinct;
-# #   }
-# # }
-# # func destroy_animals(name: string, p : animal) : animal{
-# #   if (p==nil){
-# #      p = new animal;
-# #   }
-# #   name = inputs("What animal do you want to destroy?");
-# #   p.name = name;
-# #   p.extinct = true;
-# #   print("Destroyed animal ", p.name);
-# #   return nil;
-# # }
-    
-# #     """
-    
-# #     test_structs3 = """
-# #     struct animal {
-# #     name : string;
-# #     extinct : bool;
-# #     ears: int; 
-# # }
-# # func main() : void {
-# #    var pig : animal;
-# #    var ret: bool;
-# #    var hm : animal;
-# #    ret = is_extinct(pig);
-# #    print(ret);
-# #    pig = new animal;
-# #    pig.extinct = true;
-# #    ret = is_extinct(pig);
-# #    print(ret);
-# #    hm = destroy_animals("pig", pig);
-# #    print(pig.extinct);
-# #    print(hm);
-   
-# # }
-# # func is_extinct(p : animal) : bool {
-# #   if (p == nil){
-# #     print("i go in here first");
-# #     return 0;
-# #   }
-# #   else{
-# #     return p.extinct;
-# #   }
-# # }
-# # func destroy_animals(name: string, p : animal) : animal{
-# #   if (p==nil){
-# #      p = new animal;
-# #   }
-# #   name = inputs("What animal do you want to destroy?");
-# #   p.name = name;
-# #   p.extinct = true;
-# #   print("Destroyed animal ", p.name);
-# #   return nil;
-# # }
-# #     """
-    
-# #     test_unitnit_struct = """
-    
-# #     struct dog {
-# #   name: string;
-# #   vaccinated: bool;  
-# # }
-
-# # func main() : void {
-# #   var d: dog;    /* d is an object reference whose value is nil */
-
-# #   print (d == nil);  /* prints true, because d was initialized to nil */
-# # }
-    
-# #     """
-    
-    
-# #     ####################### fails ####################
-# #     test_dot_op1 = """
-# #     func main() : void {
-# #         var x : int;
-# #         x = 5;
-# #         print(x.name);
-# #     }
-# #     """
-    
-# #     test_dot_op2 = """
-# #     struct animal {
-# #     name : string;
-# #     noise : string;
-# #     color : string;
-# #     extinct : bool;
-# #     ears: int; 
-# # }
-# # func main() : void {
-# #    var pig : animal;
-# #    pig.noise = "oink";
-# # }
-# #     """
-    
-# #     test_dot_op3 = """
-# #     struct animal {
-# #     name : string;
-# #     noise : string;
-# #     color : string;
-# #     extinct : bool;
-# #     ears: int; 
-# # }
-# # func main() : void {
-# #    var pig : animal;
-# #    pig = new animal;
-# #    pig.tail = true;
-# # }
-# #     """
-    
-# #     test_incorrect_return_1 = """
-# #         func main() : void {
-# #   print(foo());
-# #   print(bar());
-# # }
-
-# # func foo() : int {
-# #   return "string"; /* returns 0 */
-# # }
-
-# # func bar() : bool {
-# #   print("bar");
-# # }  /* returns false*/
-    
-# #     """
-    
-    
-# #     test_invalid_coerce = """
-    
-# #     struct animal {
-# #     name : string;
-# #     noise : string;
-# #     color : string;
-# #     extinct : bool;
-# #     ears: int; 
-# # }
-# # func main() : void {
-# #    var pig : animal;
-# #    var extinct : bool;
-# #    extinct = make_pig(pig, false);
-# #    print(extinct);
-# # }
-# # func make_pig(a : animal, extinct : int) : bool{
-# #   if (a == nil){
-# #     print("making a pig");
-# #     a = new animal;
-# #   }
-# #   a.extinct = extinct;
-# #   return a.extinct;
-# # }
-    
-# #     """
-    
-# #     test_invalid_param_type = """
-# #     func foo(a:invinal) : int {
-# #         print("i shouldn't print");
-# #     }
-# #     func main() : void {
-# #         print("i shouldn't print either");
-# #     }
-# #     """
-    
-# #     test_invalid_param = """
-# #     struct animal {
-# #         name : string;
-# #         noise : string;
-# #         color : string;
-# #         extinct : bool;
-# #         ears: int; 
-# #     }
-# #     struct person {
-# #         name: string;
-# #         height: int;
-# #     }
-# #     func main() : void {
-# #         var pig : animal;
-# #         var p : person;
-# #         var noise : string;
-# #         noise = make_pig(p, "oink");
-# #         print(noise);
-# #     }
-# #     func make_pig(a : animal, noise : string) : string{
-# #         if (a == nil){
-# #             print("making a pig");
-# #             a = new animal;
-# #         }
-# #         a.noise = noise;
-# #         return a.noise;
-# #     }
-# #     """
-    
-# #     test_invalid_ret_type = """
-# #     func foo(a: int) : invalidint {
-# #         print("i shouldn't print");
-# #         }
-# #     func main() : void {
-# #     print("i shouldn't print either");
-# #     }
-    
-    
-# #     """
-    
-# #     test_invalid_type1 = """
-# #     func main() : void {
-# #         print("i should print");
-# #         var x : invalid;
-# #     }
-# #     """
-    
-#     test_nil_ret_invalid = """
-#     func incorrect() : nil {
-#         print(nil);
-#     }
-#     func main() : void{
-#         print("hi");
-#         incorrect();
-#     }
-#     """
-    
-#     test_nil3 = """
-#     func incorrect() : int{
-#         var x : int;
-#     }
-#     func main() : void{
-#         print("hi");
-#         incorrect();
-#         var x : int;
-#         x = nil;
-#         print(x);
-#     }
-    
-#     """
-    
-#     test_undefined_param_type = """
-    
-#     func foo(a) : int {
-#   print("i shouldn't print");
-# }
-# func main() : void {
-#  print("i shouldn't print either");
-# }
-
-    
-#     """
-    
-#     test_undefined_ret_type = """
-#         func foo(a) {
-#         print("i shouldn't print");
-#         }
-#         func main() : void {
-#         print("i shouldn't print either");
-#         }
-#     """
-    
-#     test_undefined_struct = """
-#     struct dog {
-#         name: string;
-#         vaccinated: bool;  
-#     }
-
-#     func main() : void {
-#         var d: cat;
-#         print("i shouldn't print");
-#     } 
-#     """
-    
-#     test_unknown_type_1 = """
-#         func main() : void {
-#  print("i should print");
-#  var x;
-# }
-    
-#     """
-    
-#     test_random_spec = """
-#     struct A {
-#         x: int;
-#     }
-#     struct B {
-#         x: int;
-#     }
-
-#     func main(): void {
-#         var a: A;
-#         var b: B;
-#         a = getAnil();
-#         b = getBnil();
-#         print(a);
-#         print(b);
-#         print("fine so far");
-#         return;
-#     }
-
-#     func getAnil() : A {
-#         return nil;
-#     }
-
-#     func getBnil() : B {
-#         return nil;
-#     }
-#     struct A {
-#         x: int;
-#     }
-#     struct B {
-#         x: int;
-#     }
-
-#     func main(): void {
-#         var a: A;
-#         var b: B;
-#         a = getAnil();
-#         b = getBnil();
-#         print(a);
-#         print(b);
-#         print("fine so far");
-#         return;
-#     }
-
-#     func getAnil() : A {
-#         return nil;
-#     }
-
-#     func getBnil() : B {
-#         return nil;
-#     }
+        # the first operand has to be a bool before the second one is even evaluated
+        if type(operand1_value) is not bool:
+            self._type_error()
+        # short circuiting: false && anything is false so the second operand is never evaluated
+        if operand1_value is False:
+            return False
         
-#     """
-    
-
-    
-#     test_random_spec = """
-    
-#     struct A {
-#         x: int;
-#     }
-#     struct B {
-#         x: int;
-#     }
-
-#     func main(): void {
-#         var a: A;
-#         var b: B;
-#         a = getAnil();
-#         b = getBnil();
-#         print(a);
-#         print(b);
-#         print("fine so far");
-#         return;
-#     }
-
-#     func getAnil() : A {
-#         return nil;
-#     }
-
-#     func getBnil() : B {
-#         return nil;
-#     }
+        operand2_value = self.do_evaluate_expression(operand2)
+        if type(operand2_value) is int:
+            operand2_value = operand2_value != 0  
         
-#     """
-    
-#     test_random_spec2 = """
-#         struct A {
-#             x: int;
-#         }
-#         struct B {
-#             x: int;
-#         }
         
-#         func main(): void {
-#             getA();
-#             return;
-#         }
-
-#         func getA() : A {
-#             var b: B;
-#             b = nil;
-#             return b;
-#         }
-#     """
-    
-#     test_jenn = """
-#     struct Dog {
-#   name : string;
-#   alive : bool;
-#   age: int; 
-# }
-
-# func main() : void {
-#   var koda: Dog;
-#   var kippy: Dog;
-#   koda = new Dog;
-#   if(kippy != koda){ 
-#     print("Checking"); 
-#   }
-# }
-    
-    
-#     """
-    
-#     test_default_return = """
-#         func main() : void { print(foo()); print(bar());
-# }
-# func foo() : int { return; /* returns 0 */
-# }
-# func bar() : bool { print("bar");
-# }  /* returns false*/
-#     """
-    
-#     test_spec_coercio = """
-#         func main() : void { print(5 || false); var a:int;
-# a = 1;
-# if (a) {
-# print("if works on integers now!");
-# }
-# foo(a-1); }
-# func foo(b : bool) : void { print(b);
-# }
-    
-#     """
-    
-#     test_cmp_void3 = """
-#         func main() : void {
-#   var b: bool;
-#   b = foo() == nil;
-# }
-
-# func foo() : void {
-#   var a: int;
-# }
-
-    
-    
-# #     """
-
-# def main():
-    
-#     test_expr3 = """
-#     func main(): void {
-#         var a: bool;
-#         a = !5;
-#         print(a);
-#     }
-#     """
-    
-#     test_bad_nonstruct_access = """
-#     struct p {
-#         a:int;
-#     }
-
-#     func main(): void {
-#         var x: int;
-#         print(x.b);
-#     }
-            
-#     """
-    
-#     test_bad_nonstruct_access2 = """
-#     struct p {
-#         a:int;
-#     }
-
-#     struct b {
-#         asdf: int;
-#     }
-
-#     func main(): void {
-#         var x: int;
-#         x.b.a = 2;
-#     }
-#     """
-
-
-
-
-# def main():
-    
-#     test_bad_struct_compare = """
-#         struct circle{
-#             r: int;
-#         }
-
-#         struct square{
-#             s: int;
-#         }
-
-#         func main(): void{
-#             var c: circle;
-#             var s: square;
-#             s = new square;
-#             c = new circle;
-#             print(c == s);
-#         }
-    
-#     """
-
-
-
-
-
-# def main():
-    
-#     test_coerce6= """
-#     struct Dog {
-#         name: string;
-#         vaccinated: bool;
-#     }
-
-#     func main() : void {
-#         var d: Dog;
-#         d = new Dog;
-#         d.vaccinated = 42;
-#         print(d.vaccinated);
-#     }
-    
-    
-#     """
-    
-#     test_nil = """
-#     struct s {
-#   a:int;
-# }
-
-# func main() : int {
-#   var x: s;
-#   x = new s;
-#   x = nil;
-#   print(x.a);
-# }
-#     """
-    
-#     test_linked_list = """
-#         struct node {
-#     value: int;
-#     next: node;
-# }
-
-# struct list {
-#     head: node;
-# }
-
-# func create_list(): list {
-#     var l: list;
-#     l = new list;
-#     l.head = nil;
-#     return l;
-# }
-
-# func append(l: list, val: int): void {
-#     var new_node: node;
-#     new_node = new node;
-#     new_node.value = val;
-#     new_node.next = nil;
-
-#     if (l.head == nil) {
-#         l.head = new_node;
-#     } else {
-#         var current: node;
-#         for (current = l.head; current.next != nil; current = current.next) {
-#             /* It doesn't work in Barista if it's empty, so this is just a useless line */
-#             print("placeholder");
-#         }
-#         current.next = new_node;
-#     }
-#     return;
-# }
-
-# func print_list(l: list): void {
-#     var current: node;
-
-#     if (l.head == nil) {
-#         print("List is empty.");
-#         return;
-#     }
-
-#     for (current = l.head; current != nil; current = current.next) {
-#         print(current.value);
-#     }
-#     return;
-# }
-
-# func main(): void {
-#     var l: list;
-#     l = create_list();
-
-#     append(l, 10);
-#     append(l, 20);
-#     append(l, 30);
-
-#     print("Printing the list:");
-#     print_list(l);
-
-#     return;
-# }
-#     """
-    
-    
-#     test_jennifer = """
-#         struct Dog {
-#   name : string;
-#   alive : bool;
-#   age: int; 
-# }
-
-# func main() : void {
-#   var koda: Dog;
-#   var kippy: Dog;
-#   koda = new Dog;
-#   if(kippy != koda){ 
-#     print("Checking"); 
-#   }
-# }
-#     """
-    
-#     test_compare_not = """
-#         struct circle{
-#   r: int;
-# }
-
-# struct square {
-#   s: int;
-# }
-
-
-# func main(): void{
-#   var c: circle;
-#   var s: square;
-
-#   s = new square;
-#   c = new circle;
-#   print(c != s);
-# }
-#     """
-
-#     test_mario = """
-#       struct A {x: 
-#       int;}
-# struct B {x: 
-# int;}
-
-# func main(): void {
-#   getA();
-#   return;
-# }
-
-# func getA() : A {
-#   var b: B;
-#   b = nil;
-#   return b;
-# }
-    
-#     """
-    
-#     test_operand_on_struct = """
-#     struct A {
-#         x: int;
-#       }
-      
-#     func main(): void {
-#         getA();
-#     return;
-#     }
-    
-    
-#     """
-
-
-
-
-# def main():
-    
-    
-#     test_type_coercion = """
-#         func main() : void {
-#     print(5 == true);  
-#     print(0 == false);
-#     print(-1 == true);  
-#     print(true != 0);  
-# }
-#     """
-    
-#     test_nill = """
-#     struct Box {
-#     weight: int;
-# }
-
-# func main() : void {
-#     var b: Box;
-#     b = new Box;  
-#     print(b == nil);  
-#     print(b != nil);  
-# } 
-#     """
-    
-#     test_field = """
-#     struct Engine {
-#         horsepower: int;
-#     }
-
-#     struct Car {
-#         make: string;
-#         engine: Engine;
-#     }
-
-#     func main() : void {
-#         var car: Car;
-#         car = new Car;
-#         car.engine = new Engine; 
-#         print(car.engine == nil);
-#     }
-#     """
-    
-#     test_nested_struct_referece_compaarison = """
-#     struct Engine {
-#         horsepower: int;
-#     }
-
-#     struct Car {
-#         engine: Engine;
-#     }
-
-#     func main() : void {
-#         var car1: Car;
-#         var car2: Car;
-#         car1 = new Car;
-#         car1.engine = new Engine;
-#         car2 = new Car;
-#         car2.engine = car1.engine;  
-#         print(car1.engine != car2.engine);  
-#     }
-#     """
-    
-#     test_invalid_coercion = """
-#         func main() : void {
-#             print(5 != print("hello"));
-#         }
-#     """
-    
-#     test_cmp_nil = """
-#     func main() : void {
-#          print(5 != nil);
-#     }
-#     """
-    
-    
-    
-    
-#     # Struct Comparison by Reference
-#     test_struct_comparison = """
-#         struct Node {
-#     value: int;
-# }
-
-# func main() : void {
-#     var n1: Node;
-#     var n2: Node;
-#     n1 = new Node;
-#     n2 = new Node;
-#     print(n1 == n2);
-#     n2 = n1;
-#     print(n1 == n2);  
-# }
-#     """
-    
- 
-    
-#     test_ret2 = """
-#         struct A {x: 
-#         int;}
-# struct B {x: 
-# int;}
-
-# func main(): void {
-#   getA();
-#   return;
-# }
-
-# func getA() : A {
-#   var b: B;
-#   b = nil;
-#   return b;
-# }
-#     """
-    
-#     test_struct4 = """
-#     struct a {
-#   inner: a;
-# }
-
-# func main() : void {
-#   var a : a;
-#   print(a.inner);
-# }
-#     """
-    
-#     test_struct_nil = """
-# struct Box {
-#     weight: int;
-# }
-
-# func main() : void {
-#     var b: Box;
-#     print(b == nil);  
-#     print(b != nil); 
-# }
-#     """
-    
-#     test_compare_nill = """
-#         struct Person {
-#     name: string;
-# }
-
-# func main() : void {
-#     var p: Person;
-#     print(p == nil);  
-#     p = new Person;
-#     print(p == nil);  
-# }
-#     """
-    
-    
-        
-#     test_coerce_5 = """
-#     struct Circle {
-#         radius: int;
-#     }
-
-#     func main() : void {
-#         var c: Circle;
-#         c = new Circle;
-#         c.radius = 5;
-#         print(c != 5); 
-#     }
-#     """
-    
-#     test_yolo = """
-# struct Engine {
-#     horsepower: int;
-# }
-
-# struct Car {
-#     make: string;
-#     engine: Engine;
-# }
-
-# func main() : void {
-#     var car: Car;
-#     car = new Car; 
-#     print(car.engine == nil);  
-# }
-    
-#     """
-    
-#     test_int_nil = """
-#         func main() : void {
-#     var x: int;
-#     x = 5;
-#     print(x == nil); 
-# }
-    
-#     """
-    
-#     test_assigned = """
-#         struct Node {
-#     value: int;
-# }
-
-# func main() : void {
-#     var n1: Node;
-#     var n2: Node;
-#     n1 = nil;  
-#     n2 = new Node;  
-#     print(n1 == nil);  
-#     print(n2 == nil); 
-#     print(n1 == n2);  
-# }
-    
-#     """
-    
-#     test_challenge_2 = """
-#     struct node {
-#   value: int;
-#   next: node;
-# }
-
-# func main(): void {
-#   var root: node;
-#   var here: node;
-#   root = new node;
-#   here = root;
-#   root.value = 21;
-#   var i: int;
-#   for (i = 20; i; i = i - 1) {
-#     here = insert_node(here, i);
-#   }
-
-#   for (here = root; here != nil; here = here.next) {
-#     print(here.value);
-#   }
-#   return;
-# }
-
-# func insert_node(nd: node, val: int): node {
-#   var new_nd: node;
-#   new_nd = new node;
-#   new_nd.value = val;
-#   nd.next = new_nd;
-#   return new_nd;
-# }
-    
-    
-#     """
-    
-#     test_strc_cmp4 = """
-#     struct dog {
-#  name : string;
-# }
-# func main() : void {
-#  var a : dog;
-#  var b : dog;
-#  print(a == b);
-# }
-    
-#     """
-    
-#     test_random_coerce = """
-#     func main() : void {
-#         var x: bool;
-#         x = !5;
-#         print(x);
-#     }
-            
-#     """
-    
-#     test_random_nil = """
-#         struct A {
-#             a: int;
-#         }
-
-#         func main(): void {
-#         var a: A;
-#         a = new A;
-#         a = f2();
-#         /* prints nil */
-#         print(a);
-#         }
-
-#         func f2(): A {
-#         return nil;
-#         }
-    
-#     """
-    
-#     test_struct4 = """
-#         struct a {
-#             name : string;
-#         }
-#         struct b {
-#             a: a;
-#         }
-
-#         func main() : void {
-#             var b : int;
-#             b.a.name = "test";
-#         }
-#         """
+        # if both the operands are of type bool
+        if type(operand1_value) is type(operand2_value) is bool:
+            # compare operands
+            return operand1_value and operand2_value
+        else:
+            self._type_error()   
+
+    # or operator
+    def _eval_or(self, expression):
+        # get the two operands
+        operand1 = expression.op1
+        operand2 = expression.op2
+        # get the first operand value
+        operand1_value = self.do_evaluate_expression(operand1)
         
-#     test_mario1 = """
-#         func main() : void {
-#   var vd: bool;
-#   vd = false;
-#   if (true) {
-#     var i: int;
-#     for (i = 0; i - 10; i = i + 1) {
-#       var x: int;
-#       x = i * i - 7 * i + 10;
-#       if (!x) {
-#         vd = x;
-#         print("is zero:    ", i, " -> ", x);
-#       } else {
-#         if (x < 0) {
-#           print("below zero: ", i, " -> ", x);
-#         } else {
-#           print("above zero: ", i, " -> ", x);
-#         }
-#       }
-#     }
-#   }
-# }
-    
-    
-#     """
+        # checking the value of an integer in an and/or expression, e.g., if (int_variable || bool_variable && other_int_variable) { /* do this */ }
+        if type(operand1_value) is int:
+            operand1_value = operand1_value != 0
         
+        # the first operand has to be a bool before the second one is even evaluated
+        if type(operand1_value) is not bool:
+            self._type_error()
+        # short circuiting: true || anything is true so the second operand is never evaluated
+        if operand1_value is True:
+            return True
         
-#     test_mario2 = """
-# func main(): void {
-#     direct_print();
-#     assign_var();
-#     print_rets();
-#     return;
-# }
-
-# func direct_print(): void {
-#   print(-0);
-#   print(-1);
-#   print(!1);
-#   print(!0);
-#   print(!!-1);
-#   print(!!false);
-#   print(!false);
-#   print(!!true);
-#   print(!true);
-# }
-
-# func assign_var() : void {
-#   var i: int;
-#   i = 6;
-#   var b: bool;
-#   b = i;
-#   i = 0;
-#   print(b);
-#   b = -2;
-#   print(b);
-#   b = 1 / 2;
-#   print(b);
-# }
-
-# func print_rets() : void {
-#   print(ret_bool(4));
-#   print(ret_bool(0));
-#   print(ret_bool(-20));
-#   print(impl_ret());
-#   print(!impl_ret());
-# }
-
-# func ret_bool(a: int) : bool {
-#   return a;
-# }
-
-# func impl_ret() : bool {
-#   var a: int;
-# }
-
-# func bool_expr() : bool {
-#   var a: int;
-# }
-    
-
-#     """
-    
-#     test_mario3 = """
-#     func main() : void {
-#         print(1 + print());
-#     }
-
-#     """
-#     test_mario_simple = """
-# struct A {
-#     b: B;
-# }
-
-# struct B {
-#     c: int;
-# }
-
-# func main() : void {
-#     var a: A;
-#     a = new A;
-#     a.b = new B;
-#     print(a.b.c);  
-# }
-#     """
-
-
-
-
-
-
-
-
-# def main():
-
-# #     test_mario_simple = """
-# # struct A {
-# #     b: B;
-# # }
-
-# # struct B {
-# #     c: int;
-# # }
-
-# # func main() : void {
-# #     var a: A;
-# #     a = new A;
-# #     a.b = new B;
-# #     print(a.b.c);  
-# # }
-# #     """
-    
-# # test_struct4 = """
-# #         struct a {
-# #             c : bool
-# #         }
-# #         func test(s : a) : a{
-# #             return s;
-# #         }
-# #         func main(): void {
-# #             var b: a;
-# #             b = new a;
-# #             b.c = false;
-# #             b = test(b);
-# #             print(b.c.a);
-            
-# #         }
-# #     """
-    
-#     test_mario5 = """
-#     struct X {
-#         i: int; 
-#         b: bool; 
-#         s:string;
-#     }
-#     struct Y {
-#         i: int; 
-#         b: bool;
-#         s:string;
-#     }
-#     struct Z {
-#         x: X; 
-#         y: Y; 
-#         z: Z;
-#     }
-
-#     func main(): void {
-#   var v: Z;
-#   v = new Z;
-#   setZ(v, 42, true, "marco");
-#   v.z.z.z.z = nil;
-#   print("v.x.i: ", v.x.i);
-#   print("v.x.b: ", v.x.b);
-#   print("v.x.s: ", v.x.s);
-#   print("v.y.i: ", v.y.i);
-#   print("v.y.b: ", v.y.b);
-#   print("v.y.s: ", v.y.s);
-#   print(v.z.z.z.z.y.b);
-# }
-
-#     func setZ(v: Z, i: int, b: bool, s:string): void {
-#         v.z = v;
-#         v.x = new X;
-#         v.y = new Y;
-#         v.z.z.z.z.z.z.x.i = i;
-#         v.x.b = b;
-#         v.z.z.z.z.x.s = s;
-#         v.z.z.z.z.z.z.y.i = 100 - i;
-#         v.y.b = !b;
-#         v.z.z.z.z.y.s = s + " polo";
-#     }
-#     """
-    
-#     test_validity_nil = """
-#         func main() : void {
-#             var a: string;
-#             a = five();
-#             print("should not print");
-#         }   
-#         func five(): string {
-#             return nil;
-#         }
-#     """
-    
-#     test_dog = """
-#     struct flea {
-#         age: int;
-#         infected : bool;
-#     }
-
-#     struct dog {
-#         name: string;
-#         vaccinated: bool;
-#         companion: flea;
-#     }
-
-# func main() : void {
-#   var d: dog;
-#   d = new dog;   /* sets d object reference to point to a dog structure */
-
-#   print(d.vaccinated); /* prints false - default bool value */
-#   print(d.companion); /* prints nil - default struct object reference */
-
-#   /* we may now set d's fields */
-#   d.name = "Koda";
-#   d.vaccinated = true;
-#   d.companion = new flea;
-#   d.companion.age = 3;
-# }
-#     """
-
-#     test_void_in_expression = """
-#         func main() : void {
-#     var x: int;
-#     x = add(5, 10) + printHello();
-# }
-
-# func add(a: int, b: int) : int {
-#     return a + b;
-# }
-
-# func printHello() : void {
-#     print("Hello, Brewin++!");
-# }
-#     """
-
-#     test_validity_nil = """
-#         func main() : void {
-#   var a: string;
-#   a = five();
-#   print("should not print");
-# }
-
-# func five(): string {
-#   return nil;
-# }
-#     """
-    
-#     test_struct44 = """
-#     struct a {
-#         c : bool;
-#     }
-
-#     func test(s : a) : a {
-#         return s;
-#     }
-#     func main() : void {
-#         var b: a;
-#         b = new a;
-#         b.c = false;
-#         b = test(b);
-#         print(b.c.a);
-#     }
-#     """
-    
-#     test_anoush = """
-#        func main() : void {
-#     print(!1); 
-#     } 
+        operand2_value = self.do_evaluate_expression(operand2)
+        if type(operand2_value) is int:
+            operand2_value = operand2_value != 0  
         
-#     """
-    
-#     test_struc444 = """
-#     struct node {
-#     value: int;
-#     next: node;
-# }
-
-# struct list {
-#     head: node;
-# }
-
-# func create_list(): list {
-#     var l: list;
-#     l = new list;
-#     l.head = nil;
-#     return l;
-# }
-
-# func append(l: list, val: int): void {
-#     var new_node: node;
-#     new_node = new node;
-#     new_node.value = val;
-#     new_node.next = nil;
-
-#     if (l.head == nil) {
-#         l.head = new_node;
-#     } else {
-#         var current: node;
-#         for (current = l.head; current.next != nil; current = current.next) {
-#             /* It doesn't work in Barista if it's empty, so this is just a useless line */
-#             print("placeholder");
-#         }
-#         current.next = new_node;
-#     }
-#     return;
-# }
-
-# func print_list(l: list): void {
-#     var current: node;
-
-#     if (l.head == nil) {
-#         print("List is empty.");
-#         return;
-#     }
-
-#     for (current = l.head; current != nil; current = current.next) {
-#         print(current.value);
-#     }
-#     return;
-# }
-
-# func main(): void {
-#     var l: list;
-#     l = create_list();
-
-#     append(l, 10);
-#     append(l, 20);
-#     append(l, 30);
-
-#     print("Printing the list:");
-#     print_list(l);
-
-#     return;
-# }
-#     """
-    
-#     test_void = """
-#     func main() : void {
-#     printHello();  
-# }
-
-# func printHello() : void {
-#     print("Hello, Brewin++!");
-#     return 42;  
-# }
-    
-#     """
-    
-#     test_void2 = """
-#     func main() : void {
-#     doNothing();  
-# }
-
-#     func doNothing() : void {
-#         return nil;  
-#     }
-    
-#     """
-    
-#     test_void3 = """
-    
-#     func main() : void {
-#     checkSomething();  
-# }
-
-# func checkSomething() : void {
-#     return true;  
-# }
-    
-    
-#     """
-    
-#     test_void4 = """
-#     func main() : void {
-#     sayHello();
-# }
-
-# func sayHello() : void {
-#     print("Hello, Brewin++!");
-#     return;  
-# }
-#     """
-    
-#     test_void5 = """
-#     func test() : void {
-#         return;
-#     }
-#     func main() : void {
-#         print(test());
-#     }
-#     """
-    
-#     test_challenge1 = """
-#         struct list {
-#     val: int;
-#     next: list;
-# }
-
-# func cons(val: int, l: list) : list {
-#     var h: list;
-#     h = new list;
-#     h.val = val;
-#     h.next = l;
-#     return h;
-# }
-
-# func rev_app(l: list, a: list) : list {
-#     if (l == nil) {
-#         return a;
-#     }
-
-#     return rev_app(l.next, cons(l.val, a));
-# }
-
-# func reverse(l: list) : list {
-#     var a: list;
-
-#     return rev_app(l, a);
-# }
-
-# func print_list(l: list): void {
-#     var x: list;
-#     var n: int;
-#     for (x = l; x != nil; x = x.next) {
-#         print(x.val);
-#         n = n + 1;
-#     }
-#     print("N=", n);
-# }
-
-# func main() : void {
-#     var n: int;
-#     var i: int;
-#     var l: list;
-#     var r: list;
-
-#     n = inputi();
-#     for (i = n; i; i = i - 1) {
-#         var n: int;
-#         n = inputi();
-#         l = cons(n, l);
-#     }
-#     r = reverse(l);
-#     print_list(r);
-# }
-
-    
-#     """
-    
-#     test_void5 = """
-#     func test() : void {
-#         return;
-#     }
-#     func main() : void {
-#         print(test());
-#     }
-#     """
-    
-#     test_struct4444 = """
-# struct a {
-#   name : string;
-# }
-# struct b {
-#   a: a;
-# }
-
-# func main() : void {
-#   var b : b;
-#   b = new b;
-#   b.a.name = "test";
-# }
-#     """
-    
-#     interpreter = Interpreter()
-#     interpreter.run(test_struct4444)
-#     # interpreter.run(test_invalid_param)
-#     # interpreter.run(test_nil3)
-#     # interpreter.run(test_unknown_type_1)
-#     #interpreter.run(test_random_spec2)
-
-# if __name__ == "__main__":
-#     main()
-    
-    
-    
-    
-    
-# test Mario testcases 
-# test correctness tests
-    
-# def main():
-    
-#     import os
-#     directory = "/Users/ricardovarelatellez/Downloads/Unit_Tests_V3/tests"
-    
-#     interpreter = Interpreter()
-
-#     # Loop through all files in the specified directory
-#     for filename in sorted(os.listdir(directory)):
-#         file_path = os.path.join(directory, filename)
-#         if os.path.isfile(file_path):
-#             print(f"Processing file: {filename}")
-#             with open(file_path, "r") as file:
-#                 content = file.read()
-#                 # Run the interpreter on the file content
-#                 interpreter.run(content)
-#             print()
-            
-            
-# if __name__ == "__main__":
-#     main()
-
-
-# #tests incorrectness tests Mario
-
-# def main():
-#     import os
-#     directory = "/Users/ricardovarelatellez/Downloads/Unit_Tests_V3/fails"
-    
-#     interpreter = Interpreter()
-
-#     # Loop through all files in the specified directory
-#     for filename in sorted(os.listdir(directory)):
-#         file_path = os.path.join(directory, filename)
-#         if os.path.isfile(file_path):
-#             print(f"Processing file: {filename}")
-#             with open(file_path, "r") as file:
-#                 content = file.read()
-#                 try:
-#                     # Run the interpreter on the file content
-#                     interpreter.run(content)
-#                 except Exception as e:
-#                     # Log the error and continue with the next file
-#                     print(f"Error processing file {filename}: {e}")
-#             print()
-
-# if __name__ == "__main__":
-#     main()
-    
-    
-
-    
-    
-    
-# test correctness tests
-    
-# def main():
-    
-#     import os
-#     directory = "/Users/ricardovarelatellez/Downloads/v3/tests"
-    
-#     interpreter = Interpreter()
-
-#     # Loop through all files in the specified directory
-#     for filename in sorted(os.listdir(directory)):
-#         file_path = os.path.join(directory, filename)
-#         if os.path.isfile(file_path):
-#             print(f"Processing file: {filename}")
-#             with open(file_path, "r") as file:
-#                 content = file.read()
-#                 # Run the interpreter on the file content
-#                 interpreter.run(content)
-#             print()
-            
-            
-# if __name__ == "__main__":
-#     main()
-    
-    
-# tests incorrectness tests
-
-# def main():
-#     import os
-#     directory = "/Users/ricardovarelatellez/Downloads/v3/fails"
-    
-#     interpreter = Interpreter()
-
-#     # Loop through all files in the specified directory
-#     for filename in sorted(os.listdir(directory)):
-#         file_path = os.path.join(directory, filename)
-#         if os.path.isfile(file_path):
-#             print(f"Processing file: {filename}")
-#             with open(file_path, "r") as file:
-#                 content = file.read()
-#                 try:
-#                     # Run the interpreter on the file content
-#                     interpreter.run(content)
-#                 except Exception as e:
-#                     # Log the error and continue with the next file
-#                     print(f"Error processing file {filename}: {e}")
-#             print()
-
-# if __name__ == "__main__":
-#     main()
-
-
-
-
-
-
-# Test testcases toShare
-
-
-# def main():
-    
-#     import os
-#     directory = "/Users/ricardovarelatellez/Downloads/testcasesTOSHARE"
-    
-#     interpreter = Interpreter()
-
-#     # Loop through all files in the specified directory
-#     for filename in sorted(os.listdir(directory)):
-#         file_path = os.path.join(directory, filename)
-#         if os.path.isfile(file_path):
-#             print(f"Processing file: {filename}")
-#             with open(file_path, "r") as file:
-#                 content = file.read()
-#                 try:
-#                     # Run the interpreter on the file content
-#                     interpreter.run(content)
-#                 except Exception as e:
-#                     # Log the error and continue with the next file
-#                     print(f"Error processing file {filename}: {e}")
-#             print()
-
-# if __name__ == "__main__":
-#     main()
-
-
-#test correctness 200
-
-# def main():
-
-#     import os
-#     directory = "/Users/ricardovarelatellez/Downloads/200-test/tests"
-    
-#     interpreter = Interpreter()
-
-#     # Loop through all files in the specified directory
-#     for filename in sorted(os.listdir(directory)):
-#         file_path = os.path.join(directory, filename)
-#         if os.path.isfile(file_path):
-#             print(f"Processing file: {filename}")
-#             with open(file_path, "r") as file:
-#                 content = file.read()
-#                 # Run the interpreter on the file content
-#                 interpreter.run(content)
-#             print()
-            
-            
-# if __name__ == "__main__":
-#     main()
-
-
-#tests incorrectness 200
-
-# def main():
-#     import os
-#     directory = "/Users/ricardovarelatellez/Downloads/200-test/fails"
-    
-#     interpreter = Interpreter()
-
-#     # Loop through all files in the specified directory
-#     for filename in sorted(os.listdir(directory)):
-#         file_path = os.path.join(directory, filename)
-#         if os.path.isfile(file_path):
-#             print(f"Processing file: {filename}")
-#             with open(file_path, "r") as file:
-#                 content = file.read()
-#                 try:
-#                     # Run the interpreter on the file content
-#                     interpreter.run(content)
-#                 except Exception as e:
-#                     # Log the error and continue with the next file
-#                     print(f"Error processing file {filename}: {e}")
-#             print()
-
-# if __name__ == "__main__":
-#     main()
-
-
-
-
-
-
-
-# def main():
-
-#     # test coer6 
-#     test_corece6 = """
-#     func check_flag(flag: bool) : void {
-#         print(flag);
-#     }
-
-#     func main() : void {
-#         var n: int;
-
-#         n = 10;
-#         check_flag(n);
-
-#         n = 0;
-#         check_flag(n);
-#     }
-#     """
-    
-#     test_easy = """
-#         func check_flag(flag: int) : void {
-#         print(flag);
-#     }
-
-#     func main() : void {
-#         var n: int;
-#         n = 10;
-#     }
-    
-#     """
-    
-#     test_ret0 = """
-#     func main(): void {
-#         print("a");
-#         return;
-#         print("b");
-# }
-#     """
-
-
-#     test_struct2 = """
-# struct person {
-#     name: string;
-# }
-
-# func main() : void {
-#     var p: person;
-#     p = new person;
-#     print(p.age);
-# }
-    
-#     """
-    
-    
-#     test_struct5 = """
-    
-# struct x {
-#     val:int;
-# }
-
-# struct y {
-#     val:int;
-# }
-
-# func main() : void {
-#     var a: x;
-#     var b: y;
-#     a = new y;
-# }
-    
-    
-#     """
-    
-#     test_no_main = """
-# func Main(): void {
-#   var a: int;
-#   a = 5 + 10;
-#   print(a);  
-# }
-# """
-    
-#     test_ret0 = """
-#     func main(): void {
-#         print("a");
-#         return;
-#         print("b");
-# }
-#     """
-    
-#     test_paul = """
-#     func main() : void {
-#         var a : int;
-#         print(a.b);
-# }
-#     """
-    
-#     test_paul2 = """
-    
-#     func main() : void {
-#         var a : int;
-#     a.b = 5;
-# }
-#     """
-    
-# # test_hello = """
-# #     func main() : void{
-# #         print("hello");
-# #         }
-# #     """
-
-#     test_ret0 = """
-#     func main(): void {
-#         print("a");
-#         return;
-#         print("b");
-# }
-#     """
-    
-#     test_chall2 = """
-#         struct node {
-#     value: int;
-#     next: node;
-# }
-
-# struct list {
-#     head: node;
-# }
-
-# func create_list(): list {
-#     var l: list;
-#     l = new list;
-#     l.head = nil;
-#     return l;
-# }
-
-# func append(l: list, val: int): void {
-#     var new_node: node;
-#     new_node = new node;
-#     new_node.value = val;
-#     new_node.next = nil;
-
-#     if (l.head == nil) {
-#         l.head = new_node;
-#     } else {
-#         var current: node;
-#         for (current = l.head; current.next != nil; current = current.next) {
-#             /* It doesn't work in Barista if it's empty, so this is just a useless line */
-#             print("placeholder");
-#         }
-#         current.next = new_node;
-#     }
-#     return;
-# }
-
-# func print_list(l: list): void {
-#     var current: node;
-
-#     if (l.head == nil) {
-#         print("List is empty.");
-#         return;
-#     }
-
-#     for (current = l.head; current != nil; current = current.next) {
-#         print(current.value);
-#     }
-#     return;
-# }
-
-# func main(): void {
-#     var l: list;
-#     l = create_list();
-
-#     append(l, 10);
-#     append(l, 20);
-#     append(l, 30);
-
-#     print("Printing the list:");
-#     print_list(l);
-
-#     return;
-# }
-    
-#     """
-    
-#     test_connor = """
-#         struct animal {
-# name : string;
-# extinct : bool;
-# ears: int;
-# }
-# func main() : void {
-# var pig : animal;
-# var ret: bool;
-# var hm : animal;
-# ret = is_extinct(pig);
-# print(ret);
-# pig = new animal;
-# pig.extinct = true;
-# ret = is_extinct(pig);
-# print(ret);
-# hm = destroy_animals("pig", pig);
-# print(pig.extinct);
-# print(hm);
-
-# }
-# func is_extinct(p : animal) : bool {
-# if (p == nil){
-# print("i go in here first");
-# return 0;
-# }
-# else{
-# return p.extinct;
-# }
-# }
-# func destroy_animals(name: string, p : animal) : animal{
-# if (p==nil){
-# p = new animal;
-# }
-# name = inputs("What animal do you want to destroy?");
-# p.name = name;
-# p.extinct = true;
-# print("Destroyed animal ", p.name);
-# return nil;
-# }
-#     """
-    
-#     test_ethan = """
-#     struct a {
-#   name : string;
-# }
-# struct b {
-#   a: a;
-# }
-
-# func main() : void {
-#   var b : b;
-#   b = new b;
-#   b.a.name = "test";
-# }
-    
-#     """
-    
-    
-#     test_olive = """
-#     struct node {
-#   value: int;
-#   next: node;
-# }
-
-# func main(): void {
-#   var root: node;
-#   var here: node;
-#   root = new node;
-#   here = root;
-#   root.value = 21;
-#   var i: int;
-#   for (i = 20; i; i = i - 1) {
-#     here = insert_node(here, i);
-#   }
-
-#   for (here = root; here != nil; here = here.next) {
-#     print(here.value);
-#   }
-#   return;
-# }
-
-# func insert_node(nd: node, val: int): node {
-#   var new_nd: node;
-#   new_nd = new node;
-#   new_nd.value = val;
-#   nd.next = new_nd;
-#   return new_nd;
-# }
-    
-#     """
-    
-#     test_call22 = """
-#         struct maybe_int {
-#   present : bool;
-#   val : int;
-# }
-
-# struct tree {
-#   left : tree;
-#   right : tree;
-#   val : maybe_int;
-# }
-
-# func definitely_int(value : int) : maybe_int {
-#   var ret : maybe_int;
-#   ret = new maybe_int;
-#   ret.present = true;
-#   ret.val = value;
-#   return ret;
-# }
-
-# func new_tree() : tree {
-#   var ret : tree;
-#   ret = new tree;
-#   ret.val = new maybe_int;
-#   return ret;
-# }
-
-# func new_tree(root : int) : tree {
-#   var ret : tree;
-#   ret = new tree;
-#   ret.val = definitely_int(root);
-#   return ret;
-# }
-
-# func insert_sorted(root: tree, value : int) : void {
-#   if (!root.val.present) {
-#     root.val = definitely_int(value);
-#   } else {
-#     if (value <= root.val.val) {
-#       if (root.left == nil) {
-#         root.left = new_tree(value);
-#       } else {
-#         insert_sorted(root.left, value);
-#       }
-#     } else {
-#       if (root.right == nil) {
-#         root.right = new_tree(value);
-#       } else {
-#         insert_sorted(root.right, value);
-#       }
-#     }
-#   }
-# }
-
-# func get_size(root : tree) : int {
-#   if (root == nil) {
-#     return 0;
-#   }
-#   var sum : int;
-#   if (root.val.present) {
-#     sum = 1;
-#   }
-#   return sum + get_size(root.left) + get_size(root.right);
-# }
-
-# func get_item(root : tree, index : int) : maybe_int {
-#   var offset : int;
-#   offset = get_size(root.left);
-#   if (index < offset) {
-#     return get_item(root.left, index);
-#   }
-#   if (root.val.present) {
-#     if (index == offset) {
-#       return root.val;
-#     }
-#     offset = offset + 1;
-#   }
-#   if (root.right == nil) {
-#     return new maybe_int;
-#   }
-#   return get_item(root.right, index - offset);
-# }
-
-# func main () : void {
-#   var list : tree;
-#   list = new_tree();
-#   insert_sorted(list, 5);
-#   insert_sorted(list, 1);
-#   insert_sorted(list, 3);
-#   insert_sorted(list, 4);
-#   insert_sorted(list, 11);
-#   insert_sorted(list, 8);
-#   insert_sorted(list, 6);
-
-#   var i : int;
-#   for (i = 0; true; i = i + 1) {
-#     var result : maybe_int;
-#     result = get_item(list, i);
-#     if (!result.present) {
-#       return;
-#     }
-#     print(result.val);
-#   }
-# }
-# """
-    
-#     test_maybe = """
-    
-#     func maybe_return(n: int): int {
-# if (n > 10) {
-# return n;
-# }
-# return nil;
-
-# }
-
-# func main():void{
-# print(maybe_return(5));
-# }
-    
-#     """
-    
-#     test_ret0 = """
-#     func main(): void {
-#         print("a");
-#         return;
-#         print("b");
-# }
-#     """
-    
-#     test_unary = """
-# struct Light {
-#     isOn: bool;
-# }
-
-# func main() : void {
-#     var l: Light;
-#     l = new Light;
-#     l.isOn = true;
-#     print(!l.isOn);  
-# }
-#     """
-    
-#     test_call22 = """
-#         struct maybe_int {
-#   present : bool;
-#   val : int;
-# }
-
-# struct tree {
-#   left : tree;
-#   right : tree;
-#   val : maybe_int;
-# }
-
-# func definitely_int(value : int) : maybe_int {
-#   var ret : maybe_int;
-#   ret = new maybe_int;
-#   ret.present = true;
-#   ret.val = value;
-#   return ret;
-# }
-
-# func new_tree() : tree {
-#   var ret : tree;
-#   ret = new tree;
-#   ret.val = new maybe_int;
-#   return ret;
-# }
-
-# func new_tree(root : int) : tree {
-#   var ret : tree;
-#   ret = new tree;
-#   ret.val = definitely_int(root);
-#   return ret;
-# }
-
-# func insert_sorted(root: tree, value : int) : void {
-#   if (!root.val.present) {
-#     root.val = definitely_int(value);
-#   } else {
-#     if (value <= root.val.val) {
-#       if (root.left == nil) {
-#         root.left = new_tree(value);
-#       } else {
-#         insert_sorted(root.left, value);
-#       }
-#     } else {
-#       if (root.right == nil) {
-#         root.right = new_tree(value);
-#       } else {
-#         insert_sorted(root.right, value);
-#       }
-#     }
-#   }
-# }
-
-# func get_size(root : tree) : int {
-#   if (root == nil) {
-#     return 0;
-#   }
-#   var sum : int;
-#   if (root.val.present) {
-#     sum = 1;
-#   }
-#   return sum + get_size(root.left) + get_size(root.right);
-# }
-
-# func get_item(root : tree, index : int) : maybe_int {
-#   var offset : int;
-#   offset = get_size(root.left);
-#   if (index < offset) {
-#     return get_item(root.left, index);
-#   }
-#   if (root.val.present) {
-#     if (index == offset) {
-#       return root.val;
-#     }
-#     offset = offset + 1;
-#   }
-#   if (root.right == nil) {
-#     return new maybe_int;
-#   }
-#   return get_item(root.right, index - offset);
-# }
-
-# func main () : void {
-#     var list : tree;
-    
-#     var i : int;
-#     for (i = 0; i < 5; i = i + 1) {
-#         var result : maybe_int;
-#         print("HEllo");
-#   }
-# }
-# """
-
-#     interpreter = Interpreter()
-#     interpreter.run(test_call22)
-#     # interpreter.run(test_invalid_param)
-#     # interpreter.run(test_nil3)
-#     # interpreter.run(test_unknown_type_1)
-#     #interpreter.run(test_random_spec2)
-
-# if __name__ == "__main__":
-#     main()
-
-    
-    
\ No newline at end of file
+        # if both the operands are of type bool
+        if type(operand1_value) is type(operand2_value) is bool:
+            # compare operands
+            return operand1_value or operand2_value
+        else:
+            self._type_error()     